@@ -21,8 +21,25 @@
 
 from __future__ import annotations
 
-from molecule.shell import main
+import sys
+
+from molecule.daemon import forward
+
+
+def main(*, standalone_mode: bool = True) -> None:
+    """Run the command line, through ``molecule serve`` when it is running.
+
+    Args:
+        standalone_mode: Passed to click when running in-process.
+    """
+    exit_code = forward(sys.argv[1:])
+    if exit_code is not None:
+        sys.exit(exit_code)
+
+    from molecule.shell import main as cli  # noqa: PLC0415
+
+    cli(standalone_mode=standalone_mode)  # pylint: disable=no-value-for-parameter
 
 
 if __name__ == "__main__":
-    main(standalone_mode=False)  # pylint: disable=no-value-for-parameter
+    main(standalone_mode=False)
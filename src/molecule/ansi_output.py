@@ -18,12 +18,14 @@ already accustomed to Ansible's interface.
 
 from __future__ import annotations
 
-import io
+import collections
 import os
 import re
 import shlex
 import shutil
+import signal
 import sys
+import threading
 
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -34,6 +36,7 @@ from molecule.util import boolean
 
 
 if TYPE_CHECKING:
+    from types import FrameType
     from typing import TextIO
 
     from typing_extensions import Self
@@ -89,6 +92,64 @@ def split_command_to_strings(cmd: str | list[str]) -> list[str]:
     return [str(arg) for arg in cmd]
 
 
+# A leading SGR sequence: a pure reset, a reset ending with a standard color, or any other.
+_LINE_STYLE_RE = re.compile(r"\x1b\[(?:(0m)|0(?=[0-9;]*;3);[0-9;]*(3[0-7])m|([0-9;]*m))")
+_ANSI_SGR_RE = re.compile(r"\x1b\[[0-9;]*m")
+# Characters of ansible output kept by a BorderedStream for getvalue().
+SHADOW_LIMIT = 1 << 20
+
+
+class _TerminalWidth:
+    """Terminal width, looked up again only when the terminal is resized."""
+
+    def __init__(self) -> None:
+        """Initialize an empty cache."""
+        # Width for each value of COLUMNS, which takes precedence over the terminal.
+        self.columns: dict[str | None, int] = {}
+        self.watching = False
+
+    def _watch(self) -> bool:
+        """Clear the cache on SIGWINCH, chaining to any previous handler.
+
+        Returns:
+            Whether resizes are noticed, only possible from the main thread.
+        """
+        if self.watching:
+            return True
+        if (
+            not hasattr(signal, "SIGWINCH")
+            or threading.current_thread() is not threading.main_thread()
+        ):
+            return False
+        previous = signal.getsignal(signal.SIGWINCH)
+
+        def on_resize(signum: int, frame: FrameType | None) -> None:
+            self.columns.clear()
+            if callable(previous):
+                previous(signum, frame)
+
+        signal.signal(signal.SIGWINCH, on_resize)
+        self.watching = True
+        return True
+
+    def __call__(self) -> int:
+        """Return the width of the terminal.
+
+        Returns:
+            The number of columns, as ``shutil.get_terminal_size`` reports it.
+        """
+        key = os.environ.get("COLUMNS")
+        columns = self.columns.get(key)
+        if columns is None:
+            columns = shutil.get_terminal_size().columns
+            if self._watch():
+                self.columns[key] = columns
+        return columns
+
+
+terminal_width = _TerminalWidth()
+
+
 def get_line_style(line: str) -> str:
     """Extract ANSI escape sequences from beginning of line for style preservation.
 
@@ -98,33 +159,28 @@ def get_line_style(line: str) -> str:
     Returns:
         ANSI escape sequence from start of line without reset codes, or empty string if none
     """
-    # Match ANSI escape sequences at the start of the line
-    match = re.match(r"^(\x1b\[[0-9;]*m)", line)
-    if match:
-        escape_seq = match.group(1)
+    match = _LINE_STYLE_RE.match(line) if line.startswith("\x1b") else None
+    if not match:
+        return ""
+    reset, color, other = match.groups()
 
-        # Skip pure reset sequences
-        if escape_seq == "\x1b[0m":
-            return ""
+    # Skip pure reset sequences
+    if reset:
+        return ""
 
-        # Extract color from reset+color sequences (e.g., \x1b[0;32m -> \x1b[32m)
-        # This prevents reset codes from canceling our DIM formatting
-        if ";3" in escape_seq and escape_seq.startswith(("\x1b[0;", "\033[0;")):
-            # Extract just the color part (30-37 for standard colors)
-            color_match = re.search(r"(3[0-7])m", escape_seq)
-            if color_match:
-                color_code = color_match.group(1)
-                # Use \x1b prefix consistently (most common format)
-                return f"\x1b[{color_code}m"
-
-        # Skip other reset sequences (ending with 0m but not just 0m)
-        # Length 5 is minimum for reset+color (\x1b[0m = 5 chars)
-        min_reset_color_length = 5
-        if escape_seq.endswith("0m") and len(escape_seq) > min_reset_color_length:
-            return ""
+    # Extract color from reset+color sequences (e.g., \x1b[0;32m -> \x1b[32m)
+    # This prevents reset codes from canceling our DIM formatting
+    if color:
+        return f"\x1b[{color}m"
 
-        return escape_seq
-    return ""
+    # Skip other reset sequences (ending with 0m but not just 0m)
+    escape_seq = f"\x1b[{other}"
+    # Length 5 is minimum for reset+color (\x1b[0m = 5 chars)
+    min_reset_color_length = 5
+    if escape_seq.endswith("0m") and len(escape_seq) > min_reset_color_length:
+        return ""
+
+    return escape_seq
 
 
 class AnsiOutput:
@@ -389,19 +445,72 @@ class AnsiOutput:
         return state_counts, total_actions
 
 
+class ShadowBuffer:
+    """The most recent text written to a stream, up to a number of characters."""
+
+    def __init__(self, limit: int) -> None:
+        """Initialize an empty buffer.
+
+        Args:
+            limit: Maximum number of characters kept, 0 to keep none.
+        """
+        self.limit = limit
+        self._chunks: collections.deque[str] = collections.deque()
+        self._size = 0
+
+    def write(self, text: str) -> None:
+        """Append text, dropping the oldest text beyond the limit.
+
+        Args:
+            text: Text to append.
+        """
+        if not self.limit:
+            return
+        self._chunks.append(text)
+        self._size += len(text)
+        while self._size > self.limit:
+            excess = self._size - self.limit
+            oldest = self._chunks[0]
+            if len(oldest) <= excess:
+                self._chunks.popleft()
+                self._size -= len(oldest)
+            else:
+                self._chunks[0] = oldest[excess:]
+                self._size -= excess
+
+    def getvalue(self) -> str:
+        """Return the text kept.
+
+        Returns:
+            The kept text.
+        """
+        return "".join(self._chunks)
+
+    def clear(self) -> None:
+        """Drop all text."""
+        self._chunks.clear()
+        self._size = 0
+
+
 class BorderedStream:
     """Stream wrapper that adds border characters to each line."""
 
-    def __init__(self, ansi: AnsiOutput, target_stream: TextIO) -> None:
+    def __init__(
+        self,
+        ansi: AnsiOutput,
+        target_stream: TextIO,
+        shadow_limit: int = SHADOW_LIMIT,
+    ) -> None:
         """Initialize stream wrapper.
 
         Args:
             ansi: AnsiOutput instance for markup processing
             target_stream: Actual stream to write to
+            shadow_limit: Characters of the written text kept for getvalue, 0 to keep none
         """
         self.ansi = ansi
         self.target_stream = target_stream
-        self.buffer = io.StringIO()
+        self.buffer = ShadowBuffer(shadow_limit)
         self.partial_line = ""  # Track partial lines for proper concatenation
 
     def write(self, text: str) -> int:
@@ -422,8 +531,7 @@ class BorderedStream:
         lines = remaining.split("\n")
 
         border_prefix_width = len("  │ ")
-        terminal_width = shutil.get_terminal_size().columns
-        first_line_width = terminal_width - border_prefix_width
+        first_line_width = terminal_width() - border_prefix_width
         continuation_width = first_line_width - 2
 
         for line in lines[:-1]:
@@ -459,7 +567,7 @@ class BorderedStream:
             continuation_width: Max width for continuation segments.
         """
         original_style = get_line_style(line)
-        clean_line = re.sub(r"\x1b\[[0-9;]*m", "", line)
+        clean_line = _ANSI_SGR_RE.sub("", line)
         wrapped_lines = self._split_to_width(clean_line, first_line_width, continuation_width)
 
         styled_prefix = f"{A.DIM}{original_style}{A.BOX_VERTICAL}{A.RESET} "
@@ -511,7 +619,7 @@ class BorderedStream:
             self.partial_line = ""
 
         # Clear the buffer after flushing
-        self.buffer = io.StringIO()
+        self.buffer.clear()
         self.target_stream.flush()
 
     def getvalue(self) -> str:
@@ -615,8 +723,9 @@ class CommandBorders:
         self.runtime_stdout = sys.stdout
         self.runtime_stderr = sys.stderr
         self.original_stderr = original_stderr  # Store for header/footer printing
-        self.stdout_capture = BorderedStream(self.ansi, original_stderr)  # Send stdout to stderr
-        self.stderr_capture = BorderedStream(self.ansi, original_stderr)  # Keep stderr to stderr
+        # Send stdout to stderr, keep stderr to stderr; nothing reads their shadow buffers.
+        self.stdout_capture = BorderedStream(self.ansi, original_stderr, shadow_limit=0)
+        self.stderr_capture = BorderedStream(self.ansi, original_stderr, shadow_limit=0)
         self._print_header_and_command(cmd)
         sys.stdout = self.stdout_capture
         sys.stderr = self.stderr_capture
@@ -658,9 +767,7 @@ class CommandBorders:
             return [""]
 
         decor = len("  | ")
-        effective_width = (
-            shutil.get_terminal_size().columns - decor if max_width is None else max_width - decor
-        )
+        effective_width = terminal_width() - decor if max_width is None else max_width - decor
 
         lines = self._group_command_parts(parts)
         return self._wrap_lines(lines, effective_width)
@@ -2,27 +2,36 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
-import traceback
+import os
+import sys
 
-from collections import OrderedDict
-from typing import TYPE_CHECKING
-
-import pluggy
-
-from ansible_compat.ports import cache
+from collections.abc import Iterator, Mapping
+from functools import cache
+from importlib.metadata import EntryPoint, entry_points
+from pathlib import Path
+from typing import TYPE_CHECKING, Generic, TypeVar, cast
 
+from molecule import util
 from molecule.driver.base import Driver
-from molecule.exceptions import MoleculeError
 from molecule.verifier.base import Verifier
 
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, ItemsView, ValuesView
+
     from molecule.config import Config
 
 
 LOG = logging.getLogger(__name__)
 
+PLUGIN_GROUPS = ("molecule.driver", "molecule.verifier")
+# Bumped when the layout or meaning of the plugin index changes.
+PLUGIN_INDEX_FORMAT = 3
+T = TypeVar("T")
+
 
 class MoleculeRuntimeWarning(RuntimeWarning):
     """A runtime warning used by Molecule and its plugins."""
@@ -32,67 +41,197 @@ class IncompatibleMoleculeRuntimeWarning(MoleculeRuntimeWarning):
     """A warning noting an unsupported runtime environment."""
 
 
+def _plugin_index_file() -> Path:
+    """Location of the on-disk plugin entry point index.
+
+    Returns:
+        Path to the index file in the user cache directory.
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "molecule" / "plugin-index.json"
+
+
+def _site_packages_digest() -> str:
+    """Digest the interpreter and the state of every import path entry.
+
+    Installing or removing a distribution adds or removes its metadata
+    directory, which changes the mtime of the path entry holding it.
+
+    Returns:
+        A hex digest identifying the set of installed distributions.
+    """
+    digest = hashlib.sha256(sys.executable.encode())
+    for entry in sys.path:
+        if not entry:
+            continue
+        try:
+            mtime = Path(entry).stat().st_mtime_ns
+        except OSError:
+            mtime = 0
+        digest.update(f"{entry}:{mtime}\0".encode())
+    return digest.hexdigest()
+
+
 @cache
-def drivers(config: Config | None = None) -> dict[str, Driver]:
-    """Return list of active drivers.
+def _entry_points(group: str) -> dict[str, str]:
+    """Return the plugin entry points of a group, as ``name: value``.
+
+    Scanning the metadata of every installed distribution is slow, so the
+    result for all plugin groups is kept in an on-disk index keyed by
+    :func:`_site_packages_digest` and only rebuilt when the installed
+    distributions change. No plugin is imported to build it.
 
     Args:
-        config: plugin config
+        group: Entry point group name.
 
     Returns:
-        A dictionary of active drivers by name.
+        A dict mapping entry point names to their ``module:attr`` values.
     """
-    plugins = OrderedDict()
-    pm = pluggy.PluginManager("molecule.driver")
+    index_file = _plugin_index_file()
+    key = _site_packages_digest()
+    try:
+        index = json.loads(index_file.read_text(encoding="utf-8"))
+        if index["key"] == key and index["format"] == PLUGIN_INDEX_FORMAT:
+            return dict(index["groups"].get(group, {}))
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    groups: dict[str, dict[str, str]] = {}
+    for plugin_group in PLUGIN_GROUPS:
+        eps = groups.setdefault(plugin_group, {})
+        for ep in entry_points(group=plugin_group):
+            # Like pluggy, the first distribution on the path wins.
+            eps.setdefault(ep.name, ep.value)
     try:
-        pm.load_setuptools_entrypoints("molecule.driver")
-    except MoleculeError:
-        # These are not fatal because a broken driver should not make the entire
-        # tool unusable.
-        LOG.error("Failed to load driver entry point %s", traceback.format_exc())  # noqa: TRY400
-    for plugin in pm.get_plugins():
-        if issubclass(plugin, Driver):
-            try:
-                driver = plugin(config)
-                plugins[driver.name] = driver
-            except (MoleculeError, TypeError):
-                LOG.exception(
-                    "Failed to load %s driver",
-                    pm.get_name(plugin),
-                )
+        index_file.parent.mkdir(parents=True, exist_ok=True)
+        util.atomic_write_file(
+            index_file,
+            json.dumps({"key": key, "format": PLUGIN_INDEX_FORMAT, "groups": groups}),
+            header="",
+        )
+    except OSError as exc:
+        LOG.debug("Unable to write plugin index %s: %s", index_file, exc)
+    return dict(groups.get(group, {}))
+
+
+class _Plugins(Mapping[str, T], Generic[T]):
+    """Plugins of one entry point group, imported on first use by name.
+
+    Plugins are keyed by their entry point names, read from the entry point
+    index, so listing the available plugins does not import any of them.
+    Once loaded, a plugin is keyed by the name it declares instead, and
+    looking up a name no entry point has loads every plugin to find it. A
+    plugin that fails to load is logged and dropped, after which it behaves
+    as if it was not installed.
+    """
+
+    def __init__(self, group: str, base: type, config: Config | None) -> None:
+        self._group = group
+        self._base = base
+        self._config = config
+        self._entry_points = dict(_entry_points(group))
+        self._loaded: dict[str, T] = {}
+
+    def __getitem__(self, name: str) -> T:
+        if name in self._loaded:
+            return self._loaded[name]
+        if name in self:
+            plugin = self._load(name)
         else:
-            msg = f"Skipped loading plugin class {plugin} because is not a subclass of Driver."
-            LOG.error(msg)
+            self._load_all()
+            plugin = self._loaded.get(name)
+        if plugin is None:
+            raise KeyError(name)
+        return plugin
 
-    return plugins
+    def __contains__(self, name: object) -> bool:
+        return name in self._entry_points
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._entry_points))
+
+    def __len__(self) -> int:
+        return len(self._entry_points)
+
+    def values(self) -> ValuesView[T]:
+        self._load_all()
+        return super().values()
+
+    def items(self) -> ItemsView[str, T]:
+        self._load_all()
+        return super().items()
+
+    def _load_all(self) -> None:
+        for name in list(self):
+            if name not in self._loaded and name in self._entry_points:
+                self._load(name)
+
+    def _load(self, name: str) -> T | None:
+        kind = self._group.rsplit(".", maxsplit=1)[-1]
+        value = self._entry_points[name]
+        try:
+            plugin_class = EntryPoint(name, value, self._group).load()
+        except Exception:
+            # These are not fatal because a broken plugin should not make the entire
+            # tool unusable.
+            LOG.exception("Failed to load %s entry point %s", kind, name)
+            del self._entry_points[name]
+            return None
+        if not isinstance(plugin_class, type) or not issubclass(plugin_class, self._base):
+            LOG.error(
+                "Skipped loading plugin class %s because is not a subclass of %s.",
+                plugin_class,
+                self._base.__name__,
+            )
+            del self._entry_points[name]
+            return None
+        factory = cast("Callable[[Config | None], T]", plugin_class)
+        try:
+            plugin = factory(self._config)
+            declared = getattr(plugin, "name", name)
+        except Exception:
+            LOG.exception("Failed to load %s %s", name, kind)
+            del self._entry_points[name]
+            return None
+        # Plugins are registered under the name they declare, unless another
+        # entry point already has it.
+        key = declared if isinstance(declared, str) and declared not in self else name
+        del self._entry_points[name]
+        self._entry_points[key] = value
+        self._loaded[key] = plugin
+        return plugin
 
 
 @cache
-def verifiers(config: Config | None = None) -> dict[str, Verifier]:
-    """Return list of active verifiers.
+def drivers(config: Config | None = None) -> Mapping[str, Driver]:
+    """Return active drivers.
+
+    Driver classes are imported lazily, the first time a driver is accessed
+    by name or when all drivers are enumerated with ``values()``/``items()``.
 
     Args:
         config: plugin config
 
     Returns:
-        A dictionary of active verifiers by name.
+        A mapping of active drivers by name.
     """
-    plugins = OrderedDict()
-    pm = pluggy.PluginManager("molecule.verifier")
-    try:
-        pm.load_setuptools_entrypoints("molecule.verifier")
-    except Exception:  # noqa: BLE001
-        # These are not fatal because a broken verifier should not make the entire
-        # tool unusable.
-        LOG.error("Failed to load verifier entry point %s", traceback.format_exc())  # noqa: TRY400
-    for plugin_class in pm.get_plugins():
-        try:
-            if issubclass(plugin_class, Verifier):
-                plugin = plugin_class(config)
-                plugins[plugin.name] = plugin
-        except Exception:  # noqa: PERF203
-            LOG.exception("Failed to load %s verifier", plugin_class.__name__)
-    return plugins
+    return _Plugins[Driver]("molecule.driver", Driver, config)
+
+
+@cache
+def verifiers(config: Config | None = None) -> Mapping[str, Verifier]:
+    """Return active verifiers.
+
+    Verifier classes are imported lazily, the first time a verifier is
+    accessed by name or when all verifiers are enumerated.
+
+    Args:
+        config: plugin config
+
+    Returns:
+        A mapping of active verifiers by name.
+    """
+    return _Plugins[Verifier]("molecule.verifier", Verifier, config)
 
 
 __all__ = (
@@ -11,9 +11,10 @@ from typing import TYPE_CHECKING
 
 from ansible_compat.runtime import Runtime
 
-from molecule import util
-from molecule.ansi_output import CommandBorders
-from molecule.console import original_stderr
+from molecule import logger, util
+from molecule.ansi_output import CommandBorders, should_do_markup, write_bordered_block
+from molecule.console import original_stderr, original_stdout
+from molecule.constants import ANSICodes as A
 from molecule.util import print_environment_vars
 
 
@@ -43,6 +44,7 @@ class App:
         quiet: bool = False,
         check: bool = False,
         command_borders: bool = False,
+        capture: bool = False,
     ) -> CompletedProcess[str]:
         """Execute the given command and returns None.
 
@@ -55,6 +57,8 @@ class App:
             quiet: An optional bool to toggle command output.
             check: An optional bool to toggle command error checking.
             command_borders: An optional bool to enable borders around command output.
+            capture: Capture the output instead of printing it, for commands
+                running concurrently. Print it afterwards with :meth:`write_output`.
 
         Returns:
             A completed process object.
@@ -63,13 +67,15 @@ class App:
             CalledProcessError: If return code is nonzero and check is True.
         """
         del echo, quiet
+        # Batched log lines go out before the command writes to the terminal.
+        logger.flush_console_handlers()
         if debug:
             print_environment_vars(env)
 
-        quiet_ansible = os.environ.get("MOLECULE_QUIET_ANSIBLE", "") == "1"
+        quiet_ansible = _quiet_ansible()
 
         borders = None
-        if command_borders and not quiet_ansible:
+        if command_borders and not quiet_ansible and not capture:
             borders = CommandBorders(
                 cmd=cmd,
                 original_stderr=original_stderr,
@@ -81,7 +87,7 @@ class App:
             args=cmd,
             env=env,
             cwd=cwd,
-            tee=not quiet_ansible,
+            tee=not quiet_ansible and not capture,
             set_acp=False,
         )
 
@@ -97,6 +103,50 @@ class App:
             )
         return result
 
+    @staticmethod
+    def write_output(
+        output: str,
+        *,
+        title: str = "",
+        returncode: int = 0,
+        command_borders: bool = False,
+    ) -> None:
+        """Print the output of a command run with ``capture``.
+
+        The output goes where :meth:`run_command` would have printed it, and is
+        dropped when ``MOLECULE_QUIET_ANSIBLE`` is set.
+
+        Args:
+            output: Captured output of the command.
+            title: Title of the borders.
+            returncode: Return code of the command.
+            command_borders: Whether to print borders around the output.
+        """
+        if _quiet_ansible():
+            return
+        logger.flush_console_handlers()
+        if command_borders and should_do_markup():
+            write_bordered_block(
+                stream=original_stderr,
+                content=output,
+                title=title,
+                footer_text=f"Return code: {returncode}",
+                color=A.GREEN if returncode == 0 else A.RED,
+            )
+            original_stderr.flush()
+            return
+        original_stdout.write(output)
+        original_stdout.flush()
+
+
+def _quiet_ansible() -> bool:
+    """Whether command output is kept off the terminal.
+
+    Returns:
+        True if ``MOLECULE_QUIET_ANSIBLE`` is set.
+    """
+    return os.environ.get("MOLECULE_QUIET_ANSIBLE", "") == "1"
+
 
 @lru_cache
 def get_app(path: Path) -> App:
@@ -8,6 +8,7 @@ It also contains Click-specific decorators and utilities.
 from __future__ import annotations
 
 import functools
+import importlib
 import logging
 import os
 
@@ -16,11 +17,16 @@ from typing import TYPE_CHECKING, Any, NoReturn, cast
 
 import click
 
+from click.shell_completion import CompletionItem
+
 from molecule import util
 from molecule.ansi_output import should_do_markup
 from molecule.api import drivers
-from molecule.config import MOLECULE_PARALLEL
-from molecule.constants import MOLECULE_DEFAULT_SCENARIO_NAME, MOLECULE_PLATFORM_NAME
+from molecule.constants import (
+    MOLECULE_DEFAULT_SCENARIO_NAME,
+    MOLECULE_PARALLEL,
+    MOLECULE_PLATFORM_NAME,
+)
 from molecule.exceptions import ImmediateExit, MoleculeError
 
 
@@ -409,6 +415,28 @@ class CliOptions:
             nargs=1,
         )
 
+    @property
+    def watch(self) -> CliOption:
+        """Watch mode option for converge."""
+        return CliOption(
+            name="watch",
+            help="Converge again whenever the scenario or role sources change.",
+            is_flag=True,
+            default=False,
+            experimental=True,
+        )
+
+    @property
+    def watch_verify(self) -> CliOption:
+        """Run verify after each watch mode converge."""
+        return CliOption(
+            name="watch-verify",
+            help="With --watch, also run verify after each converge.",
+            is_flag=True,
+            default=False,
+            experimental=True,
+        )
+
     @property
     def workers(self) -> CliOption:
         """Worker count for concurrent scenario execution."""
@@ -585,9 +613,108 @@ class FirstLineHelpMixin:
             self.help = first_line
 
 
-def click_group_ex() -> ClickGroup:
+class LazyGroup(click.Group):
+    """Click group that imports its subcommands only when they are needed.
+
+    Subcommands are registered as ``"package.module:attribute"`` import paths
+    and resolved the first time click asks for them, so that starting the CLI
+    does not pay for importing every command module and its dependencies.
+    """
+
+    def __init__(
+        self,
+        *args: Any,  # noqa: ANN401
+        lazy_commands: dict[str, str] | None = None,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> None:
+        """Initialize the group.
+
+        Args:
+            *args: Positional arguments forwarded to click.Group.
+            lazy_commands: Mapping of command name to its import path.
+            **kwargs: Keyword arguments forwarded to click.Group.
+        """
+        super().__init__(*args, **kwargs)
+        self.lazy_commands: dict[str, str] = dict(lazy_commands or {})
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        """Return the names of both loaded and not yet imported subcommands.
+
+        Args:
+            ctx: Click context object.
+
+        Returns:
+            Sorted list of subcommand names.
+        """
+        return sorted({*super().list_commands(ctx), *self.lazy_commands})
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        """Return a subcommand, importing it on first use.
+
+        Args:
+            ctx: Click context object.
+            cmd_name: Name of the subcommand.
+
+        Returns:
+            The subcommand, or None when the name is unknown.
+        """
+        if cmd_name in self.lazy_commands:
+            self._load_command(cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def shell_complete(
+        self,
+        ctx: click.Context,
+        incomplete: str,
+    ) -> list[CompletionItem]:
+        """Complete subcommand names without importing pending subcommands.
+
+        Args:
+            ctx: Click context object.
+            incomplete: Value being completed.
+
+        Returns:
+            Completion items for matching subcommands and options.
+        """
+        results = [
+            CompletionItem(name, help=command.get_short_help_str())
+            for name, command in sorted(self.commands.items())
+            if name.startswith(incomplete) and not command.hidden
+        ]
+        results.extend(
+            CompletionItem(name)
+            for name in sorted(self.lazy_commands)
+            if name.startswith(incomplete)
+        )
+        # Skip click.Group's implementation, which resolves every subcommand.
+        results.extend(click.Command.shell_complete(self, ctx, incomplete))
+        return results
+
+    def _load_command(self, cmd_name: str) -> None:
+        """Import a pending subcommand and register it on the group.
+
+        Args:
+            cmd_name: Name of the subcommand.
+
+        Raises:
+            TypeError: If the import path does not point to a click command.
+        """
+        module_name, _, attribute = self.lazy_commands[cmd_name].partition(":")
+        command = getattr(importlib.import_module(module_name), attribute)
+        if not isinstance(command, click.Command):
+            msg = f"Lazy subcommand '{cmd_name}' does not resolve to a click command."
+            raise TypeError(msg)
+        del self.lazy_commands[cmd_name]
+        self.add_command(command, cmd_name)
+
+
+def click_group_ex(lazy_commands: dict[str, str] | None = None) -> ClickGroup:
     """Return extended version of click.group().
 
+    Args:
+        lazy_commands: Optional mapping of subcommand name to a
+            ``"module:attribute"`` import path, loaded on first use.
+
     Returns:
         Click command group.
     """
@@ -597,6 +724,8 @@ def click_group_ex() -> ClickGroup:
     # blue : molecule own command, not dependent on scenario
     # yellow : special commands, like full test sequence, or login
     return click.group(
+        cls=LazyGroup,
+        lazy_commands=lazy_commands,
         # Workaround to disable click help line truncation to ~80 chars
         # https://github.com/pallets/click/issues/486
         context_settings={
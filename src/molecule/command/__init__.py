@@ -23,26 +23,57 @@
 # NOTE(retr0h): Importing into the ``molecule.command`` namespace, to prevent
 # collisions (e.g. ``list``).  The CLI usage may conflict with reserved words
 # or builtins.
+#
+# Submodules are resolved on first attribute access so that importing a single
+# command does not import all of them.
 from __future__ import annotations
 
-from molecule.command import (
-    base,  # noqa: F401
-    check,  # noqa: F401
-    cleanup,  # noqa: F401
-    converge,  # noqa: F401
-    create,  # noqa: F401
-    dependency,  # noqa: F401
-    destroy,  # noqa: F401
-    drivers,  # noqa: F401
-    idempotence,  # noqa: F401
-    list,  # noqa: A004, F401
-    login,  # noqa: F401
-    matrix,  # noqa: F401
-    prepare,  # noqa: F401
-    reset,  # noqa: F401
-    side_effect,  # noqa: F401
-    syntax,  # noqa: F401
-    test,  # noqa: F401
-    verify,  # noqa: F401
-)
-from molecule.command.init import init  # noqa: F401
+import importlib
+
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from types import ModuleType
+
+
+__all__ = [
+    "base",
+    "check",
+    "cleanup",
+    "converge",
+    "create",
+    "dependency",
+    "destroy",
+    "drivers",
+    "idempotence",
+    "init",
+    "list",
+    "login",
+    "matrix",
+    "prepare",
+    "reset",
+    "serve",
+    "side_effect",
+    "syntax",
+    "test",
+    "verify",
+]
+
+
+def __getattr__(name: str) -> ModuleType:
+    """Import command submodules on first access.
+
+    Args:
+        name: Attribute name.
+
+    Returns:
+        The imported submodule.
+
+    Raises:
+        AttributeError: If name is not a command submodule.
+    """
+    if name in __all__:
+        return importlib.import_module(f"{__name__}.{name}")
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
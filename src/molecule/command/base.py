@@ -38,7 +38,7 @@ import wcmatch.wcmatch
 
 from wcmatch import glob
 
-from molecule import config, logger, text, util
+from molecule import config, logger, pool, text, util
 from molecule.constants import MOLECULE_COLLECTION_ROOT, MOLECULE_DEFAULT_SCENARIO_NAME
 from molecule.exceptions import ConfigLoadError, MoleculeError, ScenarioFailureError
 from molecule.reporting.definitions import ScenarioResults
@@ -110,10 +110,21 @@ class Base(abc.ABC):
 
     def _setup(self) -> None:
         """Prepare Molecule's provisioner and returns None."""
-        self._config.write()
-        if self._config.provisioner is not None:
-            self._config.provisioner.write_config()
-            self._config.provisioner.manage_inventory()
+        setup(self._config)
+
+
+def setup(c: config.Config) -> None:
+    """Write the files a command runs with: the config, ansible.cfg and the inventory.
+
+    Args:
+        c: An instance of a Molecule config.
+    """
+    if c.skip_setup:
+        return
+    c.write()
+    if c.provisioner is not None:
+        c.provisioner.write_config()
+        c.provisioner.manage_inventory()
 
 
 def _is_excluded(name: str, excludes: list[str]) -> bool:
@@ -245,6 +256,7 @@ def execute_cmdline_scenarios(
     except ScenarioFailureError as exc:
         util.sysexit_from_exception(exc)
     finally:
+        pool.wait()
         report(scenarios.results, report_flag=command_args.get("report", True))
 
 
@@ -334,6 +346,11 @@ def _run_scenarios(
     Raises:
         ScenarioFailureError: when a scenario fails prematurely.
     """
+    if command_args.get("subcommand") != "reset":
+        from molecule.dependency import prefetch  # noqa: PLC0415
+
+        prefetch.install_requirements([scenario.config for scenario in scenarios.all])
+
     num_workers = command_args.get("workers", 1)
     if num_workers > 1:
         from molecule.worker import run_scenarios_parallel, validate_worker_args  # noqa: PLC0415
@@ -459,7 +476,9 @@ def execute_subcommand(
     # particularly the setting of ansible options in create/destroy,
     # and is also used for reporting in execute_cmdline_scenarios
     current_config.action = subcommand
-    return command(current_config).execute(args)
+    # coalesce the state changes made by a single action into one write
+    with current_config.state.transaction():
+        return command(current_config).execute(args)
 
 
 def execute_scenario(scenario: Scenario, *, shared_state: bool = False) -> None:
@@ -469,7 +488,13 @@ def execute_scenario(scenario: Scenario, *, shared_state: bool = False) -> None:
         scenario: The scenario to execute.
         shared_state: Whether global shared state execution is active for this run.
     """
-    for action in scenario.sequence:
+    from molecule import fused  # noqa: PLC0415
+
+    for actions in fused.plan(scenario.config, scenario.sequence):
+        if len(actions) > 1:
+            fused.execute(scenario.config, actions)
+            continue
+        action = actions[0]
         if shared_state and action in ("create", "destroy"):
             # Ignore
             continue
@@ -481,10 +506,12 @@ def execute_scenario(scenario: Scenario, *, shared_state: bool = False) -> None:
         and "destroy" in scenario.sequence
         and scenario.config.command_args.get("destroy") != "never"
     ):
-        scenario.prune()
-
         if scenario.config.is_parallel:
+            scenario.prune()
             scenario._remove_scenario_state_directory()  # noqa: SLF001
+        else:
+            # Nothing else uses this directory, let the next scenario start.
+            scenario.prune(background=True)
 
 
 def get_configs(
@@ -53,7 +53,7 @@ class Converge(base.Base):
 
 
 @click_command_ex()
-@common_options("ansible_args")
+@common_options("ansible_args", "watch", "watch_verify")
 def converge(ctx: click.Context) -> None:  # pragma: no cover
     """Use the provisioner to configure instances (dependency, create, prepare converge).
 
@@ -77,4 +77,17 @@ def converge(ctx: click.Context) -> None:  # pragma: no cover
     if __all:
         scenario_name = None
 
+    if ctx.params["watch"]:
+        from molecule.watch import watch_cmdline_scenarios  # noqa: PLC0415
+
+        watch_cmdline_scenarios(
+            scenario_name,
+            args,
+            command_args,
+            ansible_args,
+            exclude,
+            verify=ctx.params["watch_verify"],
+        )
+        return
+
     base.execute_cmdline_scenarios(scenario_name, args, command_args, ansible_args, exclude)
@@ -23,8 +23,10 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from molecule import pool, ssh_pool, util
 from molecule.click_cfg import click_command_ex, common_options
 from molecule.command import base
+from molecule.exceptions import MoleculeError
 from molecule.reporting.definitions import CompletionState
 
 
@@ -51,10 +53,83 @@ class Create(base.Base):
             self._config.scenario.results.add_completion(CompletionState.skipped(note=msg))
             return
 
+        # Persist the driver before creating instances, so they can be
+        # destroyed even if this run is interrupted.
+        self._config.state.flush()
+
+        if not (self._lease_instances() or self._restore_snapshot()):
+            if self._config.provisioner:
+                self._config.provisioner.create()
+
+            self._config.state.change_state("created", value=True)
+        ssh_pool.open_masters(self._config)
+
+    def _lease_instances(self) -> bool:
+        """Lease prepared instances from the pool, in place of create and prepare.
+
+        Returns:
+            Whether instances were leased.
+        """
+        scenario = self._config.scenario
+        if "prepare" not in scenario.sequence or pool.get_pool_size() is None:
+            return False
+        instance_pool = pool.InstancePool.from_config(self._config)
+        pool.prune(self._config, instance_pool)
+        lease = instance_pool.lease(owner=scenario.ephemeral_directory)
+        if lease is not None and not lease.clean:
+            if (clean := pool.reset(self._config, instance_pool, lease)) is None:
+                instance_pool.forget(lease.id)
+            lease = clean
+        # Pre-warm the pool for the next runs, while this one goes on.
+        if lease is not None:
+            pool.replenish(self._config, instance_pool, lease.snapshot)
+        elif scenario.snapshot_name in scenario.snapshots:
+            pool.replenish(self._config, instance_pool, scenario.snapshot_name)
+        if lease is None:
+            return False
+
+        util.atomic_write_file(self._config.driver.instance_config, lease.instance_config, "")
         if self._config.provisioner:
-            self._config.provisioner.create()
+            self._config.provisioner.clear_fact_cache()
+        msg = f"Leased instances {lease.id} from the pool, skipping create and prepare."
+        self._log.info(msg)
+        scenario.results.add_completion(CompletionState.successful(note=msg))
+        self._config.state.change_state("leased", lease.id)
+        self._config.state.change_state("created", value=True)
+        self._config.state.change_state("prepared", value=True)
+        return True
 
+    def _restore_snapshot(self) -> bool:
+        """Restore prepared instances from a snapshot, in place of create and prepare.
+
+        Returns:
+            Whether the instances were restored.
+        """
+        scenario = self._config.scenario
+        if "prepare" not in scenario.sequence:
+            return False
+        name = scenario.snapshot_name
+        if name not in scenario.snapshots:
+            return False
+        completions = len(scenario.results.actions[-1].states) if scenario.results.actions else 0
+        try:
+            if not self._config.driver.restore(name):
+                return False
+        except MoleculeError as exc:
+            # Fall back to a regular create and prepare, which snapshot again.
+            if scenario.results.actions:
+                del scenario.results.actions[-1].states[completions:]
+            scenario.remove_snapshot(name)
+            self._log.warning("Failed to restore snapshot %s, creating instances: %s", name, exc)
+            return False
+
+        msg = f"Restored snapshot {name}, skipping create and prepare."
+        self._log.info(msg)
+        scenario.results.add_completion(CompletionState.successful(note=msg))
+        self._config.state.change_state("restored", name)
         self._config.state.change_state("created", value=True)
+        self._config.state.change_state("prepared", value=True)
+        return True
 
 
 @click_command_ex()
@@ -23,10 +23,13 @@ from __future__ import annotations
 
 import warnings
 
+from pathlib import Path
 from typing import TYPE_CHECKING
 
+from molecule import pool, ssh_pool
 from molecule.click_cfg import click_command_ex, common_options, resolve_workers
 from molecule.command import base
+from molecule.reporting.definitions import CompletionState
 
 
 if TYPE_CHECKING:
@@ -49,9 +52,86 @@ class Destroy(base.Base):
             self._log.warning(msg)
             return
 
+        state = self._config.state
+        if pool.get_pool_size() is None:
+            self._destroy_instances()
+            state.reset()
+            return
+
+        instance_pool = pool.InstancePool.from_config(self._config)
+        pool.prune(self._config, instance_pool)
+        if instance_pool.size:
+            if not state.created and instance_pool.has_named_entries():
+                # The destroy playbook would also remove pooled instances
+                # with the same names.
+                msg = "Skipping, instances are pooled."
+                self._log.info(msg)
+                self._config.scenario.results.add_completion(CompletionState.skipped(note=msg))
+                return
+            if self._return_instances(instance_pool):
+                state.reset()
+                return
+
+        lease = instance_pool.leased(state.leased) if state.leased else None
+        if lease is not None and lease.cloned:
+            pool.discard(self._config, instance_pool, lease)
+        else:
+            self._destroy_instances()
+            # Pooled instances with the same names are gone too.
+            instance_pool.drop_named()
+            if state.leased:
+                instance_pool.forget(state.leased)
+        if instance_pool.size == 0:
+            pool.drain(self._config, instance_pool)
+        state.reset()
+
+    def _destroy_instances(self) -> None:
+        """Run the destroy playbook."""
+        ssh_pool.close_masters(self._config)
         if self._config.provisioner:
             self._config.provisioner.destroy()
-        self._config.state.reset()
+
+    def _return_instances(self, instance_pool: pool.InstancePool) -> bool:
+        """Return prepared instances to the pool, to be reset when leased again.
+
+        Clones are reset in the background when pre-warming is enabled.
+
+        Args:
+            instance_pool: The pool of the scenario.
+
+        Returns:
+            Whether the instances were returned, instead of destroyed.
+        """
+        state = self._config.state
+        if not state.created or not state.prepared or not instance_pool.has_room():
+            return False
+        scenario = self._config.scenario
+        lease = instance_pool.leased(state.leased) if state.leased else None
+        if lease is not None:
+            snapshot = lease.snapshot
+        elif scenario.snapshot_name in scenario.snapshots:
+            snapshot = scenario.snapshot_name
+        else:
+            return False
+
+        try:
+            instance_config = Path(self._config.driver.instance_config).read_text(encoding="utf-8")
+        except OSError:
+            return False
+        cloned = lease is not None and lease.cloned
+        entry = instance_pool.release(
+            instance_config,
+            snapshot,
+            state.leased,
+            clean=False,
+            cloned=cloned,
+        )
+        if cloned and pool.prewarm_enabled() and (taken := instance_pool.take(entry.id)):
+            pool.reset_in_background(self._config, instance_pool, taken)
+        msg = f"Returned instances {entry.id} to the pool, skipping destroy."
+        self._log.info(msg)
+        scenario.results.add_completion(CompletionState.successful(note=msg))
+        return True
 
 
 @click_command_ex()
@@ -93,25 +93,37 @@ class Idempotence(base.Base):
             list: A list containing the names of the non idempotent tasks.
 
         """
-        # Remove blank lines to make regex matches easier.
-        output = re.sub(r"\n\s*\n*", "\n", output)
+        return non_idempotent_tasks(output)
+
+
+def non_idempotent_tasks(output: str) -> list[str]:
+    """Parse the output to identify the non idempotent tasks.
 
-        # Remove ansi escape sequences.
-        output = strip_ansi_escape(output)
-
-        # Split the output into a list and go through it.
-        output_lines = output.split("\n")
-        res = []
-        task_line = ""
-        for _, line in enumerate(output_lines):
-            if line.startswith("TASK"):
-                task_line = line
-            elif line.startswith("changed"):
-                host_name = re.search(r"\[(.*)\]", line).groups()[0]  # type: ignore[union-attr]
-                task_name = re.search(r"\[(.*)\]", task_line).groups()[0]  # type: ignore[union-attr]
-                res.append(f"* [{host_name}] => {task_name}")
-
-        return res
+    Args:
+        output: A string containing the output of the ansible run.
+
+    Returns:
+        list: A list containing the names of the non idempotent tasks.
+    """
+    # Remove blank lines to make regex matches easier.
+    output = re.sub(r"\n\s*\n*", "\n", output)
+
+    # Remove ansi escape sequences.
+    output = strip_ansi_escape(output)
+
+    # Split the output into a list and go through it.
+    output_lines = output.split("\n")
+    res = []
+    task_line = ""
+    for _, line in enumerate(output_lines):
+        if line.startswith("TASK"):
+            task_line = line
+        elif line.startswith("changed"):
+            host_name = re.search(r"\[(.*)\]", line).groups()[0]  # type: ignore[union-attr]
+            task_name = re.search(r"\[(.*)\]", task_line).groups()[0]  # type: ignore[union-attr]
+            res.append(f"* [{host_name}] => {task_name}")
+
+    return res
 
 
 @click_command_ex()
@@ -109,6 +109,16 @@ class Prepare(base.Base):
 
             self._config.provisioner.prepare()
             self._config.state.change_state("prepared", value=True)
+            self._take_snapshot()
+
+    def _take_snapshot(self) -> None:
+        """Snapshot the freshly prepared instances, if the driver supports it."""
+        scenario = self._config.scenario
+        name = scenario.snapshot_name
+        if name in scenario.snapshots or not self._config.driver.snapshot(name):
+            return
+        scenario.add_snapshot(name)
+        self._log.info("Saved snapshot %s of the prepared instances.", name)
 
 
 @click_command_ex()
@@ -0,0 +1,47 @@
+#  Copyright (c) 2015-2018 Cisco Systems, Inc.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+"""Serve Command Module."""
+
+from __future__ import annotations
+
+import socket
+
+from molecule import daemon, util
+from molecule.click_cfg import click_command_ex
+
+
+@click_command_ex()
+def serve() -> None:  # pragma: no cover
+    """Run a server that executes molecule commands from a warm process.
+
+    While it runs, molecule commands are forwarded to it over a Unix socket
+    and start without paying for imports and plugin discovery. Set
+    MOLECULE_NO_SERVE to bypass it.
+    """
+    if not hasattr(socket, "AF_UNIX") or not hasattr(socket, "send_fds"):
+        util.sysexit_with_message("molecule serve requires Unix domain sockets.")
+
+    server = daemon.Server(daemon.socket_path())
+    try:
+        server.serve_forever()
+    except RuntimeError as exc:
+        util.sysexit_with_message(str(exc))
+    except KeyboardInterrupt:
+        pass
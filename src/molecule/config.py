@@ -35,7 +35,14 @@ from ansible_compat.ports import cache, cached_property
 
 from molecule import api, interpolation, logger, platforms, scenario, state, util
 from molecule.app import get_app
-from molecule.constants import DEFAULT_CONFIG, ENV_VAR_CONFIG_MAPPING, MOLECULE_COLLECTION_ROOT
+from molecule.constants import (
+    DEFAULT_CONFIG,
+    ENV_VAR_CONFIG_MAPPING,
+    MOLECULE_COLLECTION_ROOT,
+    MOLECULE_DEBUG,
+    MOLECULE_PARALLEL,  # noqa: F401
+    MOLECULE_VERBOSITY,  # noqa: F401
+)
 from molecule.data import __file__ as data_module
 from molecule.dependency import ansible_galaxy, shell
 from molecule.model import schema_v3
@@ -61,9 +68,6 @@ if TYPE_CHECKING:
     from molecule.verifier.base import Verifier
 
 
-MOLECULE_PARALLEL: bool = boolean(os.environ.get("MOLECULE_PARALLEL", ""), default=False)
-MOLECULE_DEBUG: bool = boolean(os.environ.get("MOLECULE_DEBUG", "False"), default=False)
-MOLECULE_VERBOSITY: int = int(os.environ.get("MOLECULE_VERBOSITY", "0"))
 MOLECULE_DIRECTORY = "molecule"
 MOLECULE_FILE = "molecule.yml"
 MOLECULE_KEEP_STRING = "MOLECULE_"
@@ -125,6 +129,9 @@ class Config:
         self.ansible_args = ansible_args
         self.config_data = self._get_config()
         self._action: str | None = None
+        # Set when the files written by command setup are known to be current,
+        # e.g. between watch mode iterations with unchanged configuration.
+        self.skip_setup = False
         self._run_uuid = str(uuid4())
         self.project_directory = os.getenv(
             "MOLECULE_PROJECT_DIRECTORY",
@@ -344,14 +351,11 @@ class Config:
             The driver for this scenario.
         """
         driver_name = self._get_driver_name()
-        driver = None
-
-        api_drivers = api.drivers(config=self)
-        if driver_name not in api_drivers:
+        driver = api.drivers(config=self).get(driver_name)
+        if driver is None:
             msg = f"Failed to find driver {driver_name}. Please ensure that the driver is correctly installed."
             sysexit_with_message(msg, code=1)
 
-        driver = api_drivers[driver_name]
         driver.name = driver_name
 
         return driver
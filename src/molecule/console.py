@@ -1,36 +1,29 @@
-"""Console and terminal utilities."""
+"""Console and terminal utilities.
+
+The rich consoles are only created, and rich imported, when first used, so
+that modules needing just the original streams stay cheap to import.
+"""
 
 from __future__ import annotations
 
 import os
 import sys
 
-from typing import Any
-
-from enrich.console import Console
-from rich.style import Style
-from rich.theme import Theme
+from typing import TYPE_CHECKING, Any
 
 from molecule.ansi_output import should_do_markup
 
 
-theme = Theme(
-    {
-        "info": "dim cyan",
-        "warning": "magenta",
-        "danger": "bold red",
-        "scenario": "green",
-        "action": "green",
-        "section_title": "bold cyan",
-        "logging.level.notset": Style(dim=True),
-        "logging.level.debug": Style(color="white", dim=True),
-        "logging.level.info": Style(color="blue"),
-        "logging.level.warning": Style(color="red"),
-        "logging.level.error": Style(color="red", bold=True),
-        "logging.level.critical": Style(color="red", bold=True),
-        "logging.level.success": Style(color="green", bold=True),
-    },
-)
+if TYPE_CHECKING:
+    from enrich.console import Console
+    from rich.theme import Theme
+
+    theme: Theme
+    console_options: dict[str, Any]
+    console: Console
+    console_stderr: Console
+
+_LAZY_NAMES = ("theme", "console_options", "console", "console_stderr")
 
 
 # Define ANSIBLE_FORCE_COLOR if markup is enabled and another value is not
@@ -44,14 +37,96 @@ if should_do_markup():
 original_stdout = sys.stdout
 original_stderr = sys.stderr
 
-console_options: dict[str, Any] = {"emoji": False, "theme": theme, "soft_wrap": True}
-
-console = Console(
-    force_terminal=should_do_markup(),
-    theme=theme,
-    record=True,
-    redirect=True,
-)
-console_options_stderr = console_options.copy()
-console_options_stderr["stderr"] = True
-console_stderr: Console = Console(**console_options_stderr)
+
+def _consoles() -> tuple[Console, Console]:
+    """Create the rich consoles and their theme, once.
+
+    Returns:
+        The standard output and standard error consoles.
+    """
+    if "console" in globals():
+        return globals()["console"], globals()["console_stderr"]
+
+    from enrich.console import Console  # noqa: PLC0415
+    from rich.style import Style  # noqa: PLC0415
+    from rich.theme import Theme  # noqa: PLC0415
+
+    theme = Theme(
+        {
+            "info": "dim cyan",
+            "warning": "magenta",
+            "danger": "bold red",
+            "scenario": "green",
+            "action": "green",
+            "section_title": "bold cyan",
+            "logging.level.notset": Style(dim=True),
+            "logging.level.debug": Style(color="white", dim=True),
+            "logging.level.info": Style(color="blue"),
+            "logging.level.warning": Style(color="red"),
+            "logging.level.error": Style(color="red", bold=True),
+            "logging.level.critical": Style(color="red", bold=True),
+            "logging.level.success": Style(color="green", bold=True),
+        },
+    )
+    console_options: dict[str, Any] = {"emoji": False, "theme": theme, "soft_wrap": True}
+    console_options_stderr = console_options.copy()
+    console_options_stderr["stderr"] = True
+    globals().update(
+        theme=theme,
+        console_options=console_options,
+        console=Console(
+            force_terminal=should_do_markup(),
+            theme=theme,
+            record=True,
+            redirect=True,
+        ),
+        console_stderr=Console(**console_options_stderr),
+    )
+    return globals()["console"], globals()["console_stderr"]
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    """Create the consoles on first access.
+
+    Args:
+        name: Name of the module attribute.
+
+    Returns:
+        The attribute.
+
+    Raises:
+        AttributeError: If the attribute does not exist.
+    """
+    if name in _LAZY_NAMES:
+        _consoles()
+        return globals()[name]
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
+
+
+def adopt_streams() -> None:
+    """Recreate the standard streams and re-evaluate color support.
+
+    A process that replaces its standard file descriptors after start, like a
+    command served by ``molecule serve``, calls this so that Python's streams
+    and the consoles match the new descriptors.
+    """
+    for fd, name in enumerate(("stdin", "stdout", "stderr")):
+        current = getattr(sys, f"__{name}__")
+        stream = open(  # noqa: SIM115
+            fd,
+            "r" if fd == 0 else "w",
+            buffering=1 if fd and os.isatty(fd) else -1,
+            encoding=current.encoding if current else None,
+            errors=current.errors if current else None,
+            closefd=False,
+        )
+        setattr(sys, name, stream)
+        setattr(sys, f"__{name}__", stream)
+
+    markup = should_do_markup()
+    if markup:
+        os.environ["ANSIBLE_FORCE_COLOR"] = os.environ.get("ANSIBLE_FORCE_COLOR", "1")
+    for target in _consoles():
+        target._force_terminal = markup  # noqa: SLF001
+        target._color_system = target._detect_color_system()  # noqa: SLF001
@@ -7,6 +7,7 @@ import os
 from typing import TYPE_CHECKING, Literal, TypedDict
 
 from molecule.compatibility import StrEnum
+from molecule.text import boolean
 
 
 if TYPE_CHECKING:
@@ -30,6 +31,13 @@ MOLECULE_COLLECTION_GLOB = f"{MOLECULE_COLLECTION_ROOT}/**/molecule.yml"
 MOLECULE_DEFAULT_SCENARIO_NAME = "default"
 MOLECULE_PLATFORM_NAME = os.environ.get("MOLECULE_PLATFORM_NAME", None)
 
+# Environment driven CLI defaults. These live here rather than in
+# ``molecule.config`` so the command line entry point can build its options
+# without importing the configuration machinery.
+MOLECULE_PARALLEL: bool = boolean(os.environ.get("MOLECULE_PARALLEL", ""), default=False)
+MOLECULE_DEBUG: bool = boolean(os.environ.get("MOLECULE_DEBUG", "False"), default=False)
+MOLECULE_VERBOSITY: int = int(os.environ.get("MOLECULE_VERBOSITY", "0"))
+
 # Environment variable to config attribute mapping for CLI options
 
 
@@ -62,13 +70,18 @@ DEFAULT_CONFIG: DefaultConfigData = {
             },
         },
         "env": {},
+        "fact_cache": False,
         "playbooks": {
             "cleanup": "cleanup.yml",
+            "clone": "clone.yml",
             "create": "create.yml",
             "converge": "converge.yml",
             "destroy": "destroy.yml",
+            "discard": "discard.yml",
             "prepare": "prepare.yml",
+            "restore": "restore.yml",
             "side_effect": "side_effect.yml",
+            "snapshot": "snapshot.yml",
             "verify": "verify.yml",
         },
     },
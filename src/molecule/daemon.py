@@ -0,0 +1,378 @@
+"""Long-lived Molecule server and the thin client forwarding commands to it.
+
+``molecule serve`` imports the command modules, loads every plugin and then
+waits for requests on a Unix socket. The ``molecule`` entry point forwards its
+command line to the server when one is listening, which forks a child that
+inherits the warm interpreter, adopts the caller's working directory,
+environment and standard streams and runs the command. Anything read from disk
+while running a command (molecule.yml, inventories, playbooks) is read by the
+child, so changes are always picked up. The Ansible runtime, whose setup runs
+``ansible-config`` and ``ansible``, is built by the server and kept for as long
+as callers share a project and environment. The server shuts down once
+installed packages or Molecule's own sources change, and the client then runs
+the command in-process.
+
+This module is imported by the entry point before anything else, so it only
+depends on the standard library at import time.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import logging
+import os
+import signal
+import socket
+import sys
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from molecule import ipc
+
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+
+
+LOG = logging.getLogger(__name__)
+
+SOCKET_NAME = "molecule.sock"
+# Molecule settings read from the environment when modules are imported. The
+# server can only serve callers whose values match the ones it started with.
+IMPORT_TIME_ENV = (
+    "MOLECULE_DEBUG",
+    "MOLECULE_PARALLEL",
+    "MOLECULE_PLATFORM_NAME",
+    "MOLECULE_VERBOSITY",
+)
+
+
+def socket_path() -> Path:
+    """Location of the server socket.
+
+    ``MOLECULE_SERVE_SOCKET`` overrides the default, which lives in the user
+    runtime directory, or in the user cache directory when there is none.
+
+    Returns:
+        Path to the Unix socket.
+    """
+    if path := os.environ.get("MOLECULE_SERVE_SOCKET"):
+        return Path(path)
+    if runtime_dir := os.environ.get("XDG_RUNTIME_DIR"):
+        return Path(runtime_dir) / "molecule" / SOCKET_NAME
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "molecule" / SOCKET_NAME
+
+
+def _import_time_env(env: Mapping[str, str]) -> dict[str, str | None]:
+    """Return the environment values that are only read at import time.
+
+    Args:
+        env: The environment to inspect.
+
+    Returns:
+        Value of each of IMPORT_TIME_ENV, None when unset.
+    """
+    return {key: env.get(key) for key in IMPORT_TIME_ENV}
+
+
+def forward(argv: Sequence[str]) -> int | None:
+    """Run a command line through a running server.
+
+    Args:
+        argv: Command line arguments, without the program name.
+
+    Returns:
+        The exit code of the command, or None when no server could run it and
+        the caller should run it in-process.
+    """
+    if (
+        os.environ.get("MOLECULE_NO_SERVE")
+        or not hasattr(socket, "send_fds")
+        or (argv and argv[0] == "serve")
+    ):
+        return None
+
+    conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        conn.connect(str(socket_path()))
+    except OSError:
+        conn.close()
+        return None
+
+    with conn:
+        request = {"argv": list(argv), "cwd": os.getcwd(), "env": dict(os.environ)}  # noqa: PTH109
+        try:
+            socket.send_fds(conn, [json.dumps(request).encode() + b"\n"], [0, 1, 2])
+            buffer = bytearray()
+            reply = ipc.receive(conn, buffer)
+        except (OSError, ValueError):
+            return None
+        if not reply or "pid" not in reply:
+            return None
+
+        pid = int(reply["pid"])
+        while True:
+            try:
+                reply = ipc.receive(conn, buffer)
+                break
+            except KeyboardInterrupt:
+                # The child does not share our process group, relay the interrupt.
+                with contextlib.suppress(OSError):
+                    os.kill(pid, signal.SIGINT)
+            except (OSError, ValueError):
+                reply = None
+                break
+    if not reply:
+        # The child went away without reporting, e.g. it was killed.
+        return 1
+    return int(reply["exit_code"])
+
+
+def code_mtimes() -> dict[str, int]:
+    """Return the mtimes of Molecule's sources and of the directories holding them.
+
+    Adding or removing a source file changes the mtime of its directory.
+    Bytecode caches are left out, as children write to them.
+
+    Returns:
+        Mtime in nanoseconds of each source file and directory.
+    """
+    root = Path(__file__).parent
+    mtimes: dict[str, int] = {}
+    for directory, dirs, files in os.walk(root):
+        dirs[:] = [name for name in dirs if name != "__pycache__"]
+        for path in (directory, *(f"{directory}/{name}" for name in files if name.endswith(".py"))):
+            with contextlib.suppress(OSError):
+                mtimes[path] = os.stat(path).st_mtime_ns  # noqa: PTH116
+    return mtimes
+
+
+def code_changed(site_packages: str, mtimes: Mapping[str, int]) -> bool:
+    """Whether installed packages or Molecule's sources changed.
+
+    Only the files recorded by :func:`code_mtimes` are checked, which is cheap
+    enough to do before every request.
+
+    Args:
+        site_packages: Digest of the import path entries the server started with.
+        mtimes: Mtimes of the sources the server started with.
+
+    Returns:
+        True when the code a server has loaded is stale.
+    """
+    from molecule.api import _site_packages_digest  # noqa: PLC0415
+
+    if _site_packages_digest() != site_packages:
+        return True
+    try:
+        return any(os.stat(path).st_mtime_ns != mtime for path, mtime in mtimes.items())  # noqa: PTH116
+    except OSError:
+        return True
+
+
+class Server:
+    """Serve Molecule commands from a warm interpreter over a Unix socket."""
+
+    def __init__(self, path: Path) -> None:
+        """Initialize the server.
+
+        Args:
+            path: Path of the Unix socket to listen on.
+        """
+        self.path = path
+        self.site_packages = ""
+        self.mtimes: dict[str, int] = {}
+        self.import_time_env = _import_time_env(os.environ)
+        # Project and environment the cached Ansible runtime was built for.
+        self.runtime_context: tuple[str, dict[str, str]] | None = None
+
+    @staticmethod
+    def warm_up() -> None:
+        """Import every subcommand and load every plugin."""
+        from molecule import api, shell  # noqa: PLC0415
+
+        ctx = shell.main.make_context("molecule", [], resilient_parsing=True)
+        for name in shell.main.list_commands(ctx):
+            shell.main.get_command(ctx, name)
+        api.drivers().values()
+        api.verifiers().values()
+
+    def warm_runtime(self, request: dict[str, Any]) -> None:
+        """Build the Ansible runtime of a request's project before forking.
+
+        Building it runs ``ansible-config dump`` and ``ansible --version``. The
+        runtime of the last project and environment served is kept, so that
+        children forked for the same ones inherit it instead of building their
+        own. It is rebuilt whenever either differs.
+
+        Args:
+            request: The decoded request.
+        """
+        from molecule import app  # noqa: PLC0415
+
+        env: dict[str, str] = request["env"]
+        project = env.get("MOLECULE_PROJECT_DIRECTORY") or request["cwd"]
+        if self.runtime_context == (project, env):
+            return
+
+        app.get_app.cache_clear()
+        self.runtime_context = None
+        saved_env, saved_cwd = dict(os.environ), os.getcwd()  # noqa: PTH109
+        try:
+            os.environ.clear()
+            os.environ.update(env)
+            os.chdir(request["cwd"])
+            app.get_app(Path(project)).runtime.version  # noqa: B018
+            self.runtime_context = (project, env)
+        except Exception as exc:  # noqa: BLE001
+            # The child builds the runtime itself and reports the error.
+            LOG.debug("Unable to prepare the Ansible runtime of %s: %s", project, exc)
+            app.get_app.cache_clear()
+        finally:
+            os.environ.clear()
+            os.environ.update(saved_env)
+            os.chdir(saved_cwd)
+
+    def listen(self) -> socket.socket:
+        """Bind the server socket, replacing a stale one.
+
+        Returns:
+            The listening socket.
+
+        Raises:
+            RuntimeError: If another server is already listening.
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+        if self.path.exists():
+            probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                probe.connect(str(self.path))
+            except OSError:
+                self.path.unlink()
+            else:
+                msg = f"Another molecule server is already listening on {self.path}."
+                raise RuntimeError(msg)
+            finally:
+                probe.close()
+
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.bind(str(self.path))
+        self.path.chmod(0o600)
+        sock.listen()
+        return sock
+
+    def serve_forever(self) -> None:
+        """Accept requests until interrupted or until the loaded code is stale."""
+        from molecule.api import _site_packages_digest  # noqa: PLC0415
+
+        self.warm_up()
+        self.site_packages = _site_packages_digest()
+        self.mtimes = code_mtimes()
+        # Forked children are reaped automatically.
+        signal.signal(signal.SIGCHLD, signal.SIG_IGN)
+        signal.signal(signal.SIGTERM, ipc.exit_on_signal)
+        sock = self.listen()
+        LOG.info("Molecule server listening on %s", self.path)
+        try:
+            while True:
+                conn, _ = sock.accept()
+                with conn:
+                    if not self.handle(conn, sock):
+                        break
+        finally:
+            sock.close()
+            with contextlib.suppress(OSError):
+                self.path.unlink()
+
+    def handle(self, conn: socket.socket, sock: socket.socket) -> bool:
+        """Run one request in a forked child.
+
+        Args:
+            conn: Connection of the client.
+            sock: The listening socket, closed in the child.
+
+        Returns:
+            False when the server should stop.
+        """
+        data, fds, _, _ = socket.recv_fds(conn, ipc.MAX_MESSAGE, 3)
+        try:
+            buffer = bytearray(data)
+            request = ipc.receive(conn, buffer)
+            if request is None or len(fds) != 3:  # noqa: PLR2004
+                return True
+            if code_changed(self.site_packages, self.mtimes):
+                LOG.warning("Molecule code changed, stopping the server.")
+                ipc.send(conn, {"fallback": "stale"})
+                return False
+            if _import_time_env(request["env"]) != self.import_time_env:
+                ipc.send(conn, {"fallback": "environment"})
+                return True
+
+            self.warm_runtime(request)
+
+            if os.fork() == 0:
+                sock.close()
+                # The child reports its pid before anything else, so the
+                # client always reads it ahead of the exit code.
+                code = 1
+                try:
+                    ipc.send(conn, {"pid": os.getpid()})
+                    code = self.run_child(conn, request, fds)
+                finally:
+                    os._exit(code)
+        except (OSError, ValueError) as exc:
+            LOG.warning("Failed to handle request: %s", exc)
+        finally:
+            for fd in fds:
+                os.close(fd)
+        return True
+
+    @staticmethod
+    def run_child(conn: socket.socket, request: dict[str, Any], fds: list[int]) -> int:
+        """Run a command in the forked child, as the client would have.
+
+        Args:
+            conn: Connection of the client.
+            request: The decoded request.
+            fds: Standard input, output and error of the client.
+
+        Returns:
+            Exit code of the command.
+        """
+        signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        signal.signal(signal.SIGINT, signal.default_int_handler)
+        for target, fd in enumerate(fds):
+            os.dup2(fd, target)
+        os.environ.clear()
+        os.environ.update(request["env"])
+        os.chdir(request["cwd"])
+
+        from molecule import shell, util  # noqa: PLC0415
+        from molecule.ansi_output import should_do_markup  # noqa: PLC0415
+        from molecule.console import adopt_streams  # noqa: PLC0415
+
+        # Lookups relative to the working directory were cached for the server's.
+        util.find_vcs_root.cache_clear()
+        util.get_collection_metadata.cache_clear()
+        util.get_effective_molecule_glob.cache_clear()
+        adopt_streams()
+        shell.main.context_settings["color"] = should_do_markup()
+        try:
+            shell.main.main(args=request["argv"], prog_name="molecule")
+        except SystemExit as exc:
+            code = exc.code if isinstance(exc.code, int) else int(exc.code is not None)
+        except BaseException:
+            LOG.exception("Unexpected error while running %s", request["argv"])
+            code = 1
+        else:
+            code = 0
+        for stream in (sys.stdout, sys.stderr):
+            with contextlib.suppress(OSError, ValueError):
+                stream.flush()
+        with contextlib.suppress(OSError):
+            ipc.send(conn, {"exit_code": code})
+        return code
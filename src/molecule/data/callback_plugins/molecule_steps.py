@@ -0,0 +1,92 @@
+"""Ansible callback recording the failed steps of a fused Molecule run."""  # noqa: INP001
+
+from __future__ import annotations
+
+import json
+import os
+
+from typing import Any
+
+from ansible.playbook.block import Block  # type: ignore[import-untyped]
+from ansible.plugins.callback import CallbackBase  # type: ignore[import-untyped]
+
+
+DOCUMENTATION = """
+    name: molecule_steps
+    type: aggregate
+    short_description: Record the failed steps of a fused Molecule run
+    description:
+      - Writes the index of each step of a fused run with a failed task or an
+        unreachable host to the file named by C(MOLECULE_FUSED_RESULTS).
+      - Steps start with a play named C(molecule step: <step>).
+"""
+
+STEP_PLAY_PREFIX = "molecule step: "
+
+
+def _rescued(task: Any) -> bool:  # noqa: ANN401
+    """Whether a task runs in a block with a rescue section.
+
+    Args:
+        task: The task.
+
+    Returns:
+        True if failures of the task are rescued.
+    """
+    parent = getattr(task, "_parent", None)
+    while parent is not None:
+        if isinstance(parent, Block) and parent.rescue:
+            return True
+        parent = getattr(parent, "_parent", None)
+    return False
+
+
+class CallbackModule(CallbackBase):  # type: ignore[misc]
+    """Record the steps with a failed task or an unreachable host."""
+
+    CALLBACK_VERSION = 2.0
+    CALLBACK_TYPE = "aggregate"
+    CALLBACK_NAME = "molecule_steps"
+    CALLBACK_NEEDS_ENABLED = True
+
+    def __init__(self) -> None:
+        """Initialize the callback."""
+        super().__init__()
+        self.step = -1
+        self.failed: list[int] = []
+
+    def v2_playbook_on_play_start(self, play: Any) -> None:  # noqa: ANN401
+        """Count the steps started.
+
+        Args:
+            play: The play.
+        """
+        if play.get_name().startswith(STEP_PLAY_PREFIX):
+            self.step += 1
+
+    def v2_runner_on_failed(self, result: Any, ignore_errors: bool = False) -> None:  # noqa: ANN401, FBT001, FBT002
+        """Record a failed task, unless its error is ignored or rescued.
+
+        Args:
+            result: Result of the task.
+            ignore_errors: Whether the error is ignored.
+        """
+        if not ignore_errors and not _rescued(result._task):  # noqa: SLF001
+            self._record()
+
+    def v2_runner_on_unreachable(self, result: Any) -> None:  # noqa: ANN401, ARG002
+        """Record an unreachable host.
+
+        Args:
+            result: Result of the task.
+        """
+        self._record()
+
+    def _record(self) -> None:
+        """Write the failed steps, the current one included."""
+        path = os.environ.get("MOLECULE_FUSED_RESULTS")
+        if self.step < 0 or self.step in self.failed or not path:
+            return
+        self.failed.append(self.step)
+        with open(path, "w", encoding="utf-8") as results:  # noqa: PTH123
+            json.dump({"failed": self.failed}, results)
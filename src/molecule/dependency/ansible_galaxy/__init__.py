@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+from subprocess import CalledProcessError
 from typing import TYPE_CHECKING
 
 from molecule import util
@@ -34,8 +36,47 @@ class AnsibleGalaxy(Base):
         Args:
             action_args: Arguments for invokers. Unused.
         """
-        for invoker in self.invocations:
-            invoker.execute()
+        installing = [invoker for invoker in self.invocations if invoker._has_requirements_file()]  # noqa: SLF001
+        # Requirements are installed concurrently unless they could both write
+        # the same collections.
+        concurrent = (
+            self.enabled
+            and len(installing) > 1
+            and sum(invoker.installs_collections() for invoker in installing) <= 1
+        )
+        if not concurrent:
+            for invoker in self.invocations:
+                invoker.execute()
+            return
+
+        # Results are only recorded from this thread, before the installs start.
+        installing = [invoker for invoker in self.invocations if invoker.needs_install()]
+        if len(installing) <= 1:
+            for invoker in installing:
+                invoker.install_requirements()
+            return
+        with ThreadPoolExecutor(max_workers=len(installing)) as executor:
+            futures = [
+                executor.submit(invoker.install_requirements, capture=True)
+                for invoker in installing
+            ]
+
+        # Outputs are printed once all installs finished, one after the other.
+        failed: CalledProcessError | None = None
+        for invoker, future in zip(installing, futures, strict=True):
+            try:
+                output, returncode = future.result(), 0
+            except CalledProcessError as exc:
+                output, returncode = (exc.output or "") + (exc.stderr or ""), exc.returncode
+                failed = failed or exc
+            self._config.app.write_output(
+                output,
+                title=invoker.__class__.__name__,
+                returncode=returncode,
+                command_borders=self._config.command_borders,
+            )
+        if failed is not None:
+            util.sysexit_with_message(str(failed), code=failed.returncode)
 
     def _has_requirements_file(self) -> bool:
         has_file = False
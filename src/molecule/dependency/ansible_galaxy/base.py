@@ -22,14 +22,19 @@
 from __future__ import annotations
 
 import abc
+import contextlib
 import copy
+import hashlib
+import json
 import os
+import re
 
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 from molecule import util
 from molecule.dependency import base
+from molecule.exceptions import ConfigLoadError
 from molecule.reporting.definitions import CompletionState
 
 
@@ -39,16 +44,26 @@ if TYPE_CHECKING:
     from molecule.config import Config
 
 
+# Requirement types whose content can change without the requirements file changing.
+UNCACHED_TYPES = frozenset(("dir", "file", "subdirs"))
+_COLLECTION_NAME_RE = re.compile(r"^\w+\.\w+$")
+_ARCHIVE_SUFFIXES = (".git", ".tar.gz", ".tgz", ".tar")
+
+
 class AnsibleGalaxyBase(base.Base):
     """Ansible Galaxy dependency base class.
 
     Attributes:
         FILTER_OPTS: Keys to remove from the dictionary returned by options().
         COMMANDS: Arguments to send to ansible-galaxy to install the appropriate type of content.
+        INSTALLED_KEYS: Sections of the requirements file installed by COMMANDS.
+        PATH_OPTS: Options holding the directory content is installed into.
     """
 
     FILTER_OPTS: tuple[str, ...] = ()
     COMMANDS: tuple[str, ...] = ()
+    INSTALLED_KEYS: tuple[str, ...] = ()
+    PATH_OPTS: tuple[str, ...] = ()
 
     def __init__(self, config: Config) -> None:
         """Construct AnsibleGalaxy.
@@ -155,9 +170,22 @@ class AnsibleGalaxyBase(base.Base):
         Args:
             action_args: Arguments for this dependency. Unused.
         """
+        if self.needs_install():
+            self.install_requirements()
+
+    def needs_install(self) -> bool:
+        """Check whether the requirements still have to be installed.
+
+        When they do not, because the dependency is disabled, the requirements
+        file is missing or the requirements are already installed, the result
+        of the step is recorded.
+
+        Returns:
+            True if the requirements have to be installed.
+        """
         if not self.enabled:
             self._config.scenario.results.add_completion(CompletionState.disabled)
-            return
+            return False
         super().execute()
 
         if not self._has_requirements_file():
@@ -170,16 +198,293 @@ class AnsibleGalaxyBase(base.Base):
             self._config.scenario.results.add_completion(
                 CompletionState.missing(message=message, note=note),
             )
-            return
+            return False
+
+        if not self._sh_command:
+            self.bake()
+
+        self._setup()
+        stamp = self._stamp_path()
+        if stamp is not None and self._is_installed(stamp):
+            self._log.info("Skipping, requirements unchanged and already installed.")
+            self._config.scenario.results.add_completion(
+                CompletionState.skipped(note="Requirements unchanged"),
+            )
+            return False
+        return True
+
+    def install_requirements(self, *, capture: bool = False) -> str:
+        """Install the requirements, once :meth:`needs_install` asked for it.
+
+        Nothing is recorded in the results of the step, so that invokers can
+        install their requirements concurrently.
+
+        Args:
+            capture: Capture the output instead of printing it.
 
+        Returns:
+            The captured output, empty unless captured.
+        """
+        stamp = self._stamp_path()
+        output = self.execute_with_retries(capture=capture)
+        if stamp is not None:
+            self._record_installed(stamp)
+        return output
+
+    def pending_install(self) -> Path | None:
+        """Return the stamp of requirements that are not installed yet.
+
+        Returns:
+            Path to the stamp the install will record, or None when there is
+            nothing to install or the install cannot be recorded.
+        """
+        if not self.enabled or not self._has_requirements_file():
+            return None
         if not self._sh_command:
             self.bake()
+        stamp = self._stamp_path()
+        if stamp is None or self._requirement_candidates() is None or self._is_installed(stamp):
+            return None
+        return stamp
+
+    def install(self) -> bool:
+        """Install the requirements once, without reporting a result.
+
+        Used to install requirements ahead of the scenario sequences. Output is
+        only logged on failure, which the dependency step then reports when it
+        installs the requirements again.
 
+        Returns:
+            Whether the requirements were installed.
+        """
+        if not self._sh_command:
+            self.bake()
         self._setup()
-        self.execute_with_retries()
+        result = self._config.runtime.run(
+            args=self._sh_command,
+            env=self._config.runtime.environ,
+            tee=False,
+            set_acp=False,
+        )
+        if result.returncode != 0:
+            self._log.warning(
+                "Unable to install %s ahead of the scenarios:\n%s",
+                self.requirements_file,
+                result.stderr or result.stdout,
+            )
+            return False
+        if stamp := self._stamp_path():
+            self._record_installed(stamp)
+        return True
 
     def _setup(self) -> None:
         """Prepare the system for using ``ansible-galaxy`` and returns None."""
 
     def _has_requirements_file(self) -> bool:
         return Path(self.requirements_file).is_file()
+
+    def installs_collections(self) -> bool:
+        """Whether installing the requirements installs collections.
+
+        Returns:
+            True if the requirements file lists collections this command
+            installs, or cannot be read.
+        """
+        if "collections" not in self.INSTALLED_KEYS:
+            return False
+        try:
+            data = util.safe_load_file(self.requirements_file)
+        except (OSError, ConfigLoadError):
+            return True
+        return isinstance(data, dict) and bool(data.get("collections"))
+
+    def install_paths(self) -> list[Path]:
+        """Directories ``ansible-galaxy`` installs content into.
+
+        Returns:
+            The paths given in options first, then the configured ones.
+        """
+        options = self.options
+        ansible_config = self._config.runtime.config
+        paths = [str(options[key]) for key in self.PATH_OPTS if isinstance(options.get(key), str)]
+        for configured in (ansible_config.collections_paths, ansible_config.default_roles_path):
+            paths.extend([configured] if isinstance(configured, str) else configured)
+        return [Path(os.path.expanduser(path)) for path in dict.fromkeys(paths)]  # noqa: PTH111
+
+    def _stamp_path(self) -> Path | None:
+        """Return the stamp recording an install of the current requirements.
+
+        Stamps live in the project cache directory and are named after a digest
+        of the requirements, the command and the install paths, so every
+        scenario with the same requirements shares them.
+
+        Returns:
+            Path to the stamp, or None when installs are not cached.
+        """
+        if self.options.get("force") or not isinstance(self._sh_command, list):
+            return None
+        try:
+            requirements = Path(self.requirements_file).read_bytes()
+        except OSError:
+            return None
+
+        command = [arg for arg in self._sh_command if arg != self.requirements_file]
+        paths = [str(path) for path in self.install_paths()]
+        digest = hashlib.sha256(json.dumps([command, paths]).encode())
+        digest.update(requirements)
+        return self._config.runtime.cache_dir / "galaxy" / f"{digest.hexdigest()}.json"
+
+    def _requirement_candidates(self) -> list[list[Path]] | None:
+        """Return where the metadata file of each requirement can be.
+
+        Returns:
+            The candidate paths of each requirement, or None when the
+            installed content of a requirement cannot be verified.
+        """
+        try:
+            data = util.safe_load_file(self.requirements_file)
+        except (OSError, ConfigLoadError):
+            return None
+        if isinstance(data, list):
+            data = {"roles": data}
+        if not isinstance(data, dict):
+            return None
+
+        paths = self.install_paths()
+        requirements = []
+        for key in self.INSTALLED_KEYS:
+            for entry in data.get(key) or []:
+                candidates = _metadata_candidates(key, entry, paths)
+                if candidates is None:
+                    return None
+                requirements.append(candidates)
+        return requirements
+
+    def _installed_files(self) -> dict[str, str] | None:
+        """Locate the installed content of each requirement.
+
+        Returns:
+            The version of each requirement, keyed by the path of its metadata
+            file, or None when a requirement is not installed or its content
+            cannot be verified.
+        """
+        requirements = self._requirement_candidates()
+        if requirements is None:
+            return None
+        files: dict[str, str] = {}
+        for candidates in requirements:
+            found = next((path for path in candidates if path.is_file()), None)
+            if found is None:
+                return None
+            files[str(found)] = _installed_version(found)
+        return files
+
+    def _is_installed(self, stamp: Path) -> bool:
+        """Whether the content recorded by a stamp is still installed unchanged.
+
+        Args:
+            stamp: Path to the stamp.
+
+        Returns:
+            True if the install can be skipped.
+        """
+        try:
+            recorded = json.loads(stamp.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return False
+        files = self._installed_files()
+        if files is None or files.keys() != recorded.keys():
+            return False
+        return all(
+            files[path] == version and _mtime_ns(path) == mtime_ns
+            for path, (version, mtime_ns) in recorded.items()
+        )
+
+    def _record_installed(self, stamp: Path) -> None:
+        """Record the content installed for the current requirements.
+
+        Args:
+            stamp: Path to the stamp.
+        """
+        files = self._installed_files()
+        if files is None:
+            return
+        recorded = {path: (version, _mtime_ns(path)) for path, version in files.items()}
+        with contextlib.suppress(OSError):
+            stamp.parent.mkdir(parents=True, exist_ok=True)
+            util.atomic_write_file(stamp, json.dumps(recorded), "")
+
+
+def _metadata_candidates(key: str, entry: object, paths: list[Path]) -> list[Path] | None:
+    """Return where the metadata file of an installed requirement can be.
+
+    Args:
+        key: Section of the requirements file, ``roles`` or ``collections``.
+        entry: The requirement.
+        paths: Directories content is installed into.
+
+    Returns:
+        The candidate paths, in order, or None when the installed content of
+        the requirement cannot be verified.
+    """
+    if isinstance(entry, str) and key == "collections":
+        entry = {"name": entry}
+    elif isinstance(entry, str):
+        # Roles also accept the ``src,version,name`` form.
+        parts = entry.split(",")
+        entry = {"src": parts[0], "name": parts[2] if len(parts) > 2 else None}  # noqa: PLR2004
+    if not isinstance(entry, dict) or entry.get("type") in UNCACHED_TYPES:
+        return None
+
+    if key == "collections":
+        name = str(entry.get("name") or "")
+        if not _COLLECTION_NAME_RE.match(name):
+            return None
+        return [
+            (path.parent if path.name == "ansible_collections" else path)
+            / "ansible_collections"
+            / Path(*name.split("."))
+            / "MANIFEST.json"
+            for path in paths
+        ]
+
+    name = str(entry.get("name") or entry.get("src") or "").rstrip("/").rsplit("/", 1)[-1]
+    for suffix in _ARCHIVE_SUFFIXES:
+        name = name.removesuffix(suffix)
+    if not name or name.startswith("."):
+        return None
+    return [path / name / "meta" / ".galaxy_install_info" for path in paths]
+
+
+def _installed_version(path: Path) -> str:
+    """Read the version recorded in the metadata of installed content.
+
+    Args:
+        path: ``MANIFEST.json`` of a collection or ``.galaxy_install_info`` of a role.
+
+    Returns:
+        The installed version, empty if unknown.
+    """
+    with contextlib.suppress(
+        OSError, ValueError, LookupError, TypeError, AttributeError, ConfigLoadError
+    ):
+        if path.name == "MANIFEST.json":
+            data = json.loads(path.read_text(encoding="utf-8"))
+            return str(data["collection_info"]["version"])
+        return str((util.safe_load_file(path) or {}).get("version", ""))
+    return ""
+
+
+def _mtime_ns(path: str) -> int | None:
+    """Return the modification time of a file.
+
+    Args:
+        path: The file.
+
+    Returns:
+        The modification time in nanoseconds, None if the file is missing.
+    """
+    try:
+        return Path(path).stat().st_mtime_ns
+    except OSError:
+        return None
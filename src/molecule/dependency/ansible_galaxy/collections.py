@@ -6,6 +6,7 @@ from pathlib import Path
 from typing import TYPE_CHECKING, cast
 
 from molecule import util
+from molecule.dependency import artifacts
 from molecule.dependency.ansible_galaxy.base import AnsibleGalaxyBase
 
 
@@ -19,10 +20,14 @@ class Collections(AnsibleGalaxyBase):
     Attributes:
         FILTER_OPTS: Keys to remove from the dictionary returned by options().
         COMMANDS: Arguments to send to ansible-galaxy to install the appropriate type of content.
+        INSTALLED_KEYS: Sections of the requirements file installed by COMMANDS.
+        PATH_OPTS: Options holding the directory content is installed into.
     """
 
     FILTER_OPTS = ("role-file",)
     COMMANDS = ("collection", "install")
+    INSTALLED_KEYS = ("collections",)
+    PATH_OPTS = ("collections-path", "p")
 
     @property
     def default_options(self) -> MutableMapping[str, str | bool]:
@@ -54,3 +59,59 @@ class Collections(AnsibleGalaxyBase):
             Path to the requirements file for this dependency.
         """
         return cast("str", self.options["requirements-file"])
+
+    def install(self) -> bool:
+        """Install the collections once, from the artifact cache when possible.
+
+        Returns:
+            Whether the collections were installed.
+        """
+        if not self._sh_command:
+            self.bake()
+        if not self._install_from_artifacts():
+            return super().install()
+        if stamp := self._stamp_path():
+            self._record_installed(stamp)
+        return True
+
+    def execute_with_retries(self, *, capture: bool = False) -> str:
+        """Install the collections from the artifact cache, or from the network.
+
+        Args:
+            capture: Capture the output instead of printing it.
+
+        Returns:
+            The captured output, empty unless captured.
+        """
+        output: list[str] | None = [] if capture else None
+        if self._install_from_artifacts(output):
+            self._log.info("Dependency completed successfully from the artifact cache.")
+            return "".join(output or [])
+        return "".join(output or []) + super().execute_with_retries(capture=capture)
+
+    def _install_from_artifacts(self, output: list[str] | None = None) -> bool:
+        """Install the collections from cached artifacts, caching missing ones first.
+
+        Args:
+            output: Collects the output of the install instead of printing it.
+
+        Returns:
+            Whether the collections were installed, False when the
+            requirements cannot be served from galaxy artifacts.
+        """
+        options = self.options
+        if (
+            options.get("force")
+            or not isinstance(self._sh_command, list)
+            or "--requirements-file" not in self._sh_command
+        ):
+            return False
+        requirements = artifacts.collection_requirements(self.requirements_file)
+        if not requirements:
+            return False
+
+        cmd = list(self._sh_command)
+        index = cmd.index("--requirements-file")
+        del cmd[index : index + 2]
+        cache = artifacts.ArtifactCache.from_config(self._config)
+        return cache.install(self._config, cmd, requirements, options, output=output)
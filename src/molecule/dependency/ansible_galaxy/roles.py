@@ -19,10 +19,14 @@ class Roles(AnsibleGalaxyBase):
     Attributes:
         FILTER_OPTS: Keys to remove from the dictionary returned by options().
         COMMANDS: Arguments to send to ansible-galaxy to install the appropriate type of content.
+        INSTALLED_KEYS: Sections of the requirements file installed by COMMANDS.
+        PATH_OPTS: Options holding the directory content is installed into.
     """
 
     FILTER_OPTS = ("requirements-file",)
     COMMANDS = ("install",)
+    INSTALLED_KEYS = ("roles", "collections")
+    PATH_OPTS = ("roles-path", "p")
 
     @property
     def default_options(self) -> MutableMapping[str, str | bool]:
@@ -0,0 +1,413 @@
+"""Content-addressable cache of galaxy collection artifacts.
+
+Collection tarballs downloaded by ``ansible-galaxy collection download`` are
+stored once, named after their sha256, in the ``artifacts`` directory of the
+runtime cache directory. An index keyed by namespace, name and version records
+the digest and the dependencies of each artifact.
+
+Requirements are installed from the newest cached tarballs satisfying them,
+including their dependencies, with ``--offline``. Only the requirements
+without a matching artifact are downloaded into the cache first, unless the
+``offline`` option is set. The ``upgrade`` option downloads every requirement,
+so that they resolve to the newest versions the galaxy server offers.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import re
+import shutil
+import tarfile
+import tempfile
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from packaging.specifiers import InvalidSpecifier, SpecifierSet
+from packaging.version import InvalidVersion, Version
+
+from molecule import util
+from molecule.exceptions import ConfigLoadError, MoleculeError
+
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from molecule.config import Config
+
+
+LOG = logging.getLogger(__name__)
+
+ARTIFACT_SUFFIX = ".tar.gz"
+# Options of ``ansible-galaxy collection install`` also accepted by download.
+DOWNLOAD_OPTS = ("api-key", "c", "ignore-certs", "pre", "s", "server", "timeout", "token")
+
+_COLLECTION_NAME_RE = re.compile(r"^\w+\.\w+$")
+_OPERATOR_RE = re.compile(r"^(==|!=|>=|<=|>|<)")
+
+
+class Artifact(NamedTuple):
+    """A cached collection tarball.
+
+    Attributes:
+        name: Fully qualified collection name.
+        version: Version of the collection.
+        path: Path to the tarball.
+        dependencies: Version range of each collection it depends on.
+    """
+
+    name: str
+    version: str
+    path: Path
+    dependencies: dict[str, str]
+
+
+def matches(version: str, spec: str, *, pre: bool = False) -> bool:
+    """Whether a version satisfies a galaxy version range.
+
+    Args:
+        version: The version.
+        spec: The range, ``*`` or comma separated clauses, a bare version
+            meaning that exact version.
+        pre: Whether pre-releases satisfy ranges that do not name them.
+
+    Returns:
+        True if the version is in the range.
+    """
+    clauses = [clause.strip() for clause in str(spec or "*").split(",") if clause.strip() != "*"]
+    try:
+        specifier = SpecifierSet(
+            ",".join(clause if _OPERATOR_RE.match(clause) else f"=={clause}" for clause in clauses),
+        )
+        return specifier.contains(Version(version), prereleases=pre or bool(specifier.prereleases))
+    except (InvalidSpecifier, InvalidVersion):
+        return False
+
+
+def collection_requirements(requirements_file: str) -> dict[str, str] | None:
+    """Read the collections of a requirements file.
+
+    Args:
+        requirements_file: Path to the requirements file.
+
+    Returns:
+        The version range of each collection, or None when a collection is not
+        installed from a galaxy server.
+    """
+    try:
+        data = util.safe_load_file(requirements_file)
+    except (OSError, ConfigLoadError):
+        return None
+    if not isinstance(data, dict):
+        return None
+
+    requirements: dict[str, str] = {}
+    for entry in data.get("collections") or []:
+        requirement = {"name": entry} if isinstance(entry, str) else entry
+        if not isinstance(requirement, dict) or requirement.get("type", "galaxy") != "galaxy":
+            return None
+        name = str(requirement.get("name") or "")
+        if not _COLLECTION_NAME_RE.match(name):
+            return None
+        requirements[name] = str(requirement.get("version") or "*")
+    return requirements
+
+
+def _read_manifest(path: Path) -> dict[str, Any] | None:
+    """Read the collection info of a collection tarball.
+
+    Args:
+        path: Path to the tarball.
+
+    Returns:
+        The ``collection_info`` of its MANIFEST.json, or None if unreadable.
+    """
+    try:
+        with tarfile.open(path, "r:gz") as tar:
+            manifest = tar.extractfile("MANIFEST.json")
+            if manifest is None:
+                return None
+            info = json.load(manifest)["collection_info"]
+    except (OSError, tarfile.TarError, KeyError, TypeError, ValueError):
+        return None
+    return info if isinstance(info, dict) else None
+
+
+class ArtifactCache:
+    """Collection tarballs, keyed by name and version, stored by sha256."""
+
+    def __init__(self, directory: Path) -> None:
+        """Initialize the cache.
+
+        Args:
+            directory: Directory holding the cache.
+        """
+        self.directory = directory
+
+    @classmethod
+    def from_config(cls, config: Config) -> ArtifactCache:
+        """Return the artifact cache of a project.
+
+        Args:
+            config: Configuration of a scenario of the project.
+
+        Returns:
+            The cache.
+        """
+        return cls(config.runtime.cache_dir / "artifacts")
+
+    def _index_directory(self, name: str) -> Path:
+        """Return the directory indexing the versions of a collection.
+
+        Args:
+            name: Fully qualified collection name.
+
+        Returns:
+            Path to the directory, holding one entry per version.
+        """
+        return self.directory / "index" / Path(*name.split(".", 1))
+
+    def add(self, tarball: Path) -> Artifact | None:
+        """Store a collection tarball.
+
+        Args:
+            tarball: Path to the tarball, left in place.
+
+        Returns:
+            The cached artifact, or None if the tarball is not a collection.
+        """
+        info = _read_manifest(tarball)
+        if info is None:
+            return None
+        name = f"{info.get('namespace')}.{info.get('name')}"
+        version = str(info.get("version"))
+        dependencies = {str(k): str(v) for k, v in (info.get("dependencies") or {}).items()}
+
+        digest = hashlib.sha256()
+        with tarball.open("rb") as stream:
+            for chunk in iter(lambda: stream.read(1 << 20), b""):
+                digest.update(chunk)
+        blob = self.directory / "sha256" / f"{digest.hexdigest()}{ARTIFACT_SUFFIX}"
+        blob.parent.mkdir(parents=True, exist_ok=True)
+        if not blob.exists():
+            fd, tmp_name = tempfile.mkstemp(dir=blob.parent, suffix=".tmp")
+            os.close(fd)
+            shutil.copyfile(tarball, tmp_name)
+            Path(tmp_name).replace(blob)
+
+        index = self._index_directory(name) / f"{version}.json"
+        index.parent.mkdir(parents=True, exist_ok=True)
+        entry = {"sha256": digest.hexdigest(), "dependencies": dependencies}
+        util.atomic_write_file(index, json.dumps(entry), "")
+        return Artifact(name, version, blob, dependencies)
+
+    def versions(self, name: str) -> list[Artifact]:
+        """Return the cached versions of a collection.
+
+        Args:
+            name: Fully qualified collection name.
+
+        Returns:
+            The cached artifacts, newest first.
+        """
+        artifacts = []
+        with contextlib.suppress(OSError):
+            for index in self._index_directory(name).glob("*.json"):
+                with contextlib.suppress(OSError, ValueError, KeyError):
+                    entry = json.loads(index.read_text(encoding="utf-8"))
+                    blob = self.directory / "sha256" / f"{entry['sha256']}{ARTIFACT_SUFFIX}"
+                    if blob.is_file():
+                        artifacts.append(Artifact(name, index.stem, blob, entry["dependencies"]))
+
+        def key(artifact: Artifact) -> tuple[int, Version | str]:
+            try:
+                return (1, Version(artifact.version))
+            except InvalidVersion:
+                return (0, artifact.version)
+
+        return sorted(artifacts, key=key, reverse=True)
+
+    def resolve(self, requirements: dict[str, str], *, pre: bool = False) -> list[Path] | None:
+        """Select cached artifacts satisfying requirements and their dependencies.
+
+        The newest matching version of each collection is picked, without
+        backtracking on conflicts.
+
+        Args:
+            requirements: Version range of each required collection.
+            pre: Whether pre-releases satisfy ranges that do not name them.
+
+        Returns:
+            Paths of the tarballs to install, or None if an artifact is missing.
+        """
+        chosen: dict[str, Artifact] = {}
+        pending = list(requirements.items())
+        while pending:
+            name, spec = pending.pop()
+            if name in chosen:
+                if not matches(chosen[name].version, spec, pre=pre):
+                    return None
+                continue
+            artifact = next(
+                (a for a in self.versions(name) if matches(a.version, spec, pre=pre)),
+                None,
+            )
+            if artifact is None:
+                return None
+            chosen[name] = artifact
+            pending.extend(artifact.dependencies.items())
+        return [artifact.path for artifact in chosen.values()]
+
+    def download(self, config: Config, args: list[str]) -> bool:
+        """Download collections and their dependencies into the cache.
+
+        Args:
+            config: Configuration of the scenario.
+            args: Arguments of ``ansible-galaxy collection download`` selecting
+                the collections.
+
+        Returns:
+            Whether the download succeeded.
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with tempfile.TemporaryDirectory(dir=self.directory) as download_dir:
+            cmd = ["ansible-galaxy", "collection", "download", "-p", download_dir, *args]
+            result = config.runtime.run(
+                args=cmd,
+                env=config.runtime.environ,
+                tee=False,
+                set_acp=False,
+            )
+            if result.returncode != 0:
+                LOG.debug("Unable to download %s:\n%s", args, result.stderr or result.stdout)
+                return False
+            for tarball in Path(download_dir).glob(f"*{ARTIFACT_SUFFIX}"):
+                self.add(tarball)
+        return True
+
+    def install(  # noqa: PLR0913
+        self,
+        config: Config,
+        cmd: list[str],
+        requirements: dict[str, str],
+        options: Mapping[str, str | bool] | None = None,
+        *,
+        env: Mapping[str, str] | None = None,
+        output: list[str] | None = None,
+    ) -> bool:
+        """Install collections from cached artifacts, downloading missing ones.
+
+        Nothing is downloaded when cached artifacts satisfy the requirements,
+        unless the ``upgrade`` option is set, nor when ``offline`` is set.
+
+        Args:
+            config: Configuration of the scenario.
+            cmd: The ``ansible-galaxy collection install`` command, without
+                the collections to install.
+            requirements: Version range of each collection to install.
+            options: Install options, those of DOWNLOAD_OPTS are also used to
+                download the artifacts.
+            env: Environment to install with, capturing the output, instead of
+                printing it.
+            output: Collects the output of the install instead of printing it.
+
+        Returns:
+            Whether the collections were installed.
+        """
+        options = options or {}
+        pre = bool(options.get("pre"))
+        upgrade = bool(options.get("upgrade"))
+        if not options.get("offline") and (upgrade or self.resolve(requirements, pre=pre) is None):
+            # Requirements resolving on their own may still conflict together,
+            # all of them are then downloaded.
+            missing = {
+                name: spec
+                for name, spec in requirements.items()
+                if upgrade or self.resolve({name: spec}, pre=pre) is None
+            } or requirements
+            download_options = {k: v for k, v in options.items() if k in DOWNLOAD_OPTS}
+            args = [
+                *util.dict2args(download_options),
+                *(f"{name}:{spec}" for name, spec in missing.items()),
+            ]
+            if not self.download(config, args):
+                LOG.warning(
+                    "Unable to download %s, installing cached artifacts.",
+                    ", ".join(missing),
+                )
+        tarballs = self.resolve(requirements, pre=pre)
+        if tarballs is None:
+            return False
+        install_cmd = [*cmd, "--offline", *(str(tarball) for tarball in tarballs)]
+        if env is not None:
+            result = config.runtime.run(args=install_cmd, env=dict(env), tee=False, set_acp=False)
+            if result.returncode != 0:
+                LOG.debug("Unable to install %s:\n%s", install_cmd, result.stderr or result.stdout)
+        else:
+            result = config.app.run_command(
+                install_cmd,
+                debug=config.debug,
+                command_borders=config.command_borders,
+                capture=output is not None,
+            )
+            if output is not None:
+                output.append((result.stdout or "") + (result.stderr or ""))
+        return result.returncode == 0
+
+
+def _installed_version(config: Config, name: str) -> str | None:
+    """Return the installed version of a collection.
+
+    Args:
+        config: Configuration of the scenario.
+        name: Fully qualified collection name.
+
+    Returns:
+        The version found first in the collection paths, None if not installed.
+    """
+    for path in config.runtime.config.collections_paths:
+        manifest = Path(path) / "ansible_collections" / Path(*name.split(".", 1)) / "MANIFEST.json"
+        with contextlib.suppress(OSError, ValueError, KeyError, TypeError):
+            return str(
+                json.loads(manifest.read_text(encoding="utf-8"))["collection_info"]["version"]
+            )
+    return None
+
+
+def require_collection(config: Config, name: str, version: str | None) -> None:
+    """Make sure a collection required by the driver is installed.
+
+    A missing or outdated collection is installed through the artifact cache,
+    quietly, into the first collection path, where ``runtime.require_collection``
+    would install it.
+
+    Args:
+        config: Configuration of the scenario.
+        name: Fully qualified collection name.
+        version: Minimal version required.
+
+    Raises:
+        MoleculeError: If the collection could not be installed.
+    """
+    spec = f">={version}" if version else "*"
+    installed = _installed_version(config, name)
+    if installed is not None and matches(installed, spec, pre=True):
+        return
+    cmd = ["ansible-galaxy", "collection", "install"]
+    env = {
+        **config.runtime.environ,
+        "ANSIBLE_COLLECTIONS_PATH": ":".join(config.runtime.config.collections_paths),
+    }
+    # Like ``runtime.require_collection``, only ask for pre-releases when the
+    # minimal version is one.
+    pre = False
+    with contextlib.suppress(InvalidVersion, TypeError):
+        pre = Version(str(version)).is_prerelease
+    cache = ArtifactCache.from_config(config)
+    if not cache.install(config, cmd, {name: spec}, {"pre": pre}, env=env):
+        msg = f"Unable to install collection {name}:{spec} required by the driver."
+        raise MoleculeError(msg)
@@ -23,12 +23,12 @@ from __future__ import annotations
 
 import abc
 import os
-import time
 
 from subprocess import CalledProcessError
 from typing import TYPE_CHECKING
 
 from molecule import logger, util
+from molecule.dependency import artifacts, retry
 
 
 if TYPE_CHECKING:
@@ -42,13 +42,15 @@ class Base(abc.ABC):
 
     Attributes:
         RETRY: Number of times to retry the dependency.
-        SLEEP: Number of seconds to sleep between retries.
-        BACKOFF: Additional number of seconds to sleep for each successive attempt.
+        SLEEP: Number of seconds to sleep before the first retry.
+        BACKOFF: Factor growing the sleep for each successive retry.
+        DEADLINE: Number of seconds after which no retry is started.
     """
 
     RETRY = 3
     SLEEP = 3
-    BACKOFF = 3
+    BACKOFF = 2
+    DEADLINE = 120
 
     def __init__(self, config: Config) -> None:
         """Initialize code for all :ref:`Dependency` classes.
@@ -58,6 +60,12 @@ class Base(abc.ABC):
         """
         self._config = config
         self._sh_command: str | list[str] = []
+        self.retry_policy = retry.RetryPolicy(
+            retries=self.RETRY,
+            delay=self.SLEEP,
+            factor=self.BACKOFF,
+            deadline=self.DEADLINE,
+        )
 
     @property
     def _log(self) -> logger.ScenarioLoggerAdapter:
@@ -70,44 +78,38 @@ class Base(abc.ABC):
         step_name = getattr(self._config, "action", "dependency")
         return logger.get_scenario_logger(__name__, self._config.scenario.name, step_name)
 
-    def execute_with_retries(self) -> None:
-        """Run dependency downloads with retry and timed back-off."""
+    def execute_with_retries(self, *, capture: bool = False) -> str:
+        """Run dependency downloads, retrying transient failures with jittered back-off.
+
+        Args:
+            capture: Capture the output instead of printing it, for installs
+                running concurrently. A failure is then raised, for the caller
+                to print the output of the last attempt first.
+
+        Returns:
+            The captured output, empty unless captured.
+
+        Raises:
+            CalledProcessError: If the last attempt failed while capturing.
+        """
         try:
-            self._config.app.run_command(
-                self._sh_command,
-                debug=self._config.debug,
-                check=True,
-                command_borders=self._config.command_borders,
-            )
-            msg = "Dependency completed successfully."
-            self._log.info(msg)
-            return  # noqa: TRY300
-        except CalledProcessError:
-            pass
-
-        for counter in range(1, (self.RETRY + 1)):
-            msg = f"Retrying dependency ... {counter:d}/{self.RETRY:d} time(s)"
-            self._log.warning(msg)
-
-            msg = f"Sleeping for {self.SLEEP:d} seconds before retrying ..."
-            self._log.warning(msg)
-            time.sleep(self.SLEEP)
-            self.SLEEP += self.BACKOFF
-
-            try:
-                self._config.app.run_command(
+            result = self.retry_policy.call(
+                lambda: self._config.app.run_command(
                     self._sh_command,
                     debug=self._config.debug,
                     check=True,
                     command_borders=self._config.command_borders,
-                )
-                msg = "Dependency completed successfully."
-                self._log.info(msg)
-                return  # noqa: TRY300
-            except CalledProcessError as _exception:
-                exception = _exception
-
-        util.sysexit_with_message(str(exception), code=exception.returncode)
+                    capture=capture,
+                ),
+                self._log,
+            )
+        except CalledProcessError as exception:
+            if capture:
+                raise
+            util.sysexit_with_message(str(exception), code=exception.returncode)
+        msg = "Dependency completed successfully."
+        self._log.info(msg)
+        return (result.stdout or "") + (result.stderr or "") if capture else ""
 
     @abc.abstractmethod
     def execute(
@@ -120,7 +122,7 @@ class Base(abc.ABC):
             action_args: Arguments for dependency resolvers. Unused.
         """
         for name, version in self._config.driver.required_collections.items():
-            self._config.runtime.require_collection(name, version)
+            artifacts.require_collection(self._config, name, version)
 
     @property
     @abc.abstractmethod
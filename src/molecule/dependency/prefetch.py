@@ -0,0 +1,90 @@
+"""Install the galaxy requirements of every selected scenario up front.
+
+When several scenarios run the dependency step, the distinct requirement sets
+they list are collected before the scenario sequences start, installed once
+each and recorded in the requirements cache shared by all scenarios. The
+dependency step of each scenario then finds its requirements installed and
+skips ``ansible-galaxy``.
+
+Sets installed into different directories are installed concurrently. Sets
+sharing a directory are installed one after the other, as concurrent
+``ansible-galaxy`` runs replace content the other one is extracting.
+"""
+
+from __future__ import annotations
+
+import logging
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+from molecule.dependency.ansible_galaxy import AnsibleGalaxy
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from molecule.config import Config
+    from molecule.dependency.ansible_galaxy.base import AnsibleGalaxyBase
+
+
+LOG = logging.getLogger(__name__)
+
+
+def pending(configs: list[Config]) -> list[AnsibleGalaxyBase]:
+    """Return one installer for each distinct requirement set not installed yet.
+
+    Args:
+        configs: Configurations of the selected scenarios.
+
+    Returns:
+        The installers, in scenario order.
+    """
+    installers: dict[Path, AnsibleGalaxyBase] = {}
+    for config in configs:
+        if "dependency" not in config.scenario.sequence:
+            continue
+        dependency = config.dependency
+        if not isinstance(dependency, AnsibleGalaxy):
+            continue
+        for invoker in dependency.invocations:
+            stamp = invoker.pending_install()
+            if stamp is not None:
+                installers.setdefault(stamp, invoker)
+    return list(installers.values())
+
+
+def _install_all(installers: list[AnsibleGalaxyBase]) -> None:
+    """Install requirement sets one after the other.
+
+    Args:
+        installers: Installers of requirement sets sharing install paths.
+    """
+    for installer in installers:
+        installer.install()
+
+
+def install_requirements(configs: list[Config]) -> None:
+    """Install the distinct requirement sets of the selected scenarios.
+
+    Nothing is done for fewer than two sets, the dependency step of the
+    scenarios then installs them as usual. Failures are left to the
+    dependency step to retry and report.
+
+    Args:
+        configs: Configurations of the selected scenarios.
+    """
+    installers = pending(configs)
+    if len(installers) < 2:  # noqa: PLR2004
+        return
+
+    groups: dict[tuple[Path, ...], list[AnsibleGalaxyBase]] = {}
+    for installer in installers:
+        groups.setdefault(tuple(installer.install_paths()), []).append(installer)
+    LOG.info(
+        "Installing %d distinct dependency requirement sets of %d scenarios.",
+        len(installers),
+        len(configs),
+    )
+    with ThreadPoolExecutor(max_workers=len(groups)) as executor:
+        list(executor.map(_install_all, groups.values()))
@@ -0,0 +1,129 @@
+"""Retry of dependency installs that fail for transient reasons.
+
+Failures are classified from the output of the failed command. Network errors,
+timeouts and server errors are retried with jittered exponential back-off until
+the attempts or the deadline run out. Anything recognized as permanent, like a
+malformed requirements file or a collection that does not exist, fails at
+once. Unrecognized failures are retried, as before.
+"""
+
+from __future__ import annotations
+
+import random
+import re
+
+from dataclasses import dataclass
+from subprocess import CalledProcessError
+from time import monotonic, sleep
+from typing import TYPE_CHECKING, TypeVar
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from molecule.logger import ScenarioLoggerAdapter
+
+
+T = TypeVar("T")
+
+# Return codes of commands that could not be run at all.
+PERMANENT_RETURN_CODES = frozenset((126, 127))
+TRANSIENT_RE = re.compile(
+    r"timed? ?out|temporary failure|connection (?:refused|reset|aborted)"
+    r"|remote end closed|network is unreachable|name or service not known"
+    r"|unknown error when attempting to call galaxy|http error (?:408|429|5\d\d)"
+    r"|bad gateway|service unavailable|too many requests|eof occurred in violation",
+    re.IGNORECASE,
+)
+PERMANENT_RE = re.compile(
+    r"http error (?:400|401|403|404)|failed to resolve the requested dependencies"
+    r"|failed to find collection|could not satisfy|not found on the galaxy server"
+    r"|unable to find|does not exist|is not a valid|invalid (?:collection|role|requirement)"
+    r"|error parsing|syntax error|expected .+ format|unknown option|unrecognized arguments",
+    re.IGNORECASE,
+)
+
+
+def is_transient(error: CalledProcessError) -> bool:
+    """Whether a failed command is worth running again.
+
+    Args:
+        error: The failure.
+
+    Returns:
+        False for failures that fail the same way again, True otherwise.
+    """
+    if error.returncode in PERMANENT_RETURN_CODES or error.returncode < 0:
+        return False
+    output = "\n".join(str(text) for text in (error.stdout, error.stderr) if text)
+    if TRANSIENT_RE.search(output):
+        return True
+    return not PERMANENT_RE.search(output)
+
+
+@dataclass
+class RetryPolicy:
+    """How often and how long to retry.
+
+    Attributes:
+        retries: Maximum number of attempts after the first one.
+        delay: Sleep before the first retry, in seconds.
+        factor: Growth of the sleep for each successive retry.
+        deadline: Time after which no retry is started, in seconds.
+    """
+
+    retries: int = 3
+    delay: float = 3
+    factor: float = 2
+    deadline: float = 120
+
+    def sleep_time(self, attempt: int) -> float:
+        """Return the jittered sleep before a retry.
+
+        Half of the exponential delay is fixed, the other half is random, so
+        concurrent runs do not retry in lockstep.
+
+        Args:
+            attempt: Number of the retry, starting at 0.
+
+        Returns:
+            Seconds to sleep.
+        """
+        delay = self.delay * self.factor**attempt
+        return delay / 2 + random.uniform(0, delay / 2)  # noqa: S311
+
+    def call(self, func: Callable[[], T], log: ScenarioLoggerAdapter) -> T:
+        """Call a function, retrying transient failures.
+
+        Args:
+            func: Function running the command, raising CalledProcessError.
+            log: Logger reporting the retries.
+
+        Returns:
+            The result of the first successful call.
+
+        Raises:
+            CalledProcessError: The last failure, once it is permanent or the
+                attempts or the deadline ran out.
+        """
+        start = monotonic()
+        attempt = 0
+        while True:
+            try:
+                return func()
+            except CalledProcessError as exc:
+                if attempt >= self.retries:
+                    raise
+                if not is_transient(exc):
+                    log.warning("Not retrying, the failure is not transient.")
+                    raise
+                delay = self.sleep_time(attempt)
+                if monotonic() - start + delay > self.deadline:
+                    log.warning(
+                        "Not retrying, the retry deadline of %ss is exceeded.", self.deadline
+                    )
+                    raise
+            attempt += 1
+            log.warning("Retrying dependency ... %d/%d time(s)", attempt, self.retries)
+            log.warning("Sleeping for %.1f seconds before retrying ...", delay)
+            sleep(delay)
@@ -278,15 +278,22 @@ class Driver(ABC):
     def _get_ssh_connection_options(self) -> list[str]:
         # LogLevel=ERROR is needed in order to avoid warnings like:
         # Warning: Permanently added ... to the list of known hosts.
-        return [
+        from molecule import ssh_pool  # noqa: PLC0415
+
+        pooled = ssh_pool.enabled()
+        control_persist = ssh_pool.CONTROL_PERSIST if pooled else "60s"
+        options = [
             "-o UserKnownHostsFile=/dev/null",
             "-o ControlMaster=auto",
-            "-o ControlPersist=60s",
+            f"-o ControlPersist={control_persist}",
             "-o ForwardX11=no",
             "-o LogLevel=ERROR",
             "-o IdentitiesOnly=yes",
             "-o StrictHostKeyChecking=no",
         ]
+        if pooled:
+            options.append(f"-o ControlPath={ssh_pool.control_path()}")
+        return options
 
     def _created(self) -> str:
         return str(self._config.state.created).lower()
@@ -372,6 +379,59 @@ class Driver(ABC):
             return str(p)
         return None
 
+    def snapshot(self, name: str) -> bool:  # noqa: ARG002
+        """Save the created and prepared instances of the scenario.
+
+        Drivers able to recreate instances from a saved image override this
+        and :meth:`restore`, letting later runs skip create and prepare.
+
+        Args:
+            name: Name identifying the snapshot.
+
+        Returns:
+            Whether a snapshot was taken. The base driver does not support snapshots.
+        """
+        return False
+
+    def restore(self, name: str) -> bool:  # noqa: ARG002
+        """Recreate the instances of the scenario from a snapshot.
+
+        Args:
+            name: Name of a snapshot taken earlier by :meth:`snapshot`.
+
+        Returns:
+            Whether the instances were restored.
+        """
+        return False
+
+    def clone(self, name: str, entry: str, instance_config: str) -> bool:  # noqa: ARG002
+        """Create an extra set of instances from a snapshot, for the instance pool.
+
+        The instances must not clash with those of the scenario or of other
+        pool entries, so drivers name them after ``entry``.
+
+        Args:
+            name: Name of a snapshot taken earlier by :meth:`snapshot`.
+            entry: Identifier of the pool entry.
+            instance_config: Path to write the instance config of the clones to.
+
+        Returns:
+            Whether the instances were cloned. The base driver does not clone.
+        """
+        return False
+
+    def discard(self, entry: str, instance_config: str) -> bool:  # noqa: ARG002
+        """Destroy a set of instances created by :meth:`clone`.
+
+        Args:
+            entry: Identifier of the pool entry.
+            instance_config: Path to the instance config of the clones.
+
+        Returns:
+            Whether the instances were destroyed.
+        """
+        return False
+
     def schema_file(self) -> str | None:  # pragma: no cover
         """Return schema file path.
 
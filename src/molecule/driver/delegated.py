@@ -41,6 +41,11 @@ if TYPE_CHECKING:
 
 LOG = get_logger(__name__)
 
+# `ansible-inventory --list` hostvars keyed by the digest of the written
+# inventory and the inventory sources, so each inventory is only queried once
+# per invocation.
+_INVENTORY_HOSTVARS_CACHE: dict[tuple[str, ...], dict[str, dict[str, Any]]] = {}
+
 
 class Delegated(Driver):
     """The Default driver.
@@ -59,6 +64,7 @@ class Delegated(Driver):
         """
         super().__init__(config)
         self._name = "default"
+        self._instance_config_cache: tuple[tuple[int, int], dict[str, dict[str, Any]]] | None = None
 
     @property
     def name(self) -> str:
@@ -137,7 +143,7 @@ class Delegated(Driver):
 
             try:
                 return util.merge_dicts(d, self._get_instance_config(instance_name))
-            except (StopIteration, OSError):
+            except (KeyError, OSError):
                 # instance_config.yml doesn't exist, or has no entry for
                 # this instance - e.g. an ansible-native scenario (no
                 # `platforms` declared), whose create playbook has no
@@ -239,9 +245,10 @@ class Delegated(Driver):
             Dictionary of options related to logging into the instance, or
             an empty dictionary if none could be resolved.
         """
-        host_vars = self._run_ansible_inventory(["--host", instance_name])
-        if host_vars is None:
+        inventory_hostvars = self._get_inventory_hostvars()
+        if inventory_hostvars is None or instance_name not in inventory_hostvars:
             return {}
+        host_vars = inventory_hostvars[instance_name]
 
         d = {}
         if "ansible_host" in host_vars:
@@ -268,10 +275,35 @@ class Delegated(Driver):
             Sorted list of host names found in the inventory, or an empty
             list if none could be resolved.
         """
+        inventory_hostvars = self._get_inventory_hostvars()
+        if inventory_hostvars is None:
+            return []
+        return sorted(inventory_hostvars)
+
+    def _get_inventory_hostvars(self) -> dict[str, dict[str, Any]] | None:
+        """Variables of every inventory host, from a single `ansible-inventory --list`.
+
+        The result is cached for the rest of the invocation, keyed by the
+        digest the provisioner computes each time it writes the inventory, so
+        looking up many hosts costs one ansible-inventory run rather than one
+        per host. Failed queries are not cached, nor are queries made before
+        the inventory was written.
+
+        Returns:
+            A dict mapping host names to their variables, or None if the
+            inventory could not be queried.
+        """
+        digest = self._config.provisioner.inventory_digest if self._config.provisioner else None
+        key = (digest or "", *self._ansible_inventory_args())
+        if digest is not None and key in _INVENTORY_HOSTVARS_CACHE:
+            return _INVENTORY_HOSTVARS_CACHE[key]
         data = self._run_ansible_inventory(["--list"])
         if data is None:
-            return []
-        return sorted(data.get("_meta", {}).get("hostvars", {}).keys())
+            return None
+        hostvars: dict[str, dict[str, Any]] = data.get("_meta", {}).get("hostvars", {})
+        if digest is not None:
+            _INVENTORY_HOSTVARS_CACHE[key] = hostvars
+        return hostvars
 
     def ansible_connection_options(
         self,
@@ -320,7 +352,7 @@ class Delegated(Driver):
                 conn_dict["ansible_ssh_common_args"] = " ".join(
                     self.ssh_connection_options,
                 )
-            except StopIteration:
+            except KeyError:
                 return {}
             except OSError:
                 # Instance has yet to be provisioned , therefore the
@@ -337,9 +369,106 @@ class Delegated(Driver):
         return "unknown"
 
     def _get_instance_config(self, instance_name: str) -> dict[str, Any]:
-        instance_config_dict = util.safe_load_file(self._config.driver.instance_config)
+        return self._get_instance_config_index()[instance_name]
+
+    def _get_instance_config_index(self) -> dict[str, dict[str, Any]]:
+        """Instance config entries keyed by instance name.
+
+        The inventory asks for the connection options of every host in
+        every group, so the parsed file is kept until its mtime or size
+        changes rather than being re-read for each lookup.
+
+        Returns:
+            A dict mapping instance names to their instance_config entry.
+        """
+        path = Path(self._config.driver.instance_config)
+        try:
+            stat = path.stat()
+            signature: tuple[int, int] | None = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            signature = None
+
+        if (
+            signature is not None
+            and self._instance_config_cache is not None
+            and self._instance_config_cache[0] == signature
+        ):
+            return self._instance_config_cache[1]
+
+        index = {item["instance"]: item for item in util.safe_load_file(path) or []}
+        if signature is not None:
+            self._instance_config_cache = (signature, index)
+        return index
+
+    def snapshot(self, name: str) -> bool:
+        """Run the scenario's snapshot playbook, if it has one.
+
+        Args:
+            name: Name identifying the snapshot.
+
+        Returns:
+            Whether a snapshot was taken.
+        """
+        provisioner = self._config.provisioner
+        if not self.managed or provisioner is None or not provisioner.playbooks.snapshot:
+            return False
+        provisioner.snapshot(name)
+        return True
 
-        return next(item for item in instance_config_dict if item["instance"] == instance_name)
+    def restore(self, name: str) -> bool:
+        """Run the scenario's restore playbook, if it has one.
+
+        The playbook is expected to recreate the instances and write the
+        instance config, just like the create playbook does.
+
+        Args:
+            name: Name of a snapshot taken earlier by :meth:`snapshot`.
+
+        Returns:
+            Whether the instances were restored.
+        """
+        provisioner = self._config.provisioner
+        if not self.managed or provisioner is None or not provisioner.playbooks.restore:
+            return False
+        provisioner.restore(name)
+        return True
+
+    def clone(self, name: str, entry: str, instance_config: str) -> bool:
+        """Run the scenario's clone playbook, if it has one.
+
+        The playbook gets the entry as ``MOLECULE_POOL_ENTRY`` and is expected
+        to name the instances after it. Pooled instances are never cloned by
+        the restore playbook, which recreates the scenario's own instances.
+
+        Args:
+            name: Name of a snapshot taken earlier by :meth:`snapshot`.
+            entry: Identifier of the pool entry.
+            instance_config: Path to write the instance config of the clones to.
+
+        Returns:
+            Whether the instances were cloned.
+        """
+        provisioner = self._config.provisioner
+        if not self.managed or provisioner is None or not provisioner.playbooks.clone:
+            return False
+        provisioner.clone(name, entry, instance_config)
+        return True
+
+    def discard(self, entry: str, instance_config: str) -> bool:
+        """Run the scenario's discard playbook, if it has one.
+
+        Args:
+            entry: Identifier of the pool entry.
+            instance_config: Path to the instance config of the clones.
+
+        Returns:
+            Whether the instances were destroyed.
+        """
+        provisioner = self._config.provisioner
+        if not self.managed or provisioner is None or not provisioner.playbooks.discard:
+            return False
+        provisioner.discard(entry, instance_config)
+        return True
 
     def sanity_checks(self) -> None:
         """Run sanity checks."""
@@ -0,0 +1,302 @@
+"""Fused execution of consecutive playbook steps in one ansible-playbook run.
+
+With ``MOLECULE_FUSE_STEPS`` set, consecutive converge, idempotence,
+side_effect and verify steps of a sequence are run as a single generated
+playbook that imports each step's playbook in turn. This saves an
+``ansible-playbook`` start, inventory parse and set of SSH connections per
+step.
+
+Each step's playbooks are preceded by a marker play named after the step, so
+the output can be split back into steps: every step still gets its own
+result, converge still marks the instances as converged, and idempotence only
+looks at the tasks changed by its own converge run. A callback plugin records
+the steps with a failed task or an unreachable host, which a failed run is
+attributed to.
+
+Side effect and verify steps given playbooks in the sequence import these
+instead. Verify steps are only fused when the verifier environment adds
+nothing to that of the provisioner, as the fused run has a single environment.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import re
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from molecule import logger, util
+from molecule.command.base import setup
+from molecule.command.idempotence import non_idempotent_tasks
+from molecule.data import __file__ as data_module
+from molecule.exceptions import ScenarioFailureError
+from molecule.reporting.definitions import ActionResult, CompletionState, ScenarioResults
+from molecule.text import strip_ansi_escape
+
+
+if TYPE_CHECKING:
+    from molecule.config import Config
+
+
+FUSABLE_ACTIONS = ("converge", "idempotence", "side_effect", "verify")
+STEP_PLAY_PREFIX = "molecule step: "
+FUSED_PLAYBOOK = "fused.yml"
+FUSED_RESULTS = "fused.json"
+CALLBACK = "molecule_steps"
+CALLBACK_PLUGINS = str(Path(data_module).parent / "callback_plugins")
+# Where Ansible looks for callback plugins unless configured otherwise.
+DEFAULT_CALLBACK_PLUGINS = "~/.ansible/plugins/callback:/usr/share/ansible/plugins/callback"
+
+_STEP_PLAY_RE = re.compile(rf"^PLAY \[{STEP_PLAY_PREFIX}(\w+)\]", re.MULTILINE)
+
+
+def enabled() -> bool:
+    """Whether fused execution was requested with ``MOLECULE_FUSE_STEPS``.
+
+    Returns:
+        True if consecutive playbook steps should be fused.
+    """
+    return util.boolean(os.environ.get("MOLECULE_FUSE_STEPS", ""), default=False)
+
+
+def _verifier_env_applies(config: Config) -> bool:
+    """Whether the verifier environment adds nothing to that of the provisioner.
+
+    Args:
+        config: Configuration of the scenario.
+
+    Returns:
+        True if verify playbooks can run with the provisioner environment.
+    """
+    env = config.provisioner.env if config.provisioner else {}
+    verifier_env = config.config_data["verifier"]["env"] or {}
+    return all(env.get(str(name)) == str(value) for name, value in verifier_env.items())
+
+
+def step_playbooks(config: Config, step: str) -> list[str] | None:
+    """Return the playbooks a step runs, if the step can be fused.
+
+    Args:
+        config: Configuration of the scenario.
+        step: The sequence step, with the playbooks given to it, if any.
+
+    Returns:
+        Paths to the playbooks, or None if the step has to run on its own.
+    """
+    action, *args = step.split()
+    provisioner = config.provisioner
+    if provisioner is None or action not in FUSABLE_ACTIONS:
+        return None
+    if action in ("converge", "idempotence"):
+        playbooks = [provisioner.playbooks.converge]
+    elif args:
+        playbooks = [provisioner.abs_path(playbook) for playbook in args]
+    elif action == "side_effect":
+        playbooks = [provisioner.playbooks.side_effect]
+    else:
+        playbooks = [provisioner.playbooks.verify]
+    if action == "verify" and not (
+        config.verifier.name == "ansible"
+        and config.verifier.enabled
+        and _verifier_env_applies(config)
+    ):
+        return None
+    if not all(playbooks):
+        return None
+    return [playbook for playbook in playbooks if playbook]
+
+
+def plan(config: Config, sequence: list[str]) -> list[list[str]]:
+    """Group a sequence into the steps run together.
+
+    Args:
+        config: Configuration of the scenario.
+        sequence: The steps of the sequence, in order.
+
+    Returns:
+        The steps to run, consecutive fusable steps grouped together.
+    """
+    # ``become`` from the provisioner options only applies to converge, which
+    # an imported playbook cannot express. Ansible Navigator runs Ansible in an
+    # execution environment, without the callback plugin of Molecule.
+    if (
+        not enabled()
+        or config.provisioner is None
+        or config.config_data["provisioner"]["options"].get("become")
+        or config.executor == "ansible-navigator"
+    ):
+        return [[action] for action in sequence]
+
+    groups: list[list[str]] = []
+    run: list[str] = []
+    for action in sequence:
+        if step_playbooks(config, action) and (action != "idempotence" or "converge" in run):
+            run.append(action)
+            continue
+        groups.extend([run] if len(run) > 1 else [[step] for step in run])
+        groups.append([action])
+        run = []
+    groups.extend([run] if len(run) > 1 else [[step] for step in run])
+    return groups
+
+
+def write_playbook(config: Config, actions: list[str]) -> str:
+    """Write the playbook importing each step's playbooks behind a marker play.
+
+    Args:
+        config: Configuration of the scenario.
+        actions: The steps to run.
+
+    Returns:
+        Path to the generated playbook.
+    """
+    plays: list[dict[str, Any]] = []
+    previous = None
+    for step in actions:
+        action = step.split()[0]
+        marker: dict[str, Any] = {
+            "name": f"{STEP_PLAY_PREFIX}{action}",
+            "hosts": "all",
+            "gather_facts": False,
+            "tasks": [],
+        }
+        if previous == "side_effect":
+            # Side effects change the instances, do not reuse facts gathered before.
+            marker["tasks"].append(
+                {"name": "Forget facts gathered so far", "ansible.builtin.meta": "clear_facts"},
+            )
+        plays.append(marker)
+        plays.extend(
+            {"ansible.builtin.import_playbook": playbook}
+            for playbook in step_playbooks(config, step) or []
+        )
+        previous = action
+
+    path = Path(config.scenario.ephemeral_directory) / FUSED_PLAYBOOK
+    util.write_file(path, util.safe_dump(plays))
+    return str(path)
+
+
+def callback_env(config: Config, results: str) -> dict[str, str]:
+    """Return the environment enabling the callback recording failed steps.
+
+    The callback is added to the callback plugins and callbacks enabled
+    through the environment or the Ansible configuration of the scenario.
+
+    Args:
+        config: Configuration of the scenario.
+        results: Path the callback writes the failed steps to.
+
+    Returns:
+        Environment variables of the fused run.
+    """
+    env = config.provisioner.env if config.provisioner else {}
+    defaults = config.provisioner.config_options.get("defaults", {}) if config.provisioner else {}
+    plugins = env.get("ANSIBLE_CALLBACK_PLUGINS") or defaults.get("callback_plugins")
+    enabled_callbacks = env.get("ANSIBLE_CALLBACKS_ENABLED") or defaults.get("callbacks_enabled")
+    return {
+        "ANSIBLE_CALLBACK_PLUGINS": f"{CALLBACK_PLUGINS}:{plugins or DEFAULT_CALLBACK_PLUGINS}",
+        "ANSIBLE_CALLBACKS_ENABLED": ",".join(filter(None, [enabled_callbacks, CALLBACK])),
+        "MOLECULE_FUSED_RESULTS": results,
+    }
+
+
+def failed_steps(results: Path) -> set[int] | None:
+    """Return the steps the callback found failed.
+
+    Args:
+        results: Path the callback wrote the failed steps to.
+
+    Returns:
+        Indices of the failed steps, or None when the callback recorded nothing.
+    """
+    try:
+        return set(json.loads(results.read_text(encoding="utf-8"))["failed"])
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def split_output(output: str) -> list[tuple[str, str]]:
+    """Split the output of a fused run into the output of each step.
+
+    Args:
+        output: Output of the fused run.
+
+    Returns:
+        The step and its output, for each step that started, in order.
+    """
+    matches = list(_STEP_PLAY_RE.finditer(output))
+    return [
+        (match[1], output[match.start() : matches[index + 1].start()])
+        if index + 1 < len(matches)
+        else (match[1], output[match.start() :])
+        for index, match in enumerate(matches)
+    ]
+
+
+def execute(config: Config, actions: list[str]) -> None:
+    """Run consecutive playbook steps as a single playbook run.
+
+    Args:
+        config: Configuration of the scenario.
+        actions: The steps to run, as grouped by :func:`plan`.
+
+    Raises:
+        ScenarioFailureError: If a step failed, or idempotence found changes.
+    """
+    scenario = config.scenario
+    config.action = actions[0]
+    log = logger.get_scenario_logger(__name__, scenario.name, "+".join(actions))
+    with config.state.transaction():
+        setup(config)
+        playbook = write_playbook(config, actions)
+        results_path = Path(config.scenario.ephemeral_directory) / FUSED_RESULTS
+        with contextlib.suppress(FileNotFoundError):
+            results_path.unlink()
+        log.info("Running %s in a single playbook run", ", ".join(actions))
+
+        # The run reports a single result, each step gets its own below.
+        results = scenario.results
+        scenario.results = ScenarioResults(name=scenario.name, actions=[ActionResult("fused")])
+        failure: ScenarioFailureError | None = None
+        try:
+            output = (
+                config.provisioner.converge(playbook, env=callback_env(config, str(results_path)))
+                if config.provisioner
+                else ""
+            )
+        except ScenarioFailureError as exc:
+            failure = exc
+            output = exc.ansible_output
+        finally:
+            scenario.results = results
+
+        steps = split_output(strip_ansi_escape(output))
+        failed = failed_steps(results_path) if failure is not None else None
+        for index, (action, step_output) in enumerate(steps):
+            config.action = action
+            results.add_action_result(action)
+            # Without failed steps recorded, e.g. on a syntax error in an
+            # imported playbook, the run failed in the last step started.
+            last = index == len(steps) - 1
+            if failure is not None and (index in failed if failed else last):
+                results.add_completion(CompletionState.failed(note=failure.message))
+                raise failure
+            if action == "idempotence" and (tasks := non_idempotent_tasks(step_output)):
+                details = "\n".join(tasks)
+                msg = f"Idempotence test failed because of the following tasks:\n{details}"
+                results.add_completion(CompletionState.failed(note="Not idempotent"))
+                raise ScenarioFailureError(message=msg)
+
+            results.add_completion(CompletionState.successful)
+            if action == "converge":
+                config.state.change_state("converged", value=True)
+
+        if failure is not None:
+            # The run failed before any step started, e.g. on a syntax error.
+            results.add_action_result(actions[0])
+            results.add_completion(CompletionState.failed(note=failure.message))
+            raise failure
@@ -0,0 +1,66 @@
+"""Newline delimited JSON messages over Unix sockets.
+
+Shared by ``molecule serve`` and the persistent testinfra worker. The entry
+point imports this module before anything else, so it only depends on the
+standard library.
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+
+from typing import TYPE_CHECKING, Any
+
+
+if TYPE_CHECKING:
+    import socket
+
+
+MAX_MESSAGE = 1024 * 1024
+
+
+def send(conn: socket.socket, message: dict[str, Any]) -> None:
+    """Write one JSON message terminated by a newline.
+
+    Args:
+        conn: Connected socket.
+        message: Message to send.
+    """
+    conn.sendall(json.dumps(message).encode() + b"\n")
+
+
+def receive(conn: socket.socket, buffer: bytearray) -> dict[str, Any] | None:
+    """Read one newline terminated JSON message.
+
+    Args:
+        conn: Connected socket.
+        buffer: Bytes already received but not consumed yet.
+
+    Returns:
+        The decoded message, or None when the peer closed the connection.
+
+    Raises:
+        ValueError: If the message exceeds the size limit.
+    """
+    while b"\n" not in buffer:
+        if len(buffer) > MAX_MESSAGE:
+            msg = "Message exceeds the size limit."
+            raise ValueError(msg)
+        chunk = conn.recv(65536)
+        if not chunk:
+            return None
+        buffer.extend(chunk)
+    line, _, rest = bytes(buffer).partition(b"\n")
+    buffer[:] = rest
+    message: dict[str, Any] = json.loads(line)
+    return message
+
+
+def exit_on_signal(signum: int, _frame: object) -> None:
+    """Turn a termination signal into SystemExit, so cleanup handlers run.
+
+    Args:
+        signum: Number of the received signal.
+    """
+    sys.exit(128 + signum)
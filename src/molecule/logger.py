@@ -21,17 +21,18 @@
 
 from __future__ import annotations
 
+import contextlib
 import logging
 import os
+import threading
 import time
+import weakref
 
-from functools import wraps
+from functools import cache, wraps
 from typing import TYPE_CHECKING, Protocol, cast
 
-from ansible_compat.ports import cache
-
 from molecule.ansi_output import AnsiOutput
-from molecule.console import console, original_stderr
+from molecule.console import original_stderr
 from molecule.constants import ANSICodes as A
 from molecule.reporting.definitions import CompletionState
 from molecule.text import underscore
@@ -52,6 +53,10 @@ LOG_LEVEL_LUT = {
     1: logging.DEBUG,
 }
 
+# Lines written to a non-interactive stderr are batched for up to this long.
+FLUSH_INTERVAL = 0.05
+BATCH_LINES = 64
+
 
 class HasConfig(Protocol):
     """A class with a _config attribute.
@@ -65,6 +70,21 @@ class HasConfig(Protocol):
     _config: Config
 
 
+_console_handlers: weakref.WeakSet[MoleculeConsoleHandler] = weakref.WeakSet()
+
+
+def flush_console_handlers() -> None:
+    """Write the lines pending in console handlers.
+
+    Called before forking, so children do not write them again, and before
+    running commands that write to the terminal, so log lines stay ahead of
+    their output.
+    """
+    for handler in list(_console_handlers):
+        with contextlib.suppress(OSError, ValueError):
+            handler.flush()
+
+
 class MoleculeConsoleHandler(logging.Handler):
     """Custom logging handler that uses ANSI color codes directly.
 
@@ -87,12 +107,21 @@ class MoleculeConsoleHandler(logging.Handler):
         self.show_time = show_time
         self.show_path = show_path
         self.ansi_output = AnsiOutput()
+        self._prefixes: dict[tuple[str | None, str | None, str | None, bool], tuple[str, str]] = {}
+        self._pending: list[str] = []
+        self._timer: threading.Timer | None = None
+        try:
+            self._interactive = original_stderr.isatty()
+        except (AttributeError, ValueError):
+            self._interactive = False
+        _console_handlers.add(self)
 
     def emit(self, record: logging.LogRecord) -> None:
         """Emit a log record with scenario context using original stderr.
 
         All messages go to the original stderr, bypassing Rich's redirection entirely.
-        Also updates the log record with a plain text version for caplog compatibility.
+        When other handlers follow, the log record is also updated with a plain text
+        version for caplog compatibility.
 
         Args:
             record: The logging record to emit.
@@ -100,48 +129,124 @@ class MoleculeConsoleHandler(logging.Handler):
         try:
             # Format the message
             message = self.format(record)
+            markup = self.ansi_output.markup_enabled
 
             # Check if this message has scenario context passed from ScenarioLoggerAdapter
             scenario_name = getattr(record, "molecule_scenario", None)
             step_name = getattr(record, "molecule_step", None)
 
-            # Get both colored and plain versions using dual methods
             # cspell:ignore levelname
-            colored_level, plain_level = self.ansi_output.format_log_level(record.levelname)
-
-            # Process message once for each version
-            colored_message = self.ansi_output.process_markup(message)
-            plain_message = self.ansi_output.strip_markup(message)
-
+            colored_prefix, plain_prefix = self._prefix(record.levelname, None, None, markup)
             if scenario_name:
-                colored_scenario, plain_scenario = self.ansi_output.format_scenario(
-                    scenario_name,
-                    step_name,
+                colored_scenario, plain_scenario = self._prefix(
+                    None, scenario_name, step_name, markup
                 )
+                colored_prefix = f"{colored_prefix} {colored_scenario}"
+                plain_prefix = f"{plain_prefix} {plain_scenario}"
 
-                # Create colored output for display
-                colored_output = f"{colored_level} {colored_scenario} {colored_message}"
+            # Messages without tags need no markup processing.
+            has_tags = "[" in message
+            colored_message = self.ansi_output.process_markup(message) if has_tags else message
 
-                # Create plain output for caplog
-                plain_output = f"{plain_level} {plain_scenario} {plain_message}"
-            else:
-                # Create colored output for display
-                colored_output = f"{colored_level} {colored_message}"
-
-                # Create plain output for caplog
-                plain_output = f"{plain_level} {plain_message}"
-
-            # Update the log record with the plain version for caplog and other handlers
-            record.msg = plain_output
-            record.args = ()
+            if self._has_other_handlers(record):
+                plain_message = self.ansi_output.strip_markup(message) if has_tags else message
+                # Update the log record with the plain version for caplog and other handlers
+                record.msg = f"{plain_prefix} {plain_message}"
+                record.args = ()
 
             # Write colored output to stderr for users
-            original_stderr.write(colored_output + "\n")
-            original_stderr.flush()
+            self._write(f"{colored_prefix} {colored_message}", record.levelno)
 
         except Exception:  # noqa: BLE001
             self.handleError(record)
 
+    def _prefix(
+        self,
+        level: str | None,
+        scenario: str | None,
+        step: str | None,
+        markup: bool,  # noqa: FBT001
+    ) -> tuple[str, str]:
+        """Return the colored and plain prefix of a level or scenario, formatted once.
+
+        Args:
+            level: Name of the log level, None for a scenario.
+            scenario: Name of the scenario, None for a log level.
+            step: Step name of the scenario.
+            markup: Whether markup is enabled.
+
+        Returns:
+            Tuple of (colored_version, plain_version).
+        """
+        key = (level, scenario, step, markup)
+        prefix = self._prefixes.get(key)
+        if prefix is None:
+            if level is not None:
+                prefix = self.ansi_output.format_log_level(level)
+            else:
+                prefix = self.ansi_output.format_scenario(scenario or "", step)
+            self._prefixes[key] = prefix
+        return prefix
+
+    def _has_other_handlers(self, record: logging.LogRecord) -> bool:
+        """Whether handlers besides this one receive the record.
+
+        Handlers and propagation may change at any time, so the logger chain
+        is walked for each record.
+
+        Args:
+            record: The logging record.
+
+        Returns:
+            True if another handler may read the record.
+        """
+        logger = logging.Logger.manager.loggerDict.get(record.name)
+        current: logging.Logger | None = (
+            logger if isinstance(logger, logging.Logger) else logging.getLogger()
+        )
+        while current is not None:
+            if any(handler is not self for handler in current.handlers):
+                return True
+            if not current.propagate:
+                return False
+            current = current.parent
+        return False
+
+    def _write(self, line: str, level: int) -> None:
+        """Write a line to stderr, batching lines when nobody watches.
+
+        Args:
+            line: The line, without newline.
+            level: Level of the record.
+        """
+        self._pending.append(line)
+        if self._interactive or level >= logging.WARNING or len(self._pending) >= BATCH_LINES:
+            self.flush()
+        elif self._timer is None:
+            self._timer = threading.Timer(FLUSH_INTERVAL, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def flush(self) -> None:
+        """Write the pending lines to stderr."""
+        self.acquire()
+        try:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if self._pending:
+                lines, self._pending = self._pending, []
+                original_stderr.write("\n".join(lines) + "\n")
+                original_stderr.flush()
+        finally:
+            self.release()
+
+    def close(self) -> None:
+        """Write the pending lines, then close the handler."""
+        with contextlib.suppress(OSError, ValueError):
+            self.flush()
+        super().close()
+
     def format(self, record: logging.LogRecord) -> str:
         """Format the log record message.
 
@@ -159,6 +264,10 @@ class MoleculeConsoleHandler(logging.Handler):
         return record.getMessage()
 
 
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(before=flush_console_handlers)
+
+
 def configure() -> None:
     """Configure a molecule root logger.
 
@@ -250,6 +359,7 @@ class ScenarioLoggerAdapter(logging.LoggerAdapter):  # type: ignore[type-arg]
         return msg, kwargs
 
 
+@cache
 def get_scenario_logger(
     name: str,
     scenario_name: str,
@@ -257,6 +367,8 @@ def get_scenario_logger(
 ) -> ScenarioLoggerAdapter:
     """Return a scenario-aware logger that includes scenario name in all messages.
 
+    Adapters are cached, so the same one is returned for the same arguments.
+
     Args:
         name: Name of the child logger.
         scenario_name: Name of the scenario for context.
@@ -282,6 +394,8 @@ def github_actions_groups(func: Callable[P, R]) -> Callable[P, R]:
 
     @wraps(func)
     def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        from molecule.console import console  # noqa: PLC0415
+
         self = cast("HasConfig", args[0])
         scenario = self._config.scenario.name
         subcommand = underscore(self.__class__.__name__)
@@ -317,6 +431,8 @@ def gitlab_ci_sections(func: Callable[P, R]) -> Callable[P, R]:
 
     @wraps(func)
     def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        from molecule.console import console  # noqa: PLC0415
+
         self = cast("HasConfig", args[0])
         scenario = self._config.scenario.name
         subcommand = underscore(self.__class__.__name__)
@@ -361,6 +477,8 @@ def travis_ci_folds(func: Callable[P, R]) -> Callable[P, R]:
 
     @wraps(func)
     def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        from molecule.console import console  # noqa: PLC0415
+
         self = cast("HasConfig", args[0])
         scenario = self._config.scenario.name
         subcommand = underscore(self.__class__.__name__)
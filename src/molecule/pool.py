@@ -0,0 +1,553 @@
+"""Pool of created and prepared instances, shared between scenario runs.
+
+Setting ``MOLECULE_POOL_SIZE`` lets ``molecule destroy`` hand prepared
+instances to a pool instead of destroying them, and ``molecule create`` lease
+them back instead of creating new ones. Pools are keyed by the platform
+signature of a scenario, so instances are only leased by scenarios with the
+same driver, platforms and prepare playbook.
+
+Instances are only pooled when the driver can restore them from a snapshot
+taken after prepare. Returned instances are marked dirty and reset from that
+snapshot when leased again, so destroy does not wait for the reset. Each
+pooled set of instances is an entry file holding that snapshot name and the
+instance config written by the create playbook. Leasing an entry moves it into
+the ``leased`` directory, a single rename, so concurrent runs never lease the
+same entry.
+
+Returned instances keep the names of the scenario platforms. Drivers able to
+clone instances from a snapshot under other names also let the pool pre-warm,
+when ``MOLECULE_POOL_PREWARM`` is set: after each lease, background threads
+clone sets of instances until the pool is full again, and dirty clones are
+reset in the background once returned. Commands wait for these threads once
+their scenarios ran.
+
+Setting ``MOLECULE_POOL_SIZE=0`` drains the pool on destroy. Entries leased by
+scenarios whose ephemeral directory is gone are pruned on each create and
+destroy, along with entries without instances.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import logging
+import os
+import threading
+import uuid
+
+from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
+
+from molecule import util
+from molecule.exceptions import MoleculeError
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from molecule.config import Config
+
+
+LOG = logging.getLogger(__name__)
+
+ENTRY_SUFFIX = ".json"
+
+
+class Lease(NamedTuple):
+    """A set of instances leased from a pool.
+
+    Attributes:
+        id: Identifier of the pool entry.
+        instance_config: Content of the instance config file of the instances.
+        snapshot: Name of the snapshot that resets the instances.
+        clean: Whether the instances were reset since they were last used.
+        cloned: Whether the instances were cloned by the pool, and so are named
+            after the entry instead of the scenario platforms.
+    """
+
+    id: str
+    instance_config: str
+    snapshot: str
+    clean: bool = True
+    cloned: bool = False
+
+
+def get_pool_size() -> int | None:
+    """Return the pool size selected by ``MOLECULE_POOL_SIZE``.
+
+    Returns:
+        The maximum number of pooled instance sets per platform signature, or
+        None when pooling is disabled. A size of 0 drains the pool.
+
+    Raises:
+        MoleculeError: If the value is not a non-negative integer.
+    """
+    value = os.environ.get("MOLECULE_POOL_SIZE", "").strip()
+    if not value:
+        return None
+    if not value.isdigit():
+        msg = f"Invalid MOLECULE_POOL_SIZE '{value}', expected a non-negative integer."
+        raise MoleculeError(msg)
+    return int(value)
+
+
+def prewarm_enabled() -> bool:
+    """Whether pre-warming was requested with ``MOLECULE_POOL_PREWARM``.
+
+    Returns:
+        True if the pool clones instances in the background.
+    """
+    return util.boolean(os.environ.get("MOLECULE_POOL_PREWARM", ""), default=False)
+
+
+def _read_entry(path: Path, entry_id: str) -> tuple[Lease, str | None] | None:
+    """Read an entry file.
+
+    Args:
+        path: Path to the entry file.
+        entry_id: Identifier of the entry.
+
+    Returns:
+        The entry and the ephemeral directory of the scenario leasing it, or
+        None if the file is missing or unreadable.
+    """
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        lease = Lease(
+            entry_id,
+            data["instance_config"],
+            data["snapshot"],
+            clean=data.get("clean", True),
+            cloned=data.get("cloned", False),
+        )
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    return lease, data.get("owner")
+
+
+def _write_entry(path: Path, lease: Lease, owner: str | None = None) -> None:
+    """Write an entry file.
+
+    Args:
+        path: Path to the entry file.
+        lease: The entry.
+        owner: Ephemeral directory of the scenario leasing the entry, if any.
+    """
+    data = lease._asdict()
+    del data["id"]
+    if owner is not None:
+        data["owner"] = owner
+    util.atomic_write_file(path, json.dumps(data), "")
+
+
+class InstancePool:
+    """Prepared instances of one platform signature."""
+
+    def __init__(self, directory: Path, size: int | None) -> None:
+        """Initialize the pool.
+
+        Args:
+            directory: Directory holding the pool entries.
+            size: Maximum number of available entries, None when pooling is
+                disabled.
+        """
+        self.directory = directory
+        self.size = size
+
+    @classmethod
+    def from_config(cls, config: Config) -> InstancePool:
+        """Return the pool of a scenario.
+
+        Args:
+            config: Configuration of the scenario.
+
+        Returns:
+            The pool.
+        """
+        signature = config.scenario.platform_signature
+        return cls(config.runtime.cache_dir / "pool" / signature, get_pool_size())
+
+    @property
+    def enabled(self) -> bool:
+        """Whether instances are leased from and returned to the pool.
+
+        Returns:
+            True if a pool size was selected.
+        """
+        return self.size is not None
+
+    @property
+    def leased_directory(self) -> Path:
+        """Directory holding the entries currently leased.
+
+        Returns:
+            Path to the directory.
+        """
+        return self.directory / "leased"
+
+    def entries(self) -> list[Path]:
+        """Return the available entries, oldest first.
+
+        Returns:
+            Paths of the entry files.
+        """
+        paths = []
+        with contextlib.suppress(OSError):
+            for entry in os.scandir(self.directory):
+                if entry.name.endswith(ENTRY_SUFFIX) and entry.is_file():
+                    with contextlib.suppress(OSError):
+                        paths.append((entry.stat().st_mtime_ns, Path(entry.path)))
+        return [path for _, path in sorted(paths)]
+
+    def has_room(self) -> bool:
+        """Whether the pool takes another set of instances.
+
+        Returns:
+            True if fewer entries than the pool size are available.
+        """
+        return self.size is not None and len(self.entries()) < self.size
+
+    def has_named_entries(self) -> bool:
+        """Whether instances named after the scenario platforms are pooled.
+
+        Returns:
+            True if an available entry was returned by a scenario.
+        """
+        return any(
+            (entry := _read_entry(path, path.stem)) is not None and not entry[0].cloned
+            for path in self.entries()
+        )
+
+    def lease(self, owner: str | None = None) -> Lease | None:
+        """Take the oldest available entry.
+
+        Args:
+            owner: Ephemeral directory of the scenario leasing the entry.
+
+        Returns:
+            The leased instances, or None when the pool is empty.
+        """
+        for path in self.entries():
+            if lease := self.take(path.stem, owner):
+                return lease
+        return None
+
+    def take(self, entry_id: str, owner: str | None = None) -> Lease | None:
+        """Take an available entry.
+
+        Args:
+            entry_id: Identifier of the entry.
+            owner: Ephemeral directory of the scenario leasing the entry.
+
+        Returns:
+            The leased instances, or None when the entry is not available.
+        """
+        self.leased_directory.mkdir(parents=True, exist_ok=True)
+        target = self.leased_directory / f"{entry_id}{ENTRY_SUFFIX}"
+        try:
+            (self.directory / target.name).rename(target)
+        except OSError:
+            # Leased by a concurrent run.
+            return None
+        lease = self.leased(entry_id)
+        if lease is not None and owner is not None:
+            _write_entry(target, lease, owner)
+        return lease
+
+    def leased(self, lease_id: str) -> Lease | None:
+        """Return a lease taken earlier.
+
+        Args:
+            lease_id: Identifier of the lease.
+
+        Returns:
+            The leased instances, or None if the lease is unknown.
+        """
+        entry = _read_entry(self.leased_directory / f"{lease_id}{ENTRY_SUFFIX}", lease_id)
+        return entry[0] if entry else None
+
+    def stale_leases(self) -> list[Lease]:
+        """Return the leases of scenarios whose ephemeral directory is gone.
+
+        Returns:
+            The leases no scenario will return or destroy.
+        """
+        stale = []
+        with contextlib.suppress(OSError):
+            for path in self.leased_directory.glob(f"*{ENTRY_SUFFIX}"):
+                entry = _read_entry(path, path.stem)
+                if entry is not None and entry[1] and not Path(entry[1]).is_dir():
+                    stale.append(entry[0])
+        return stale
+
+    def release(
+        self,
+        instance_config: str,
+        snapshot: str,
+        lease_id: str | None = None,
+        *,
+        clean: bool = True,
+        cloned: bool = False,
+    ) -> Lease:
+        """Make a set of instances available.
+
+        Args:
+            instance_config: Content of the instance config file of the instances.
+            snapshot: Name of the snapshot that resets the instances.
+            lease_id: Identifier of the lease the instances came from, if any.
+            clean: Whether the instances were reset since they were last used.
+            cloned: Whether the instances were cloned by the pool.
+
+        Returns:
+            The new pool entry.
+        """
+        entry = Lease(lease_id or uuid.uuid4().hex, instance_config, snapshot, clean, cloned)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        _write_entry(self.directory / f"{entry.id}{ENTRY_SUFFIX}", entry)
+        self.forget(entry.id)
+        LOG.debug("Returned instances %s to pool %s", entry.id, self.directory)
+        return entry
+
+    def forget(self, lease_id: str) -> None:
+        """Drop a lease, once its instances are destroyed or returned.
+
+        Args:
+            lease_id: Identifier of the lease.
+        """
+        with contextlib.suppress(FileNotFoundError):
+            (self.leased_directory / f"{lease_id}{ENTRY_SUFFIX}").unlink()
+
+    def drop_named(self) -> None:
+        """Drop the available entries named after the scenario platforms.
+
+        Called once the destroy playbook of a scenario ran, as it destroyed
+        these instances too.
+        """
+        for path in self.entries():
+            entry = _read_entry(path, path.stem)
+            if entry is not None and not entry[0].cloned and self.take(path.stem):
+                self.forget(path.stem)
+
+
+_workers: list[threading.Thread] = []
+_workers_lock = threading.Lock()
+
+
+def _start_worker(name: str, target: Callable[..., None], *args: object) -> threading.Thread:
+    """Run pool maintenance in a background thread.
+
+    Args:
+        name: Name of the thread.
+        target: Function to run.
+        *args: Arguments of the function.
+
+    Returns:
+        The started thread.
+    """
+    thread = threading.Thread(target=target, args=args, name=name, daemon=True)
+    with _workers_lock:
+        _workers[:] = [worker for worker in _workers if worker.is_alive()]
+        _workers.append(thread)
+    thread.start()
+    return thread
+
+
+def wait() -> None:
+    """Wait for the background clones and resets of the pools.
+
+    Called once the scenarios of a command ran, as the background threads
+    share their configuration and would otherwise be killed on exit.
+    """
+    with _workers_lock:
+        workers = [worker for worker in _workers if worker.is_alive()]
+    if workers:
+        LOG.info("Waiting for %d instance pool updates to finish", len(workers))
+    for worker in workers:
+        worker.join()
+
+
+def clone(config: Config, pool: InstancePool, snapshot: str, entry_id: str) -> str | None:
+    """Create a set of instances named after a pool entry from a snapshot.
+
+    Args:
+        config: Configuration of the scenario.
+        pool: The pool of the scenario.
+        snapshot: Name of the snapshot.
+        entry_id: Identifier of the entry.
+
+    Returns:
+        The instance config of the clones, or None if the driver cannot clone
+        instances or cloning failed.
+    """
+    pool.directory.mkdir(parents=True, exist_ok=True)
+    path = pool.directory / f"{entry_id}.yml"
+    try:
+        if not config.driver.clone(snapshot, entry_id, str(path)):
+            return None
+        return path.read_text(encoding="utf-8")
+    except Exception as exc:  # noqa: BLE001
+        LOG.warning("Failed to clone instances %s for pool %s: %s", entry_id, pool.directory, exc)
+        return None
+    finally:
+        with contextlib.suppress(OSError):
+            path.unlink()
+
+
+def discard(config: Config, pool: InstancePool, lease: Lease) -> None:
+    """Destroy leased instances cloned by the pool and drop their lease.
+
+    Args:
+        config: Configuration of the scenario.
+        pool: The pool of the scenario.
+        lease: The lease of the instances.
+    """
+    path = pool.directory / f"{lease.id}.yml"
+    try:
+        util.atomic_write_file(path, lease.instance_config, "")
+        if not config.driver.discard(lease.id, str(path)):
+            LOG.warning("The driver cannot destroy pooled instances %s", lease.id)
+    except Exception as exc:  # noqa: BLE001
+        LOG.warning("Failed to destroy pooled instances %s: %s", lease.id, exc)
+    finally:
+        with contextlib.suppress(OSError):
+            path.unlink()
+    pool.forget(lease.id)
+
+
+def _fill(config: Config, pool: InstancePool, snapshot: str) -> None:
+    """Clone sets of instances until the pool is full.
+
+    Args:
+        config: Configuration of the scenario.
+        pool: The pool of the scenario.
+        snapshot: Name of the snapshot to clone.
+    """
+    while pool.has_room():
+        entry_id = uuid.uuid4().hex
+        instance_config = clone(config, pool, snapshot, entry_id)
+        if instance_config is None:
+            return
+        pool.release(instance_config, snapshot, entry_id, cloned=True)
+
+
+def _reset(config: Config, pool: InstancePool, lease: Lease) -> None:
+    """Reset returned clones, or destroy them when the reset fails.
+
+    Args:
+        config: Configuration of the scenario.
+        pool: The pool of the scenario.
+        lease: The lease of the clones, taken back from the pool.
+    """
+    instance_config = clone(config, pool, lease.snapshot, lease.id)
+    if instance_config is None:
+        discard(config, pool, lease)
+        return
+    pool.release(instance_config, lease.snapshot, lease.id, cloned=True)
+
+
+def replenish(config: Config, pool: InstancePool, snapshot: str) -> threading.Thread | None:
+    """Pre-warm the pool in the background, when requested.
+
+    Args:
+        config: Configuration of the scenario.
+        pool: The pool of the scenario.
+        snapshot: Name of the snapshot to clone.
+
+    Returns:
+        The thread cloning instances, or None when there is nothing to do.
+    """
+    if not prewarm_enabled() or not pool.has_room():
+        return None
+    return _start_worker(f"pool-fill-{pool.directory.name}", _fill, config, pool, snapshot)
+
+
+def reset_in_background(config: Config, pool: InstancePool, lease: Lease) -> threading.Thread:
+    """Reset returned clones in the background.
+
+    Args:
+        config: Configuration of the scenario.
+        pool: The pool of the scenario.
+        lease: The returned clones, leased back from the pool.
+
+    Returns:
+        The thread resetting the clones.
+    """
+    return _start_worker(f"pool-reset-{lease.id}", _reset, config, pool, lease)
+
+
+def reset(config: Config, pool: InstancePool, lease: Lease) -> Lease | None:
+    """Reset dirty leased instances from their snapshot.
+
+    Instances named after the scenario platforms are restored through the
+    driver, which writes the instance config of the scenario.
+
+    Args:
+        config: Configuration of the scenario.
+        pool: The pool of the scenario.
+        lease: The leased instances.
+
+    Returns:
+        The clean lease, or None if the instances could not be reset, in which
+        case cloned ones are destroyed.
+    """
+    if lease.clean:
+        return lease
+    if lease.cloned:
+        instance_config = clone(config, pool, lease.snapshot, lease.id)
+        if instance_config is None:
+            discard(config, pool, lease)
+            return None
+        return lease._replace(instance_config=instance_config, clean=True)
+    if not config.driver.restore(lease.snapshot):
+        return None
+    try:
+        instance_config = Path(config.driver.instance_config).read_text(encoding="utf-8")
+    except OSError:
+        return None
+    return lease._replace(instance_config=instance_config, clean=True)
+
+
+def prune(config: Config, pool: InstancePool) -> None:
+    """Drop the entries no scenario will use or destroy any more.
+
+    Clones leased by scenarios whose ephemeral directory is gone are
+    destroyed. Other stale leases are named after the scenario platforms, so
+    they are dropped and left to the destroy playbook. Available entries
+    without instances are dropped too.
+
+    Args:
+        config: Configuration of the scenario.
+        pool: The pool of the scenario.
+    """
+    for lease in pool.stale_leases():
+        LOG.info("Pruning instances %s leased by a removed scenario", lease.id)
+        if lease.cloned:
+            discard(config, pool, lease)
+        else:
+            pool.forget(lease.id)
+    for path in pool.entries():
+        entry = _read_entry(path, path.stem)
+        if entry is not None and not util.safe_load(entry[0].instance_config):
+            with contextlib.suppress(OSError):
+                path.unlink()
+
+
+def drain(config: Config, pool: InstancePool) -> None:
+    """Destroy the clones of the pool.
+
+    Instances named after the scenario platforms are left to the destroy
+    playbook of the scenario, see InstancePool.drop_named.
+
+    Args:
+        config: Configuration of the scenario.
+        pool: The pool of the scenario.
+    """
+    wait()
+    for path in pool.entries():
+        lease = pool.take(path.stem)
+        if lease is None:
+            continue
+        if lease.cloned:
+            discard(config, pool, lease)
+        else:
+            pool.forget(lease.id)
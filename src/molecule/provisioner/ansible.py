@@ -22,23 +22,29 @@
 from __future__ import annotations
 
 import collections
+import contextlib
 import copy
+import hashlib
 import os
 import shutil
+import warnings
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 from ansible_compat.ports import cached_property
 
-from molecule import logger, util
+from molecule import logger, ssh_pool, util
+from molecule.api import MoleculeRuntimeWarning
 from molecule.constants import DEFAULT_ANSIBLE_CFG_OPTIONS, RC_SETUP_ERROR
-from molecule.exceptions import MoleculeError
+from molecule.exceptions import MoleculeError, ScenarioFailureError
 from molecule.provisioner import ansible_playbook, ansible_playbooks, base
 from molecule.reporting.definitions import CompletionState
 
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
     from typing import Any
 
     from molecule.types import Options
@@ -46,8 +52,34 @@ if TYPE_CHECKING:
     Vivify = collections.defaultdict[str, Any | "Vivify"]
 
 
+def get_playbook_concurrency() -> int:
+    """Return the playbook concurrency selected by ``MOLECULE_PLAYBOOK_CONCURRENCY``.
+
+    Returns:
+        The maximum number of verify or side_effect playbooks of a step run at
+        the same time, 1 when they run one after the other.
+
+    Raises:
+        MoleculeError: If the value is not a positive integer.
+    """
+    value = os.environ.get("MOLECULE_PLAYBOOK_CONCURRENCY", "").strip()
+    if not value:
+        return 1
+    if not value.isdigit() or int(value) < 1:
+        msg = f"Invalid MOLECULE_PLAYBOOK_CONCURRENCY '{value}', expected a positive integer."
+        raise MoleculeError(msg)
+    return int(value)
+
+
 class Ansible(base.Base):
-    """The Ansible provisioner."""
+    """The Ansible provisioner.
+
+    Attributes:
+        inventory_digest: Digest of the inventory directory, set each time
+            the inventory is written, None before that.
+    """
+
+    inventory_digest: str | None = None
 
     @property
     def _log(self) -> logger.ScenarioLoggerAdapter:
@@ -64,10 +96,33 @@ class Ansible(base.Base):
     def default_config_options(self) -> dict[str, Any]:
         """Provide default options to construct ansible.cfg.
 
+        With ``ansible.fact_cache`` set, facts are cached in the scenario's
+        fact cache directory, so steps after the first one skip fact gathering.
+
         Returns:
             Default config options.
         """
-        return DEFAULT_ANSIBLE_CFG_OPTIONS
+        options = copy.deepcopy(DEFAULT_ANSIBLE_CFG_OPTIONS)
+        if self._config.config_data["ansible"].get("fact_cache"):
+            options["defaults"].update(
+                {
+                    "fact_caching": "jsonfile",
+                    "fact_caching_connection": self.fact_cache_directory,
+                    "gathering": "smart",
+                },
+            )
+        if ssh_pool.enabled():
+            # Share master connections with the other scenarios and steps.
+            options["ssh_connection"].update(
+                {
+                    "control_path_dir": str(ssh_pool.socket_directory()),
+                    "control_path": "%(directory)s/%%C",
+                    "ssh_args": (
+                        f"-C -o ControlMaster=auto -o ControlPersist={ssh_pool.CONTROL_PERSIST}"
+                    ),
+                },
+            )
+        return options
 
     @property
     def default_options(self) -> dict[str, str | bool]:
@@ -305,6 +360,37 @@ class Ansible(base.Base):
             ),
         )
 
+    @property
+    def fact_cache_directory(self) -> str:
+        """Fact cache directory path.
+
+        Returns:
+            Path to the directory caching facts gathered from the instances.
+        """
+        return str(Path(self._config.scenario.ephemeral_directory, "facts"))
+
+    @property
+    def fact_cache_enabled(self) -> bool:
+        """Whether the current step reads and writes the fact cache.
+
+        The cache is enabled with ``ansible.fact_cache``.
+        ``MOLECULE_FACT_CACHE_DISABLE`` then lists the steps, separated by
+        commas, that gather facts from scratch, or ``all``.
+
+        Returns:
+            False when the fact cache is disabled for the current step.
+        """
+        if not self._config.config_data["ansible"].get("fact_cache"):
+            return False
+        disabled = {
+            step.strip() for step in os.environ.get("MOLECULE_FACT_CACHE_DISABLE", "").split(",")
+        }
+        return not disabled & {"all", self._config.action}
+
+    def clear_fact_cache(self) -> None:
+        """Forget the facts gathered so far, once the instances changed."""
+        shutil.rmtree(self.fact_cache_directory, ignore_errors=True)
+
     @cached_property
     def playbooks(self) -> ansible_playbooks.AnsiblePlaybooks:
         """Ansible playbooks provisioner instance.
@@ -353,22 +439,31 @@ class Ansible(base.Base):
         pb.add_cli_arg("check", value=True)
         pb.execute()
 
-    def converge(self, playbook: str = "", **kwargs: object) -> str:
+    def converge(
+        self,
+        playbook: str = "",
+        env: dict[str, str] | None = None,
+        **kwargs: object,
+    ) -> str:
         """Execute ``ansible-playbook`` against the converge playbook. unless specified otherwise.
 
         Args:
             playbook: An optional string containing an absolute path to a playbook.
+            env: Environment variables to add to those of the provisioner.
             **kwargs: An optional keyword arguments.
 
         Returns:
             str: The output from the ``ansible-playbook`` command.
         """
         pb = self._get_ansible_playbook(playbook or self.playbooks.converge, **kwargs)  # type: ignore[arg-type]
+        for name, value in (env or {}).items():
+            pb.add_env_arg(name, value)
 
         return pb.execute()
 
     def destroy(self) -> None:
         """Execute ``ansible-playbook`` against the destroy playbook and returns None."""
+        self.clear_fact_cache()
         pb = self._get_ansible_playbook(self.playbooks.destroy)
         pb.execute()
 
@@ -378,26 +473,81 @@ class Ansible(base.Base):
         Args:
             action_args: Arguments to pass to the side_effect playbook.
         """
-        playbooks = []
+        playbooks: list[str | None] = []
         if action_args:
-            playbooks = [
-                self._get_ansible_playbook(self.abs_path(playbook)) for playbook in action_args
-            ]
+            playbooks = [self.abs_path(playbook) for playbook in action_args]
         else:
-            playbooks = [self._get_ansible_playbook(self.playbooks.side_effect)]
-        for pb in playbooks:
-            pb.execute()
+            playbooks = [self.playbooks.side_effect]
+        try:
+            self._execute_playbooks(playbooks)
+        finally:
+            # Side effects change the instances, facts gathered before are stale.
+            self.clear_fact_cache()
 
     def create(self) -> None:
         """Execute ``ansible-playbook`` against the create playbook and returns None."""
+        self.clear_fact_cache()
         pb = self._get_ansible_playbook(self.playbooks.create)
         pb.execute()
 
     def prepare(self) -> None:
         """Execute ``ansible-playbook`` against the prepare playbook and returns None."""
         pb = self._get_ansible_playbook(self.playbooks.prepare)
+        try:
+            pb.execute()
+        finally:
+            # Prepare changes the instances, facts gathered before are stale.
+            self.clear_fact_cache()
+
+    def snapshot(self, name: str) -> None:
+        """Execute ``ansible-playbook`` against the snapshot playbook and returns None.
+
+        Args:
+            name: Name of the snapshot, passed as ``MOLECULE_SNAPSHOT_NAME``.
+        """
+        pb = self._get_ansible_playbook(self.playbooks.snapshot)
+        pb.add_env_arg("MOLECULE_SNAPSHOT_NAME", name)
+        pb.execute()
+
+    def restore(self, name: str) -> None:
+        """Execute ``ansible-playbook`` against the restore playbook and returns None.
+
+        Args:
+            name: Name of the snapshot, passed as ``MOLECULE_SNAPSHOT_NAME``.
+        """
+        self.clear_fact_cache()
+        pb = self._get_ansible_playbook(self.playbooks.restore)
+        pb.add_env_arg("MOLECULE_SNAPSHOT_NAME", name)
         pb.execute()
 
+    def clone(self, name: str, entry: str, instance_config: str) -> None:
+        """Execute ``ansible-playbook`` against the clone playbook.
+
+        Output is captured, as the pool clones instances from background threads.
+
+        Args:
+            name: Name of the snapshot, passed as ``MOLECULE_SNAPSHOT_NAME``.
+            entry: Identifier of the pool entry, passed as ``MOLECULE_POOL_ENTRY``.
+            instance_config: Path the instance config is written to.
+        """
+        pb = self._get_ansible_playbook(self.playbooks.clone)
+        pb.add_env_arg("MOLECULE_SNAPSHOT_NAME", name)
+        pb.add_env_arg("MOLECULE_POOL_ENTRY", entry)
+        pb.add_env_arg("MOLECULE_INSTANCE_CONFIG", instance_config)
+        pb.execute(capture=True)
+
+    def discard(self, entry: str, instance_config: str) -> None:
+        """Execute ``ansible-playbook`` against the discard playbook.
+
+        Args:
+            entry: Identifier of the pool entry, passed as ``MOLECULE_POOL_ENTRY``.
+            instance_config: Path to the instance config of the entry.
+        """
+        pb = self._get_ansible_playbook(self.playbooks.discard)
+        pb.add_env_arg("MOLECULE_POOL_ENTRY", entry)
+        pb.add_env_arg("MOLECULE_INSTANCE_CONFIG", instance_config)
+        pb.execute(capture=True)
+
     def syntax(self) -> None:
         """Execute `ansible-playbook` against the converge playbook with the -syntax-check flag."""
         pb = self._get_ansible_playbook(self.playbooks.converge)
@@ -422,10 +572,62 @@ class Ansible(base.Base):
                 CompletionState.missing(message=message, note=note),
             )
             return
-        for playbook in playbooks:
-            # Get ansible playbooks for `verify` instead of `provision`
-            pb = self._get_ansible_playbook(playbook, verify=True)
-            pb.execute()
+        # Get ansible playbooks for `verify` instead of `provision`
+        self._execute_playbooks(playbooks, verify=True)
+
+    def _execute_playbooks(self, playbooks: Sequence[str | None], *, verify: bool = False) -> None:
+        """Execute the playbooks of a step.
+
+        Playbooks run one after the other unless ``MOLECULE_PLAYBOOK_CONCURRENCY``
+        allows several at a time. Their output is then captured and printed
+        playbook by playbook once they all finished.
+
+        Args:
+            playbooks: Paths to the playbooks.
+            verify: Whether the playbooks are verify playbooks.
+
+        Raises:
+            ScenarioFailureError: when any playbook failed, naming all of them.
+        """
+        pbs = [self._get_ansible_playbook(playbook, verify=verify) for playbook in playbooks]
+        limit = min(get_playbook_concurrency(), len(pbs))
+        if limit <= 1:
+            for pb in pbs:
+                pb.execute()
+            return
+
+        for pb in pbs:
+            pb.bake()
+        with warnings.catch_warnings(record=True) as warns:
+            warnings.filterwarnings("default", category=MoleculeRuntimeWarning)
+            self._config.driver.sanity_checks()
+        self._log.info("Running %d playbooks, up to %d at a time", len(pbs), limit)
+        with ThreadPoolExecutor(max_workers=limit) as executor:
+            futures = [executor.submit(pb.execute, capture=True) for pb in pbs]
+
+        failed: list[tuple[str, ScenarioFailureError]] = []
+        for playbook, future in zip(playbooks, futures, strict=True):
+            name = Path(playbook or "").name
+            self._log.info("Output of playbook %s:", name)
+            try:
+                output, returncode = future.result(), 0
+            except ScenarioFailureError as exc:
+                output, returncode = exc.ansible_output, exc.code
+                failed.append((name, exc))
+            self._config.app.write_output(
+                output,
+                title=name,
+                returncode=returncode,
+                command_borders=self._config.command_borders,
+            )
+        if failed:
+            msg = f"Playbooks failed: {', '.join(name for name, _ in failed)}"
+            raise ScenarioFailureError(
+                msg,
+                code=failed[0][1].code,
+                warns=warns,
+                ansible_output="".join(exc.ansible_output for _, exc in failed),
+            )
 
     def write_config(self) -> None:
         """Write the provisioner's config file to disk and returns None."""
@@ -443,6 +645,21 @@ class Ansible(base.Base):
             self._add_or_update_vars()
         else:
             self._link_or_update_vars()
+        self.inventory_digest = self._digest_inventory()
+
+    def _digest_inventory(self) -> str:
+        """Digest the inventory directory, once written.
+
+        Returns:
+            A hex digest of the path and content of every file below it.
+        """
+        digest = hashlib.sha256()
+        for path in sorted(Path(self.inventory_directory).rglob("*")):
+            with contextlib.suppress(OSError):
+                if path.is_file():
+                    content = path.read_bytes()
+                    digest.update(f"{path}\0".encode() + content + b"\0")
+        return digest.hexdigest()
 
     def abs_path(self, path: str | Path) -> str:
         """Return absolute scenario-adjacent path.
@@ -544,12 +761,16 @@ class Ansible(base.Base):
         Returns:
             An AnsiblePlaybook object.
         """
-        return ansible_playbook.AnsiblePlaybook(
+        pb = ansible_playbook.AnsiblePlaybook(
             playbook,
             self._config,
             verify=verify,
             **kwargs,
         )
+        if self._config.config_data["ansible"].get("fact_cache") and not self.fact_cache_enabled:
+            # An in-memory cache starts empty, so facts are gathered again.
+            pb.add_env_arg("ANSIBLE_CACHE_PLUGIN", "memory")
+        return pb
 
     def _verify_inventory(self) -> None:
         """Verify the inventory is valid and returns None.
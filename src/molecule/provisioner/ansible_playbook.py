@@ -177,14 +177,18 @@ class AnsiblePlaybook:
         msg = f"Unsupported backend: {backend}"
         raise ValueError(msg)
 
-    def execute(self, action_args: list[str] | None = None) -> str:
+    def execute(self, action_args: list[str] | None = None, *, capture: bool = False) -> str:
         """Execute ``ansible-playbook`` or ``ansible-navigator run``.
 
         Args:
             action_args: Arguments to forward to the action. Unused.
+            capture: Capture the output instead of printing it, for playbooks
+                running concurrently. The driver sanity checks are then left
+                to the caller, which prints the output with App.write_output.
 
         Returns:
-            Output from ansible-playbook or ansible-navigator.
+            Output from ansible-playbook or ansible-navigator, including its
+            standard error when captured.
 
         Raises:
             ScenarioFailureError: when Ansible returns nonzero code.
@@ -201,23 +205,34 @@ class AnsiblePlaybook:
             )
             return ""
 
-        with warnings.catch_warnings(record=True) as warns:
-            warnings.filterwarnings("default", category=MoleculeRuntimeWarning)
-            self._config.driver.sanity_checks()
-            cwd = self._config.scenario_path
+        if capture:
+            # Warning filters are process wide, so are not touched from threads.
+            warns: list[warnings.WarningMessage] = []
             result = self._config.app.run_command(
                 cmd=self._ansible_command,
                 env=self._env,
                 debug=self._config.debug,
-                cwd=cwd,
-                command_borders=self._config.command_borders,
+                cwd=self._config.scenario_path,
+                capture=True,
             )
-
+        else:
+            with warnings.catch_warnings(record=True) as warns:
+                warnings.filterwarnings("default", category=MoleculeRuntimeWarning)
+                self._config.driver.sanity_checks()
+                cwd = self._config.scenario_path
+                result = self._config.app.run_command(
+                    cmd=self._ansible_command,
+                    env=self._env,
+                    debug=self._config.debug,
+                    cwd=cwd,
+                    command_borders=self._config.command_borders,
+                )
+
+        ansible_output = (result.stdout or "") + (result.stderr or "")
         if result.returncode != 0:
             err = f"Ansible return code was {result.returncode}, command was: {escape(shlex.join(result.args))}"
             self._config.scenario.results.add_completion(CompletionState.failed(note=err))
 
-            ansible_output = (result.stdout or "") + (result.stderr or "")
             raise ScenarioFailureError(
                 err,
                 code=result.returncode,
@@ -226,7 +241,7 @@ class AnsiblePlaybook:
             )
 
         self._config.scenario.results.add_completion(CompletionState.successful)
-        return result.stdout
+        return ansible_output if capture else result.stdout
 
     def add_cli_arg(self, name: str, value: str | bool) -> None:  # noqa: FBT001
         """Add argument to CLI passed to ansible-playbook.
@@ -36,11 +36,15 @@ if TYPE_CHECKING:
 
     Section = Literal[
         "cleanup",
+        "clone",
         "create",
         "converge",
         "destroy",
+        "discard",
         "prepare",
+        "restore",
         "side_effect",
+        "snapshot",
         "verify",
     ]
 
@@ -76,6 +80,15 @@ class AnsiblePlaybooks:
         """
         return self._get_playbook("cleanup")
 
+    @property
+    def clone(self) -> str | None:
+        """Get the clone playbook path.
+
+        Returns:
+            Path to clone.yml.
+        """
+        return self._get_playbook("clone")
+
     @property
     def create(self) -> str | None:
         """Get the create playbook path.
@@ -103,6 +116,15 @@ class AnsiblePlaybooks:
         """
         return self._get_playbook("destroy")
 
+    @property
+    def discard(self) -> str | None:
+        """Get the discard playbook path.
+
+        Returns:
+            Path to discard.yml.
+        """
+        return self._get_playbook("discard")
+
     @property
     def prepare(self) -> str | None:
         """Get the prepare playbook path.
@@ -112,6 +134,15 @@ class AnsiblePlaybooks:
         """
         return self._get_playbook("prepare")
 
+    @property
+    def restore(self) -> str | None:
+        """Get the restore playbook path.
+
+        Returns:
+            Path to restore.yml.
+        """
+        return self._get_playbook("restore")
+
     @property
     def side_effect(self) -> str | None:
         """Get the side_effect playbook path.
@@ -121,6 +152,15 @@ class AnsiblePlaybooks:
         """
         return self._get_playbook("side_effect")
 
+    @property
+    def snapshot(self) -> str | None:
+        """Get the snapshot playbook path.
+
+        Returns:
+            Path to snapshot.yml.
+        """
+        return self._get_playbook("snapshot")
+
     @property
     def verify(self) -> str | None:
         """Get the verify playbook path.
@@ -169,7 +209,11 @@ class AnsiblePlaybooks:
                 "create",
                 "destroy",
                 "cleanup",
+                "clone",
+                "discard",
+                "restore",
                 "side_effect",
+                "snapshot",
                 "verify",
             ]:
                 return playbook
@@ -21,17 +21,23 @@
 
 from __future__ import annotations
 
+import contextlib
 import fcntl
 import fnmatch
+import hashlib
+import json
 import os
+import re
 import shutil
+import socket
+import threading
 
 from functools import cached_property
 from pathlib import Path
-from time import sleep
-from typing import TYPE_CHECKING
+from time import monotonic, sleep
+from typing import IO, TYPE_CHECKING
 
-from molecule import logger, scenarios, util
+from molecule import logger, scenarios
 from molecule.constants import RC_TIMEOUT
 from molecule.exceptions import MoleculeError
 from molecule.reporting.definitions import ScenarioResults
@@ -41,6 +47,28 @@ from molecule.text import checksum
 if TYPE_CHECKING:
     from molecule.config import Config
 
+# Seconds to wait for the ephemeral directory lock of a parallel run.
+LOCK_TIMEOUT = 300
+# Polling interval bounds while the lock is held by another process.
+LOCK_POLL_INTERVAL = 0.1
+LOCK_POLL_INTERVAL_MAX = 2.0
+
+# Background prunes in progress, by ephemeral directory.
+_prunes: dict[str, threading.Thread] = {}
+_prunes_lock = threading.Lock()
+
+
+def wait_for_prune(path: str) -> None:
+    """Wait until a background prune of an ephemeral directory is done.
+
+    Args:
+        path: The ephemeral directory.
+    """
+    with _prunes_lock:
+        thread = _prunes.get(path)
+    if thread is not None and thread is not threading.current_thread():
+        thread.join()
+
 
 class Scenario:
     """A Molecule scenario."""
@@ -51,7 +79,7 @@ class Scenario:
         Args:
             config: An instance of a Molecule config.
         """
-        self._lock = None
+        self._lock: IO[str] | None = None
         self.config = config
         self.results: ScenarioResults = ScenarioResults(name=self.name, actions=[])
         self._setup()
@@ -66,24 +94,35 @@ class Scenario:
 
     def _remove_scenario_state_directory(self) -> None:
         """Remove scenario cached disk stored state."""
+        wait_for_prune(self.ephemeral_directory)
         directory = str(Path(self.ephemeral_directory).parent)
         scenario_log = logger.get_scenario_logger(__name__, self.name, "scenario")
         scenario_log.info("Removing %s", directory)
         shutil.rmtree(directory)
 
-    def prune(self) -> None:
+    def prune(self, *, background: bool = False) -> threading.Thread | None:
         """Prune the scenario ephemeral directory files.
 
         "safe files" will not be pruned, including the ansible configuration
         and inventory used by this scenario, the scenario state file, and
         files declared as "safe_files" in the ``driver`` configuration
         declared in ``molecule.yml``.
+
+        Args:
+            background: Delete the files from a background thread instead of
+                waiting for them to be removed. The thread is not a daemon, so
+                the interpreter still waits for it before exiting, and the
+                ephemeral directory is not used again before it is done.
+
+        Returns:
+            The thread doing the deletion when ``background`` is set, otherwise None.
         """
         scenario_log = logger.get_scenario_logger(__name__, self.name, "scenario")
         scenario_log.info("Pruning extra files from scenario ephemeral directory")
 
         safe_files = [
             self.config.state.state_file,
+            self.snapshot_file,
             *self.config.driver.safe_files,
         ]
         if self.config.provisioner is not None:
@@ -91,16 +130,77 @@ class Scenario:
                 self.config.provisioner.config_file,
                 self.config.provisioner.inventory_file,
             ]
+        # One alternation instead of an fnmatch call per file and pattern.
+        safe = re.compile("|".join(fnmatch.translate(sf) for sf in safe_files))
+
+        path = self.ephemeral_directory
+        wait_for_prune(path)
+        if not background:
+            self._prune_directory(path, safe)
+            return None
+
+        thread = threading.Thread(
+            target=self._prune_in_background,
+            args=(path, safe),
+            name=f"molecule-prune-{self.name}",
+        )
+        with _prunes_lock:
+            _prunes[path] = thread
+        thread.start()
+        return thread
+
+    def _prune_in_background(self, path: str, safe: re.Pattern[str]) -> None:
+        """Prune a directory from a background thread, logging failures.
 
-        existing_files = util.os_walk(self.ephemeral_directory, "*")
-        for f in existing_files:
-            if not any(sf for sf in safe_files if fnmatch.fnmatch(f, sf)):
-                Path(f).unlink(missing_ok=True)
+        Args:
+            path: Directory to prune.
+            safe: Pattern matching the paths of files to keep.
+        """
+        try:
+            self._prune_directory(path, safe)
+        except OSError as exc:
+            scenario_log = logger.get_scenario_logger(__name__, self.name, "scenario")
+            scenario_log.warning("Failed to prune %s: %s", path, exc)
+        finally:
+            with _prunes_lock:
+                if _prunes.get(path) is threading.current_thread():
+                    del _prunes[path]
+
+    @classmethod
+    def _prune_directory(cls, path: str, safe: re.Pattern[str], *, root: bool = True) -> bool:
+        """Remove unsafe files and empty directories below path in one pass.
+
+        The tree is traversed bottom-up with ``os.scandir``, so a directory
+        is removed as soon as its contents have been pruned. Symbolic links
+        to directories are neither followed nor removed.
+
+        Args:
+            path: Directory to prune.
+            safe: Pattern matching the paths of files to keep.
+            root: Whether path is the top of the pruned tree.
 
-        # Remove empty directories.
-        for dirpath, dirs, files in os.walk(self.ephemeral_directory, topdown=False):
-            if not dirs and not files:
-                os.removedirs(dirpath)
+        Returns:
+            Whether path was removed.
+        """
+        empty = True
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if not cls._prune_directory(entry.path, safe, root=False):
+                        empty = False
+                elif (entry.is_symlink() and entry.is_dir()) or safe.match(entry.path):
+                    empty = False
+                else:
+                    Path(entry.path).unlink(missing_ok=True)
+
+        if not empty:
+            return False
+        if root:
+            # Like os.walk + os.removedirs did, drop empty parents as well.
+            os.removedirs(path)
+        else:
+            Path(path).rmdir()
+        return True
 
     @property
     def name(self) -> str:
@@ -152,31 +252,81 @@ class Scenario:
                 path = Path(self.shared_ephemeral_directory)
         else:
             path = Path(os.getenv("MOLECULE_EPHEMERAL_DIRECTORY", ""))
+        # A background prune may still be removing the directory.
+        wait_for_prune(path.absolute().as_posix())
         path.mkdir(parents=True, exist_ok=True)
 
         if self.config.is_parallel and not self._lock:
-            lock_file = path / ".lock"
-            with lock_file.open("w") as self._lock:  # type: ignore[assignment]
-                for i in range(1, 5):
-                    try:
-                        fcntl.lockf(self._lock, fcntl.LOCK_EX | fcntl.LOCK_NB)  # type: ignore[arg-type]
-                        break
-                    except OSError:
-                        delay = 30 * i
-                        scenario_log = logger.get_scenario_logger(__name__, self.name, "scenario")
-                        scenario_log.warning(
-                            "Retrying to acquire lock on %s, waiting for %s seconds",
-                            path,
-                            delay,
-                        )
-                        sleep(delay)
-                else:
-                    scenario_log = logger.get_scenario_logger(__name__, self.name, "scenario")
-                    scenario_log.warning("Timedout trying to acquire lock on %s", path)
-                    raise MoleculeError(code=RC_TIMEOUT)
+            self._acquire_lock(path / ".lock")
 
         return path.absolute().as_posix()
 
+    def _acquire_lock(self, lock_file: Path) -> None:
+        """Take an exclusive lock on the ephemeral directory.
+
+        Waits until the lock is released by its holder, polling with a short
+        backoff so contended runs continue as soon as possible, and gives up
+        after ``LOCK_TIMEOUT`` seconds. The lock is held for the lifetime of
+        this scenario, and the lock file records who holds it.
+
+        Args:
+            lock_file: Path of the lock file.
+
+        Raises:
+            MoleculeError: If lock cannot be acquired before timeout.
+        """
+        scenario_log = logger.get_scenario_logger(__name__, self.name, "scenario")
+        # Append mode, truncating would wipe the holder details of another process.
+        lock = lock_file.open("a+")
+        deadline = monotonic() + LOCK_TIMEOUT
+        interval = LOCK_POLL_INTERVAL
+        waiting = False
+        while True:
+            try:
+                fcntl.lockf(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                break
+            except OSError:
+                remaining = deadline - monotonic()
+                if remaining <= 0:
+                    scenario_log.warning(
+                        "Timed out trying to acquire lock on %s, held by %s",
+                        lock_file.parent,
+                        self._lock_holder(lock_file),
+                    )
+                    lock.close()
+                    raise MoleculeError(code=RC_TIMEOUT) from None
+                if not waiting:
+                    scenario_log.warning(
+                        "Waiting up to %s seconds for lock on %s, held by %s",
+                        LOCK_TIMEOUT,
+                        lock_file.parent,
+                        self._lock_holder(lock_file),
+                    )
+                    waiting = True
+                sleep(min(interval, remaining))
+                interval = min(interval * 2, LOCK_POLL_INTERVAL_MAX)
+
+        lock.truncate(0)
+        lock.write(f"pid={os.getpid()} host={socket.gethostname()} scenario={self.name}\n")
+        lock.flush()
+        # Closing the file would release the lock, keep it for the whole run.
+        self._lock = lock
+
+    @staticmethod
+    def _lock_holder(lock_file: Path) -> str:
+        """Describe the process holding a lock file.
+
+        Args:
+            lock_file: Path of the lock file.
+
+        Returns:
+            The holder details written by the lock owner, or "unknown".
+        """
+        try:
+            return lock_file.read_text(encoding="utf-8").strip() or "unknown"
+        except OSError:
+            return "unknown"
+
     @cached_property
     def shared_ephemeral_directory(self) -> str:
         """Acquire the shared ephemeral directory.
@@ -195,6 +345,81 @@ class Scenario:
 
         return path.absolute().as_posix()
 
+    @property
+    def platform_signature(self) -> str:
+        """Digest of what this scenario's prepared instances are made from.
+
+        It covers the driver, the platforms, the prepare playbook and the
+        dependency requirements, so scenarios with the same signature get
+        interchangeable instances.
+
+        Returns:
+            A hex digest.
+        """
+        digest = hashlib.sha256(self.config.driver.name.encode())
+        digest.update(json.dumps(self.config.platforms.instances, sort_keys=True).encode())
+        if self.config.provisioner and (prepare := self.config.provisioner.playbooks.prepare):
+            digest.update(Path(prepare).read_bytes())
+        dependency = self.config.config_data.get("dependency", {})
+        digest.update(json.dumps(dependency, sort_keys=True, default=str).encode())
+        for invoker in getattr(self.config.dependency, "invocations", ()):
+            with contextlib.suppress(OSError):
+                digest.update(Path(invoker.requirements_file).read_bytes())
+        return digest.hexdigest()
+
+    @property
+    def snapshot_name(self) -> str:
+        """Name of the snapshot of this scenario's prepared instances.
+
+        It includes the platform signature, so that changing the prepare
+        playbook, the requirements, the platforms or the driver invalidates
+        earlier snapshots.
+
+        Returns:
+            The snapshot name.
+        """
+        return f"{self.name.replace('/', '--')}-{self.platform_signature[:16]}"
+
+    @property
+    def snapshot_file(self) -> str:
+        """File recording the snapshots taken for this scenario.
+
+        Returns:
+            Path to the snapshot record.
+        """
+        return str(Path(self.ephemeral_directory) / "snapshots.json")
+
+    @property
+    def snapshots(self) -> list[str]:
+        """Names of the snapshots taken for this scenario.
+
+        Returns:
+            The recorded snapshot names.
+        """
+        try:
+            names: list[str] = json.loads(Path(self.snapshot_file).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return []
+        return names
+
+    def add_snapshot(self, name: str) -> None:
+        """Record a snapshot taken for this scenario.
+
+        Args:
+            name: Name of the snapshot.
+        """
+        names = [*self.snapshots, name]
+        Path(self.snapshot_file).write_text(json.dumps(names), encoding="utf-8")
+
+    def remove_snapshot(self, name: str) -> None:
+        """Forget a snapshot that can no longer be restored.
+
+        Args:
+            name: Name of the snapshot.
+        """
+        names = [snapshot for snapshot in self.snapshots if snapshot != name]
+        Path(self.snapshot_file).write_text(json.dumps(names), encoding="utf-8")
+
     @property
     def inventory_directory(self) -> str:
         """Inventory directory.
@@ -31,13 +31,9 @@ import packaging
 
 import molecule
 
-from molecule import command, logger
-from molecule.api import drivers
-from molecule.app import get_app
+from molecule import logger
 from molecule.click_cfg import click_group_ex
-from molecule.config import MOLECULE_DEBUG, MOLECULE_VERBOSITY
-from molecule.console import console
-from molecule.constants import MOLECULE_COLLECTION_ROOT
+from molecule.constants import MOLECULE_COLLECTION_ROOT, MOLECULE_DEBUG, MOLECULE_VERBOSITY
 from molecule.util import lookup_config_file
 
 
@@ -57,6 +53,30 @@ LOCAL_CONFIG = lookup_config_file(LOCAL_CONFIG_SEARCH)
 
 ENV_FILE = ".env.yml"
 
+# Subcommands are imported only when invoked, listed in help or completed, so
+# that ``molecule --version`` or shell completion stay cheap.
+SUBCOMMANDS = {
+    "check": "molecule.command.check:check",
+    "cleanup": "molecule.command.cleanup:cleanup",
+    "converge": "molecule.command.converge:converge",
+    "create": "molecule.command.create:create",
+    "dependency": "molecule.command.dependency:dependency",
+    "destroy": "molecule.command.destroy:destroy",
+    "drivers": "molecule.command.drivers:drivers",
+    "idempotence": "molecule.command.idempotence:idempotence",
+    "init": "molecule.command.init.init:init",
+    "list": "molecule.command.list:list_",
+    "login": "molecule.command.login:login",
+    "matrix": "molecule.command.matrix:matrix",
+    "prepare": "molecule.command.prepare:prepare",
+    "reset": "molecule.command.reset:reset",
+    "serve": "molecule.command.serve:serve",
+    "side-effect": "molecule.command.side_effect:side_effect",
+    "syntax": "molecule.command.syntax:syntax",
+    "test": "molecule.command.test:test",
+    "verify": "molecule.command.verify:verify",
+}
+
 
 def print_version(
     ctx: click.Context,
@@ -73,6 +93,10 @@ def print_version(
     if not value or ctx.resilient_parsing:
         return
 
+    from molecule.api import drivers  # noqa: PLC0415
+    from molecule.app import get_app  # noqa: PLC0415
+    from molecule.console import console  # noqa: PLC0415
+
     v = packaging.version.Version(molecule.__version__)
     color = "bright_yellow" if v.is_prerelease else "green"
     msg = (
@@ -96,7 +120,7 @@ def print_version(
     ctx.exit()
 
 
-@click_group_ex()
+@click_group_ex(lazy_commands=SUBCOMMANDS)
 @click.option(
     "--debug/--no-debug",
     default=MOLECULE_DEBUG,
@@ -113,7 +137,7 @@ def print_version(
     "--base-config",
     "-c",
     multiple=True,
-    default=[LOCAL_CONFIG] if LOCAL_CONFIG else [],
+    default=lambda: [config] if (config := lookup_config_file(LOCAL_CONFIG_SEARCH)) else [],
     help=(
         "Path to a base config (can be specified multiple times)."
         " If provided, Molecule will first load and deep merge the"
@@ -172,23 +196,3 @@ def main(
     logger.set_log_level(verbose, debug)
     if verbose:
         os.environ["ANSIBLE_VERBOSITY"] = str(verbose)
-
-
-main.add_command(command.cleanup.cleanup)
-main.add_command(command.check.check)
-main.add_command(command.converge.converge)
-main.add_command(command.create.create)
-main.add_command(command.dependency.dependency)
-main.add_command(command.destroy.destroy)
-main.add_command(command.drivers.drivers)
-main.add_command(command.idempotence.idempotence)
-main.add_command(command.init.init)
-main.add_command(command.list.list_)
-main.add_command(command.login.login)
-main.add_command(command.matrix.matrix)
-main.add_command(command.prepare.prepare)
-main.add_command(command.reset.reset)
-main.add_command(command.side_effect.side_effect)
-main.add_command(command.syntax.syntax)
-main.add_command(command.test.test)
-main.add_command(command.verify.verify)
@@ -0,0 +1,275 @@
+"""SSH master connections shared by every step and scenario of a run.
+
+With ``MOLECULE_SSH_POOL`` set, Ansible, testinfra and ``molecule login``
+connect through OpenSSH master connections whose sockets live in one shared
+directory, named after the host, port and user they connect to. Masters are
+opened right after create, stay up for as long as they are used and
+``CONTROL_PERSIST`` after that. Steps that take longer than the default 60
+seconds of ``ControlPersist``, and scenarios testing the same delegated hosts,
+no longer pay for a new SSH handshake.
+
+A scenario records the masters it opened, and stops only these at destroy.
+Stopped masters refuse new sessions but keep those of other scenarios until
+they end. Masters opened on first use by Ansible are left to ``ControlPersist``.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import logging
+import os
+import shlex
+import shutil
+import subprocess
+import tempfile
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from molecule import util
+
+
+if TYPE_CHECKING:
+    from molecule.config import Config
+
+
+LOG = logging.getLogger(__name__)
+
+CONTROL_PERSIST = "30m"
+MASTERS_FILE = "ssh_masters.json"
+CONNECT_TIMEOUT = 30
+# Connections that Ansible makes with the OpenSSH client.
+SSH_CONNECTIONS = (None, "ssh", "smart")
+
+
+def enabled() -> bool:
+    """Whether the connection pool was requested with ``MOLECULE_SSH_POOL``.
+
+    Returns:
+        True if SSH master connections are pooled.
+    """
+    return util.boolean(os.environ.get("MOLECULE_SSH_POOL", ""), default=False)
+
+
+def socket_directory() -> Path:
+    """Directory holding the master sockets, created if needed.
+
+    It lives in the user runtime directory, or in the temporary directory when
+    there is none, as socket paths are limited to about 100 characters. Only a
+    directory of the current user that nobody else can access is used, as ssh
+    trusts any master listening on the ControlPath.
+
+    Returns:
+        Path to the directory.
+    """
+    if runtime_dir := os.environ.get("XDG_RUNTIME_DIR"):
+        path = Path(runtime_dir) / "molecule-ssh"
+    else:
+        path = Path(tempfile.gettempdir()) / f"molecule-ssh-{os.getuid()}"
+    return util.private_directory(path)
+
+
+def control_path() -> str:
+    """ControlPath shared by every connection to the same host, port and user.
+
+    Returns:
+        The ControlPath, with ``%C`` expanded by ssh.
+    """
+    return str(socket_directory() / "%C")
+
+
+def _ssh_targets(config: Config) -> list[dict[str, Any]]:
+    """Return the instances Ansible reaches over SSH.
+
+    Args:
+        config: Configuration of the scenario.
+
+    Returns:
+        Instance config entries with an address.
+    """
+    if not config.driver.managed:
+        return []
+    try:
+        instances = util.safe_load_file(config.driver.instance_config) or []
+    except OSError:
+        return []
+    return [
+        instance
+        for instance in instances
+        if isinstance(instance, dict)
+        and instance.get("address")
+        and instance.get("connection") in SSH_CONNECTIONS
+    ]
+
+
+def _ssh_command(config: Config, instance: dict[str, Any], *args: str) -> list[str]:
+    """Build an ssh command line for an instance.
+
+    Args:
+        config: Configuration of the scenario.
+        instance: Instance config entry of the instance.
+        *args: Arguments placed ahead of the connection options, which ssh
+            gives precedence.
+
+    Returns:
+        The command line.
+    """
+    cmd = ["ssh", *args, "-o", f"ControlPath={control_path()}"]
+    cmd.extend(shlex.split(" ".join(config.driver.ssh_connection_options)))
+    if instance.get("port"):
+        cmd.extend(("-p", str(instance["port"])))
+    if instance.get("user"):
+        cmd.extend(("-l", str(instance["user"])))
+    if instance.get("identity_file"):
+        cmd.extend(("-i", str(instance["identity_file"])))
+    cmd.append(str(instance["address"]))
+    return cmd
+
+
+def _run_all(commands: list[list[str]]) -> list[int]:
+    """Run ssh commands concurrently.
+
+    Args:
+        commands: The command lines to run.
+
+    Returns:
+        The return code of each command, -1 for those that did not finish.
+    """
+    if shutil.which("ssh") is None:
+        LOG.debug("ssh is not installed, not pooling connections.")
+        return [-1] * len(commands)
+    processes = [
+        subprocess.Popen(
+            cmd,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        for cmd in commands
+    ]
+    return [_wait(process) for process in processes]
+
+
+def _wait(process: subprocess.Popen[bytes]) -> int:
+    """Wait for an ssh command, killing it once it exceeds the connect timeout.
+
+    Args:
+        process: The running command.
+
+    Returns:
+        The return code, -1 if the command was killed.
+    """
+    try:
+        return process.wait(timeout=CONNECT_TIMEOUT + 5)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
+        return -1
+
+
+def open_masters(config: Config) -> None:
+    """Open a master connection to each instance that has none yet.
+
+    Failures are not fatal, connections are then opened on first use.
+
+    Args:
+        config: Configuration of the scenario.
+    """
+    if not enabled():
+        return
+    targets = _ssh_targets(config)
+    if not targets:
+        return
+    try:
+        running = _run_all([_ssh_command(config, target, "-O", "check") for target in targets])
+        missing = [target for target, code in zip(targets, running, strict=True) if code != 0]
+        codes = _open_all(config, missing)
+    except OSError as exc:
+        LOG.debug("Unable to open SSH master connections: %s", exc)
+        return
+    opened = []
+    for target, code in zip(missing, codes, strict=True):
+        if code:
+            LOG.debug("Unable to open an SSH master connection to %s", target["address"])
+        else:
+            opened.append(target)
+    if opened:
+        path = _masters_file(config)
+        with contextlib.suppress(OSError):
+            util.atomic_write_file(path, json.dumps(_opened_masters(config) + opened), "")
+
+
+def _masters_file(config: Config) -> Path:
+    """Location of the record of the masters a scenario opened.
+
+    Args:
+        config: Configuration of the scenario.
+
+    Returns:
+        Path to the file, in the ephemeral directory of the scenario.
+    """
+    return Path(config.scenario.ephemeral_directory) / MASTERS_FILE
+
+
+def _opened_masters(config: Config) -> list[dict[str, Any]]:
+    """Return the instances a scenario opened a master connection to.
+
+    Args:
+        config: Configuration of the scenario.
+
+    Returns:
+        Instance config entries of the instances.
+    """
+    try:
+        masters = json.loads(_masters_file(config).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return []
+    return [master for master in masters if isinstance(master, dict) and master.get("address")]
+
+
+def _open_all(config: Config, targets: list[dict[str, Any]]) -> list[int]:
+    """Open master connections concurrently.
+
+    Args:
+        config: Configuration of the scenario.
+        targets: Instance config entries of the instances to connect to.
+
+    Returns:
+        The return code of each ssh command.
+    """
+    return _run_all(
+        [
+            _ssh_command(
+                config,
+                target,
+                "-f",
+                "-N",
+                "-o",
+                "ControlMaster=yes",
+                "-o",
+                f"ControlPersist={CONTROL_PERSIST}",
+                "-o",
+                "BatchMode=yes",
+                "-o",
+                f"ConnectTimeout={CONNECT_TIMEOUT}",
+            )
+            for target in targets
+        ],
+    )
+
+
+def close_masters(config: Config) -> None:
+    """Stop the master connections a scenario opened.
+
+    Masters opened by other scenarios, or on first use, are left alone.
+
+    Args:
+        config: Configuration of the scenario.
+    """
+    if not enabled():
+        return
+    masters = _opened_masters(config)
+    with contextlib.suppress(OSError):
+        _run_all([_ssh_command(config, master, "-O", "stop") for master in masters])
+        _masters_file(config).unlink()
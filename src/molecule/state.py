@@ -21,7 +21,13 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+import json
+import os
+import sqlite3
+import threading
+
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from pathlib import Path
 from typing import TYPE_CHECKING, TypedDict, TypeVar, cast
 
@@ -29,16 +35,25 @@ from molecule import util
 
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
     from molecule.config import Config
 VALID_KEYS = [
     "created",
     "converged",
     "driver",
     "prepared",
+    "leased",
+    "restored",
     "run_uuid",
     "is_parallel",
     "molecule_yml_date_modified",
 ]
+# Keys describing the instances themselves. Under shared_state these are
+# shared by every scenario, all other keys are tracked per scenario.
+SHARED_KEYS = ("created", "driver", "leased", "restored", "run_uuid", "is_parallel")
+STATE_BACKENDS = ("yaml", "sqlite")
+SQLITE_STATE_FILE = "state.db"
 F = TypeVar("F", bound=Callable[..., None])
 
 
@@ -54,6 +69,8 @@ class StateData(TypedDict):
         created: Has scenario been created:
         driver: Driver for scenario.
         prepared: Has scenario prepare run.
+        leased: Identifier of the pool lease the instances came from.
+        restored: Name of the snapshot the instances were restored from.
         molecule_yml_date_modified: Modified date of molecule.yml file.
         run_uuid: UUID of active run.
         is_parallel: Is this run parallel.
@@ -63,13 +80,144 @@ class StateData(TypedDict):
     created: bool
     driver: str | None
     prepared: bool
+    leased: str | None
+    restored: str | None
     molecule_yml_date_modified: float | None
     run_uuid: str
     is_parallel: bool
 
 
+def get_backend() -> str:
+    """Return the state backend selected by ``MOLECULE_STATE_BACKEND``.
+
+    Returns:
+        Either "yaml" (the default) or "sqlite".
+
+    Raises:
+        InvalidState: If an unknown backend is requested.
+    """
+    backend = os.environ.get("MOLECULE_STATE_BACKEND", "yaml").lower()
+    if backend not in STATE_BACKENDS:
+        msg = f"Invalid MOLECULE_STATE_BACKEND '{backend}', expected one of {STATE_BACKENDS}."
+        raise InvalidState(msg)
+    return backend
+
+
+class SQLiteStore:
+    """Scenario state stored as rows of a local SQLite database.
+
+    Each row holds a single key for a single scope (a scenario name, or the
+    empty string for keys shared by all scenarios), so concurrent workers
+    update individual keys in short transactions rather than rewriting a
+    whole file, and always read the latest committed values.
+
+    One connection is kept per store and process: a process forked from
+    another opens its own, since SQLite connections must not be shared across
+    a fork. Operations are serialized by a lock, so threads may share a store.
+    """
+
+    def __init__(self, path: Path, timeout: float = 60.0) -> None:
+        """Initialize the store, creating the database if needed.
+
+        Args:
+            path: Path of the database file.
+            timeout: Seconds to wait for a lock held by another process.
+        """
+        self.path = path
+        self._timeout = timeout
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self._pid = 0
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connection() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS state ("
+                "scope TEXT NOT NULL, key TEXT NOT NULL, value TEXT NOT NULL, "
+                "PRIMARY KEY (scope, key))",
+            )
+
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        """Hold the connection of this process, opening it if needed.
+
+        Yields:
+            The connection.
+        """
+        with self._lock:
+            if self._conn is None or self._pid != os.getpid():
+                # A connection inherited through fork is abandoned, not closed,
+                # as closing it could disturb the parent's use of the database.
+                # isolation_level=None lets us issue BEGIN IMMEDIATE ourselves.
+                self._conn = sqlite3.connect(
+                    self.path,
+                    timeout=self._timeout,
+                    isolation_level=None,
+                    check_same_thread=False,
+                )
+                self._pid = os.getpid()
+            yield self._conn
+
+    def close(self) -> None:
+        """Close the connection of this process, if open."""
+        with self._lock:
+            if self._conn is not None and self._pid == os.getpid():
+                self._conn.close()
+            self._conn = None
+
+    def load(self, scopes: list[str]) -> dict[tuple[str, str], object]:
+        """Read every key stored for the given scopes.
+
+        Args:
+            scopes: Scopes to read.
+
+        Returns:
+            A dict mapping ``(scope, key)`` to the stored value.
+        """
+        placeholders = ", ".join("?" * len(scopes))
+        with self._connection() as conn:
+            rows = conn.execute(
+                f"SELECT scope, key, value FROM state WHERE scope IN ({placeholders})",  # noqa: S608
+                scopes,
+            ).fetchall()
+        return {(scope, key): json.loads(value) for scope, key, value in rows}
+
+    def update(
+        self,
+        items: Mapping[tuple[str, str], object],
+        clear_scopes: list[str] | None = None,
+    ) -> None:
+        """Atomically clear scopes and then set keys.
+
+        Args:
+            items: A dict mapping ``(scope, key)`` to the new value.
+            clear_scopes: Scopes to delete before setting ``items``, or an
+                empty list to delete every scope.
+        """
+        with self._connection() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                if clear_scopes == []:
+                    conn.execute("DELETE FROM state")
+                elif clear_scopes:
+                    conn.executemany(
+                        "DELETE FROM state WHERE scope = ?",
+                        [(scope,) for scope in clear_scopes],
+                    )
+                conn.executemany(
+                    "INSERT OR REPLACE INTO state (scope, key, value) VALUES (?, ?, ?)",
+                    [(scope, key, json.dumps(value)) for (scope, key), value in items.items()],
+                )
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+
 def marshal(func: F) -> F:
-    """Decorator to immediately write state to file after call finishes.
+    """Decorator to write state to file after call finishes.
+
+    Inside a :meth:`State.transaction` the write is deferred until the
+    outermost transaction exits.
 
     Args:
         func: Function to decorate.
@@ -80,7 +228,9 @@ def marshal(func: F) -> F:
 
     def wrapper(self: State, *args: object, **kwargs: object) -> None:
         func(self, *args, **kwargs)
-        self._write_state_file()
+        self._dirty = True
+        if not self._transaction_depth:
+            self.flush()
 
     return cast("F", wrapper)
 
@@ -91,7 +241,14 @@ class State:
     Intended to be used as a singleton throughout a given Molecule config.
     The initial state is serialized to disk if the file does not exist,
     otherwise is deserialized from the existing state file.  Changes made to
-    the object are immediately serialized.
+    the object are immediately serialized, unless they are made inside a
+    :meth:`transaction`, in which case they are coalesced into a single write.
+
+    Setting ``MOLECULE_STATE_BACKEND=sqlite`` stores the state in a
+    :class:`SQLiteStore` in the ephemeral directory instead of a YAML file.
+    Values are then read fresh on every access outside a transaction, and
+    once when the outermost transaction is entered. With shared_state only
+    the keys in ``SHARED_KEYS`` are shared between scenarios.
 
     State is not a top level option in Molecule's config.  It's purpose is for
     bookkeeping, and each :class:`.Config` object has a reference to a State_
@@ -110,9 +267,16 @@ class State:
             config: An instance of a Molecule config.
         """
         self._config = config
+        self._transaction_depth = 0
+        self._dirty = False
+        self._pending: dict[str, object] = {}
+        self._reset_pending = False
         self._state_file = self._get_state_file()
+        self._store: SQLiteStore | None = None
+        if self._state_file.name == SQLITE_STATE_FILE:
+            self._store = SQLiteStore(self._state_file)
         self._data = self._get_data()
-        self._write_state_file()
+        self.flush()
 
     @property
     def state_file(self) -> str:
@@ -130,7 +294,7 @@ class State:
         Returns:
             Whether the run has converged.
         """
-        return self._data["converged"]
+        return self._current()["converged"]
 
     @property
     def created(self) -> bool:
@@ -139,7 +303,7 @@ class State:
         Returns:
             Whether scenario has been created.
         """
-        return self._data["created"]
+        return self._current()["created"]
 
     @property
     def driver(self) -> str | None:
@@ -148,7 +312,7 @@ class State:
         Returns:
             Name of the driver for the scenario.
         """
-        return self._data["driver"]
+        return self._current()["driver"]
 
     @property
     def prepared(self) -> bool:
@@ -157,7 +321,25 @@ class State:
         Returns:
             Whether scenario prepare has run.
         """
-        return self._data["prepared"]
+        return self._current()["prepared"]
+
+    @property
+    def leased(self) -> str | None:
+        """Pool lease the instances came from.
+
+        Returns:
+            Identifier of the lease, None when the instances are not pooled.
+        """
+        return self._current()["leased"]
+
+    @property
+    def restored(self) -> str | None:
+        """Snapshot the instances were restored from.
+
+        Returns:
+            Name of the snapshot, None when the instances were not restored.
+        """
+        return self._current()["restored"]
 
     @property
     def run_uuid(self) -> str:
@@ -166,7 +348,7 @@ class State:
         Returns:
             The UUID for this scenario run.
         """
-        return self._data["run_uuid"]
+        return self._current()["run_uuid"]
 
     @property
     def is_parallel(self) -> bool:
@@ -175,7 +357,7 @@ class State:
         Returns:
             Whether Molecule is in parallel mode.
         """
-        return self._data["is_parallel"]
+        return self._current()["is_parallel"]
 
     @property
     def molecule_yml_date_modified(self) -> float | None:
@@ -184,12 +366,23 @@ class State:
         Returns:
             The timestamp of the last modification date of molecule.yml.
         """
-        return self._data.get("molecule_yml_date_modified")
+        return self._current().get("molecule_yml_date_modified")
+
+    @property
+    def backend(self) -> str:
+        """Storage backend in use.
+
+        Returns:
+            Either "yaml" or "sqlite".
+        """
+        return "yaml" if self._store is None else "sqlite"
 
     @marshal
     def reset(self) -> None:
         """Reset state data."""
         self._data = self._default_data()
+        self._pending.clear()
+        self._reset_pending = True
 
     @marshal
     def change_state(self, key: str, value: object) -> None:
@@ -207,14 +400,78 @@ class State:
         if key not in VALID_KEYS:
             raise InvalidState
         self._data[key] = value  # type: ignore[literal-required]
+        self._pending[key] = value
+
+    @contextmanager
+    def transaction(self) -> Iterator[State]:
+        """Coalesce state changes into a single write of the state file.
+
+        Changes made inside the block are kept in memory and written once,
+        atomically, when the outermost transaction exits. The write also
+        happens when the block raises, so completed changes are never lost.
+        Transactions may be nested.
+
+        Yields:
+            This state instance.
+        """
+        if self._store is not None and not self._transaction_depth and not self._dirty:
+            # Start from the latest committed values, not those of the last read.
+            self._data = self._get_data()
+        self._transaction_depth += 1
+        try:
+            yield self
+        finally:
+            self._transaction_depth -= 1
+            if not self._transaction_depth:
+                self.flush()
+
+    def flush(self) -> None:
+        """Write pending state changes to the state file, if any."""
+        if not self._dirty:
+            return
+        if self._store is None:
+            self._write_state_file()
+        else:
+            clear_scopes = None
+            if self._reset_pending:
+                # Resetting shared state means the shared instances are gone.
+                clear_scopes = [] if self._config.shared_state else [self._scope("prepared")]
+            self._store.update(
+                {(self._scope(key), key): value for key, value in self._pending.items()},
+                clear_scopes=clear_scopes,
+            )
+        self._pending.clear()
+        self._reset_pending = False
+        self._dirty = False
+
+    def _current(self) -> StateData:
+        if self._store is not None and not self._transaction_depth:
+            # Pick up changes committed by other processes.
+            self._data = self._get_data()
+        return self._data
+
+    def _scope(self, key: str) -> str:
+        if self._config.shared_state and key in SHARED_KEYS:
+            return ""
+        return self._config.scenario.name
 
     def _get_data(self) -> StateData:
+        if self._store is not None:
+            data = self._default_data()
+            stored = self._store.load(["", self._config.scenario.name])
+            for key in VALID_KEYS:
+                if (self._scope(key), key) in stored:
+                    data[key] = stored[self._scope(key), key]  # type: ignore[literal-required]
+            return data
         if self._state_file.is_file():
             loaded = self._load_file()
             if loaded:
                 defaults = self._default_data()
                 defaults.update(loaded)
+                # Only rewrite an existing file when loading filled in missing keys.
+                self._dirty = defaults != loaded
                 return defaults
+        self._dirty = True
         return self._default_data()
 
     def _default_data(self) -> StateData:
@@ -223,6 +480,8 @@ class State:
             "created": False,
             "driver": None,
             "prepared": False,
+            "leased": None,
+            "restored": None,
             "molecule_yml_date_modified": None,
             "run_uuid": self._config._run_uuid,  # noqa: SLF001
             "is_parallel": self._config.is_parallel,
@@ -236,4 +495,5 @@ class State:
         util.atomic_write_file(self.state_file, util.safe_dump(self._data))
 
     def _get_state_file(self) -> Path:
-        return Path(self._config.scenario.ephemeral_directory) / "state.yml"
+        name = SQLITE_STATE_FILE if get_backend() == "sqlite" else "state.yml"
+        return Path(self._config.scenario.ephemeral_directory) / name
@@ -130,3 +130,45 @@ def checksum(data: str | Path, length: int = 5) -> str:
     base64_hash = base64.urlsafe_b64encode(hash_object.digest()).decode("utf-8")
     # Truncate the result to the desired length
     return base64_hash[:length]
+
+
+def boolean(value: object, *, default: bool | None = None) -> bool:
+    """Evaluate any object as boolean matching ansible behavior.
+
+    Args:
+        value: The value to evaluate as a boolean.
+        default: If provided, return this value for invalid inputs instead of raising TypeError.
+
+    Returns:
+        The boolean value of value, or default if value is invalid and default is provided.
+
+    Raises:
+        TypeError: If value does not resolve to a valid boolean and no default is provided.
+    """
+    # Based on https://github.com/ansible/ansible/blob/devel/lib/ansible/module_utils/parsing/convert_bool.py
+
+    BOOLEANS_TRUE = frozenset(  # noqa: N806
+        ("y", "yes", "on", "1", "true", "t", 1, 1.0, True),
+    )
+    BOOLEANS_FALSE = frozenset(  # noqa: N806
+        ("n", "no", "off", "0", "false", "f", 0, 0.0, False, ""),
+    )
+    BOOLEANS = BOOLEANS_TRUE.union(BOOLEANS_FALSE)  # noqa: N806
+
+    if isinstance(value, bool):
+        return value
+
+    normalized_value = str(value).lower().strip()
+
+    if normalized_value in BOOLEANS_TRUE:
+        return True
+    if normalized_value in BOOLEANS_FALSE:
+        return False
+
+    # If we have a default, return it for invalid values
+    if default is not None:
+        return default
+
+    raise TypeError(  # noqa: TRY003
+        f"The value '{value!s}' is not a valid boolean.  Valid booleans include: {', '.join(repr(i) for i in BOOLEANS)!s}",  # noqa: EM102
+    )
@@ -123,20 +123,28 @@ class PlaybookData(TypedDict, total=False):
 
     Attributes:
         cleanup: The cleanup playbook.
+        clone: The playbook cloning instances from a snapshot for the pool.
         create: The create playbook.
         converge: The converge playbook.
         destroy: The destroy playbook.
+        discard: The playbook destroying instances cloned for the pool.
         prepare: The prepare playbook.
+        restore: The playbook recreating instances from a snapshot.
         side_effect: The side_effect playbook.
+        snapshot: The playbook saving a snapshot of the prepared instances.
         verify: The verify playbook.
     """
 
     cleanup: str
+    clone: str
     create: str
     converge: str
     destroy: str
+    discard: str
     prepare: str
+    restore: str
     side_effect: str
+    snapshot: str
     verify: str
 
 
@@ -221,12 +229,14 @@ class AnsibleData(TypedDict, total=False):
         cfg: Ansible configuration options (maps to ansible.cfg).
         executor: Executor configuration including backend and arguments.
         env: Environment variables for ansible execution.
+        fact_cache: Cache the facts gathered from the instances between steps.
         playbooks: Playbook paths for different scenarios.
     """
 
     cfg: dict[str, Any]
     executor: ExecutorData
     env: dict[str, str]
+    fact_cache: bool
     playbooks: PlaybookData
 
 
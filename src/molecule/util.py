@@ -25,9 +25,11 @@ import fnmatch
 import logging
 import os
 import re
+import stat
 import sys
 import tempfile
 
+from functools import cache
 from pathlib import Path
 from typing import TYPE_CHECKING, overload
 
@@ -35,8 +37,6 @@ import click
 import jinja2
 import yaml
 
-from ansible_compat.ports import cache
-
 from molecule.constants import (
     MOLECULE_COLLECTION_GLOB,
     MOLECULE_COLLECTION_ROOT,
@@ -45,6 +45,7 @@ from molecule.constants import (
     MOLECULE_ROOT,
 )
 from molecule.exceptions import ConfigLoadError, MoleculeError
+from molecule.text import boolean as boolean  # noqa: PLC0414  # re-exported
 
 
 if TYPE_CHECKING:
@@ -278,6 +279,30 @@ def atomic_write_file(filename: str | Path, content: str, header: str | None = N
             tmp_path.unlink(missing_ok=True)
 
 
+def private_directory(path: Path) -> Path:
+    """Create a directory only the current user can access, or check an existing one.
+
+    Sockets are created in such directories under predictable names, so a
+    directory created by another user, or opened to them, is refused.
+
+    Args:
+        path: The directory.
+
+    Returns:
+        The directory.
+
+    Raises:
+        MoleculeError: If the directory is not owned by the current user or
+            is accessible to others.
+    """
+    path.mkdir(mode=0o700, parents=True, exist_ok=True)
+    info = path.lstat()
+    if not stat.S_ISDIR(info.st_mode) or info.st_uid != os.getuid() or info.st_mode & 0o077:
+        msg = f"Refusing to use {path}, it must be a directory of the current user with mode 0700."
+        raise MoleculeError(msg)
+    return path
+
+
 def molecule_prepender(content: str) -> str:
     """Return molecule identification header.
 
@@ -601,48 +626,6 @@ def lookup_config_file(filename: str) -> str | None:
     return None
 
 
-def boolean(value: object, *, default: bool | None = None) -> bool:
-    """Evaluate any object as boolean matching ansible behavior.
-
-    Args:
-        value: The value to evaluate as a boolean.
-        default: If provided, return this value for invalid inputs instead of raising TypeError.
-
-    Returns:
-        The boolean value of value, or default if value is invalid and default is provided.
-
-    Raises:
-        TypeError: If value does not resolve to a valid boolean and no default is provided.
-    """
-    # Based on https://github.com/ansible/ansible/blob/devel/lib/ansible/module_utils/parsing/convert_bool.py
-
-    BOOLEANS_TRUE = frozenset(  # noqa: N806
-        ("y", "yes", "on", "1", "true", "t", 1, 1.0, True),
-    )
-    BOOLEANS_FALSE = frozenset(  # noqa: N806
-        ("n", "no", "off", "0", "false", "f", 0, 0.0, False, ""),
-    )
-    BOOLEANS = BOOLEANS_TRUE.union(BOOLEANS_FALSE)  # noqa: N806
-
-    if isinstance(value, bool):
-        return value
-
-    normalized_value = str(value).lower().strip()
-
-    if normalized_value in BOOLEANS_TRUE:
-        return True
-    if normalized_value in BOOLEANS_FALSE:
-        return False
-
-    # If we have a default, return it for invalid values
-    if default is not None:
-        return default
-
-    raise TypeError(  # noqa: TRY003
-        f"The value '{value!s}' is not a valid boolean.  Valid booleans include: {', '.join(repr(i) for i in BOOLEANS)!s}",  # noqa: EM102
-    )
-
-
 def dict2args(data: MutableMapping[str, str | bool]) -> list[str]:
     """Convert a dictionary of options to command like arguments.
 
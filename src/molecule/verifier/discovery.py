@@ -0,0 +1,145 @@
+"""Cached discovery of test files.
+
+Walking a test directory, following symbolic links into shared test
+libraries, is repeated by every scenario using it. The tests found in a
+directory tree are cached along with the mtime of each directory walked, in
+memory and in the ``testinfra`` directory of the runtime cache directory, so
+scenarios run by other processes reuse them too.
+
+Adding, removing or renaming a file changes the mtime of its directory, so the
+cached tests are used as long as no directory of the tree changed. Directories
+changed while the tree was walked, or within the mtime resolution of the file
+system, invalidate the cache, since a change could be missed otherwise.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import fnmatch
+import hashlib
+import json
+import os
+import threading
+import time
+
+from pathlib import Path
+from typing import NamedTuple
+
+from molecule import util
+
+
+TEST_PATTERN = "test_*.py"
+# Mtimes this close to the walk may hide a change made right after it.
+RACY_WINDOW_NS = 2 * 10**9
+
+
+class Discovery(NamedTuple):
+    """Tests found in a directory tree.
+
+    Attributes:
+        tests: Paths to the test files.
+        mtimes: Mtime in nanoseconds of each directory walked.
+        scanned: Time in nanoseconds the walk started.
+    """
+
+    tests: list[str]
+    mtimes: dict[str, int]
+    scanned: int
+
+
+_discoveries: dict[str, Discovery] = {}
+_lock = threading.Lock()
+
+
+def _scan(directory: str) -> Discovery:
+    """Walk a directory tree for tests.
+
+    Args:
+        directory: The directory.
+
+    Returns:
+        The tests found.
+    """
+    scanned = time.time_ns()
+    tests: list[str] = []
+    mtimes: dict[str, int] = {}
+    for root, _dirs, files in os.walk(directory, topdown=True, followlinks=True):
+        with contextlib.suppress(OSError):
+            mtimes[root] = os.stat(root).st_mtime_ns  # noqa: PTH116
+        tests.extend(
+            str(Path(root) / basename)
+            for basename in files
+            if fnmatch.fnmatch(basename, TEST_PATTERN)
+        )
+    return Discovery(tests, mtimes, scanned)
+
+
+def _is_fresh(discovery: Discovery) -> bool:
+    """Whether no directory of a walked tree changed since.
+
+    Args:
+        discovery: The tests found by the walk.
+
+    Returns:
+        True if the tests found are still valid.
+    """
+    for directory, mtime in discovery.mtimes.items():
+        if mtime >= discovery.scanned - RACY_WINDOW_NS:
+            return False
+        try:
+            if os.stat(directory).st_mtime_ns != mtime:  # noqa: PTH116
+                return False
+        except OSError:
+            return False
+    return bool(discovery.mtimes)
+
+
+def _load(path: Path) -> Discovery | None:
+    """Load cached tests.
+
+    Args:
+        path: The cache file.
+
+    Returns:
+        The cached tests, or None if missing or unreadable.
+    """
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        return Discovery(list(data["tests"]), dict(data["mtimes"]), int(data["scanned"]))
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def find_tests(directory: str | Path, cache_dir: Path | None = None) -> list[str]:
+    """Find the tests of a directory tree, using the cache when still valid.
+
+    Args:
+        directory: The directory.
+        cache_dir: The runtime cache directory, None to only cache in memory.
+
+    Returns:
+        Paths to the test files, unsorted.
+    """
+    root = os.path.abspath(directory)  # noqa: PTH100
+    cache_file = None
+    if cache_dir is not None:
+        digest = hashlib.sha256(root.encode()).hexdigest()
+        cache_file = cache_dir / "testinfra" / f"{digest}.json"
+
+    with _lock:
+        discovery = _discoveries.get(root)
+    if discovery is None and cache_file is not None:
+        discovery = _load(cache_file)
+    if discovery is not None and _is_fresh(discovery):
+        with _lock:
+            _discoveries[root] = discovery
+        return list(discovery.tests)
+
+    discovery = _scan(root)
+    with _lock:
+        _discoveries[root] = discovery
+    if cache_file is not None and discovery.mtimes:
+        with contextlib.suppress(OSError):
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            util.atomic_write_file(cache_file, json.dumps(discovery._asdict()), "")
+    return list(discovery.tests)
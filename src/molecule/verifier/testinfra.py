@@ -22,24 +22,51 @@
 from __future__ import annotations
 
 import glob
+import importlib.util
 import os
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import TYPE_CHECKING, cast
 
 from molecule import logger, util
 from molecule.api import Verifier
-from molecule.exceptions import ScenarioFailureError
+from molecule.console import original_stderr, original_stdout
+from molecule.exceptions import MoleculeError, ScenarioFailureError
 from molecule.reporting.definitions import CompletionState
+from molecule.verifier import discovery, testinfra_worker
 
 
 if TYPE_CHECKING:
     from collections.abc import MutableMapping
+    from subprocess import CompletedProcess
 
     from molecule.config import Config
     from molecule.verifier.base import Schema
 
 
+PARALLEL_MODES = ("hosts", "xdist")
+
+
+def get_parallel_mode() -> str | None:
+    """Return the parallel mode selected by ``MOLECULE_TESTINFRA_PARALLEL``.
+
+    Returns:
+        ``hosts`` to run one pytest process per host, ``xdist`` to spread the
+        tests over pytest-xdist workers, or None to run them serially.
+
+    Raises:
+        MoleculeError: If the value is not a known mode.
+    """
+    mode = os.environ.get("MOLECULE_TESTINFRA_PARALLEL", "").strip().lower()
+    if not mode:
+        return None
+    if mode not in PARALLEL_MODES:
+        msg = f"Invalid MOLECULE_TESTINFRA_PARALLEL '{mode}', expected one of {', '.join(PARALLEL_MODES)}."
+        raise MoleculeError(msg)
+    return mode
+
+
 class Testinfra(Verifier):
     """The Testinfra verifier."""
 
@@ -182,23 +209,108 @@ class Testinfra(Verifier):
         msg = f"Executing Testinfra tests found in {self.directory}/..."
         self._log.info(msg)
 
-        result = self._config.app.run_command(
-            self._testinfra_command,
-            env=self.env,
-            debug=self._config.debug,
-            cwd=Path(self._config.scenario.directory),
-            command_borders=self._config.command_borders,
-        )
-        if result.returncode == 0:
+        hosts = self.hosts()
+        mode = get_parallel_mode() if len(hosts) > 1 else None
+        if mode == "hosts":
+            self._execute_sharded(hosts)
+            return
+        if mode == "xdist" and importlib.util.find_spec("xdist") is None:
+            self._log.warning("pytest-xdist is not installed, running the tests serially.")
+            mode = None
+        if mode == "xdist" and "n" not in self.options:
+            workers = min(len(hosts), os.cpu_count() or 1)
+            self._testinfra_command[1:1] = ["-n", str(workers)]
+
+        returncode = None
+        if mode is None and testinfra_worker.enabled():
+            returncode = testinfra_worker.run(
+                self._config,
+                self._testinfra_command[1:],
+                self.env,
+            )
+        if returncode is None:
+            result = self._config.app.run_command(
+                self._testinfra_command,
+                env=self.env,
+                debug=self._config.debug,
+                cwd=Path(self._config.scenario.directory),
+                command_borders=self._config.command_borders,
+            )
+            returncode = result.returncode
+        if returncode == 0:
             msg = "Verifier completed successfully."
             self._log.info(msg)
         else:
             msg = "Verifier tests failed"
             self._config.scenario.results.add_completion(CompletionState.failed(note=msg))
-            raise ScenarioFailureError(message=msg, code=result.returncode)
+            raise ScenarioFailureError(message=msg, code=returncode)
+
+    def hosts(self) -> list[str]:
+        """Hosts the tests run against.
+
+        Returns:
+            The hosts of the ``hosts`` option, or the platform names.
+        """
+        selected = self.options.get("hosts")
+        if isinstance(selected, str):
+            return [host.strip() for host in selected.split(",") if host.strip()]
+        return [platform["name"] for platform in self._config.platforms.instances]
+
+    def _run_shard(self, host: str) -> CompletedProcess[str]:
+        """Run the tests against one host, capturing the output.
+
+        Args:
+            host: The host.
+
+        Returns:
+            The completed pytest process.
+        """
+        cmd = list(self._testinfra_command)
+        if "--hosts" in cmd:
+            index = cmd.index("--hosts")
+            del cmd[index : index + 2]
+        return self._config.runtime.run(
+            args=[cmd[0], "--hosts", host, *cmd[1:]],
+            env=util.merge_dicts(self._config.runtime.environ, self.env),
+            cwd=Path(self._config.scenario.directory),
+            tee=False,
+            set_acp=False,
+        )
+
+    def _execute_sharded(self, hosts: list[str]) -> None:
+        """Run the tests against each host in a pytest process of its own.
+
+        Output is printed host by host once every process finished.
+
+        Args:
+            hosts: The hosts to test.
+
+        Raises:
+            ScenarioFailureError: when the tests failed on any host.
+        """
+        self._log.info("Running tests against %d hosts in parallel", len(hosts))
+        with ThreadPoolExecutor(max_workers=len(hosts)) as executor:
+            results = list(executor.map(self._run_shard, hosts))
+
+        failed = []
+        for host, result in zip(hosts, results, strict=True):
+            self._log.info("Testinfra output for %s:", host)
+            original_stdout.write(result.stdout or "")
+            original_stdout.flush()
+            original_stderr.write(result.stderr or "")
+            original_stderr.flush()
+            if result.returncode != 0:
+                failed.append((host, result.returncode))
+        if not failed:
+            self._log.info("Verifier completed successfully.")
+            return
+
+        msg = f"Verifier tests failed on {', '.join(host for host, _ in failed)}"
+        self._config.scenario.results.add_completion(CompletionState.failed(note=msg))
+        raise ScenarioFailureError(message=msg, code=failed[0][1])
 
     def _get_tests(self, action_args: list[str] | None = None) -> list[str]:
-        """Walk the verifier's directory for tests.
+        """Find the tests in the verifier's directory, see ``discovery.find_tests``.
 
         Args:
             action_args: List of paths to search.
@@ -206,27 +318,15 @@ class Testinfra(Verifier):
         Returns:
             List of test files.
         """
+        cache_dir = self._config.runtime.cache_dir
         if action_args:
             tests = []
             for arg in action_args:
-                args_tests = list(
-                    util.os_walk(
-                        os.path.join(self._config.scenario.directory, arg),  # noqa: PTH118
-                        "test_*.py",
-                        followlinks=True,
-                    ),
-                )
-                tests.extend(args_tests)
+                directory = os.path.join(self._config.scenario.directory, arg)  # noqa: PTH118
+                tests.extend(discovery.find_tests(directory, cache_dir))
             return sorted(tests)
         return sorted(
-            list(
-                util.os_walk(
-                    self.directory,
-                    "test_*.py",
-                    followlinks=True,
-                ),
-            )
-            + self.additional_files_or_dirs,
+            discovery.find_tests(self.directory, cache_dir) + self.additional_files_or_dirs,
         )
 
     def schema(self) -> Schema:
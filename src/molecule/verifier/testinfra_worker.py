@@ -0,0 +1,414 @@
+"""Persistent pytest worker running Testinfra tests between verify invocations.
+
+Setting ``MOLECULE_TESTINFRA_WORKER`` runs the tests of a scenario in a pytest
+worker that outlives the verify step, listening on a Unix socket. The first
+verify starts it, later ones send it their pytest arguments together with their
+standard output and error, which pytest writes to while the tests run. Since
+the worker keeps its interpreter, testinfra, the test modules and the hosts
+testinfra caches, with their backend connections, are only set up once.
+
+Test modules and other user code imported by the tests are dropped and
+imported again once any of their files changed. A worker only serves callers
+with the same environment, working directory, inventory and instances it
+started with.
+Otherwise it stops, and a new one is started in its place. Workers stop on
+their own when idle for IDLE_TIMEOUT seconds.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import importlib
+import json
+import logging
+import os
+import signal
+import socket
+import subprocess
+import sys
+import sysconfig
+import tempfile
+import time
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from molecule import ipc, util
+from molecule.exceptions import MoleculeError
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+
+    from molecule.config import Config
+
+
+LOG = logging.getLogger(__name__)
+
+IDLE_TIMEOUT = 900
+START_TIMEOUT = 30
+# Exit code of pytest for internal errors.
+INTERNAL_ERROR = 3
+
+
+def enabled() -> bool:
+    """Whether the worker was requested with ``MOLECULE_TESTINFRA_WORKER``.
+
+    Returns:
+        True if tests run in a persistent worker.
+    """
+    return util.boolean(os.environ.get("MOLECULE_TESTINFRA_WORKER", ""), default=False)
+
+
+def socket_path(config: Config) -> Path:
+    """Location of the worker socket of a scenario.
+
+    It lives in the user runtime directory, or in the temporary directory when
+    there is none, as socket paths are limited to about 100 characters. Callers
+    send their standard output and error to the worker, so only a directory of
+    the current user that nobody else can access is used.
+
+    Args:
+        config: Configuration of the scenario.
+
+    Returns:
+        Path to the Unix socket.
+    """
+    digest = hashlib.sha256(config.scenario.ephemeral_directory.encode()).hexdigest()[:16]
+    if runtime_dir := os.environ.get("XDG_RUNTIME_DIR"):
+        directory = Path(runtime_dir) / "molecule"
+    else:
+        directory = Path(tempfile.gettempdir()) / f"molecule-{os.getuid()}"
+    return util.private_directory(directory) / f"testinfra-{digest}.sock"
+
+
+def worker_key(env: Mapping[str, str], cwd: str, inventory: Path | None, run_uuid: str) -> str:
+    """Digest what a worker was started with.
+
+    Args:
+        env: Environment of pytest.
+        cwd: Working directory of pytest.
+        inventory: Inventory directory of the scenario, if any.
+        run_uuid: Run identifier of the scenario state, which changes when the
+            instances are destroyed, so cached hosts never outlive them.
+
+    Returns:
+        A hex digest that changes when a worker can no longer serve the tests.
+    """
+    # Setup rewrites the inventory before every command, so it is compared
+    # by content rather than mtime.
+    inventory_files = {}
+    if inventory is not None:
+        with contextlib.suppress(OSError):
+            inventory_files = {
+                str(path): hashlib.sha256(path.read_bytes()).hexdigest()
+                for path in sorted(inventory.rglob("*"))
+                if path.is_file()
+            }
+    data = {
+        "env": dict(env),
+        "cwd": cwd,
+        "inventory": inventory_files,
+        "python": sys.executable,
+        "run": run_uuid,
+    }
+    return hashlib.sha256(json.dumps(data, sort_keys=True).encode()).hexdigest()
+
+
+def _connect(path: Path) -> socket.socket | None:
+    """Connect to a listening worker.
+
+    Args:
+        path: Path to the worker socket.
+
+    Returns:
+        The connected socket, or None when no worker listens.
+    """
+    conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        conn.connect(str(path))
+    except OSError:
+        conn.close()
+        return None
+    return conn
+
+
+def _start(path: Path, key: str, env: Mapping[str, str], cwd: str) -> socket.socket | None:
+    """Start a worker and connect to it.
+
+    Args:
+        path: Path to the worker socket.
+        key: Key of the worker, see worker_key.
+        env: Environment of pytest.
+        cwd: Working directory of pytest.
+
+    Returns:
+        The connected socket, or None when the worker did not come up.
+    """
+    worker = subprocess.Popen(
+        [sys.executable, "-m", __name__, str(path), key],
+        env=dict(env),
+        cwd=cwd,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+    deadline = time.monotonic() + START_TIMEOUT
+    while worker.poll() is None and time.monotonic() < deadline:
+        if conn := _connect(path):
+            return conn
+        time.sleep(0.1)
+    LOG.warning("Testinfra worker did not start, running the tests without it.")
+    return None
+
+
+def request(path: Path, message: dict[str, Any]) -> dict[str, Any] | None:
+    """Send a request to a worker, with our standard output and error.
+
+    Args:
+        path: Path to the worker socket.
+        message: The request.
+
+    Returns:
+        The reply, or None when no worker listens or it went away.
+    """
+    conn = _connect(path)
+    if conn is None:
+        return None
+    with conn:
+        for stream in (sys.stdout, sys.stderr):
+            with contextlib.suppress(OSError, ValueError):
+                stream.flush()
+        try:
+            socket.send_fds(conn, [json.dumps(message).encode() + b"\n"], [1, 2])
+            return ipc.receive(conn, bytearray())
+        except (OSError, ValueError):
+            return None
+
+
+def run(config: Config, args: list[str], env: dict[str, str]) -> int | None:
+    """Run pytest in the worker of a scenario, starting one if needed.
+
+    Args:
+        config: Configuration of the scenario.
+        args: Arguments of pytest.
+        env: Environment of the verifier.
+
+    Returns:
+        The exit code of pytest, or None when the tests could not run in a
+        worker and should run in a pytest process instead.
+    """
+    env = util.merge_dicts(config.runtime.environ, env)
+    cwd = config.scenario.directory
+    inventory = Path(config.provisioner.inventory_directory) if config.provisioner else None
+    key = worker_key(env, cwd, inventory, config.state.run_uuid)
+    try:
+        path = socket_path(config)
+    except MoleculeError as exc:
+        LOG.warning("%s Running the tests without a worker.", exc)
+        return None
+
+    for _attempt in range(2):
+        reply = request(path, {"key": key, "args": args})
+        if reply is None:
+            conn = _start(path, key, env, cwd)
+            if conn is None:
+                return None
+            conn.close()
+            reply = request(path, {"key": key, "args": args})
+        if reply is None:
+            return None
+        if "returncode" in reply:
+            return int(reply["returncode"])
+        # The worker was started with another key and stopped, start a new one.
+    return None
+
+
+def _mtime(path: str) -> int | None:
+    """Return the mtime of a file.
+
+    Args:
+        path: Path to the file.
+
+    Returns:
+        The mtime in nanoseconds, None if missing.
+    """
+    try:
+        return os.stat(path).st_mtime_ns  # noqa: PTH116
+    except OSError:
+        return None
+
+
+class Worker:
+    """Run pytest sessions in a warm interpreter over a Unix socket."""
+
+    def __init__(self, path: Path, key: str) -> None:
+        """Initialize the worker.
+
+        Args:
+            path: Path of the Unix socket to listen on.
+            key: Key of the worker, see worker_key.
+        """
+        self.path = path
+        self.key = key
+        self.sock: socket.socket | None = None
+        # File and mtime of the user modules imported by the tests.
+        self.modules: dict[str, tuple[str, int | None]] = {}
+        paths = sysconfig.get_paths()
+        self.installed = tuple(
+            paths[name] for name in ("stdlib", "platstdlib", "purelib", "platlib") if name in paths
+        )
+
+    def listen(self) -> socket.socket:
+        """Bind the worker socket, replacing a stale one.
+
+        Returns:
+            The listening socket.
+
+        Raises:
+            RuntimeError: If another worker is already listening.
+            MoleculeError: If others can access the socket directory.
+        """
+        util.private_directory(self.path.parent)
+        if self.path.exists():
+            if conn := _connect(self.path):
+                conn.close()
+                msg = f"Another testinfra worker is already listening on {self.path}."
+                raise RuntimeError(msg)
+            self.path.unlink()
+
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.bind(str(self.path))
+        self.path.chmod(0o600)
+        sock.listen()
+        sock.settimeout(IDLE_TIMEOUT)
+        self.sock = sock
+        return sock
+
+    def close(self) -> None:
+        """Stop listening, so that a new worker can take over the socket."""
+        if self.sock is not None:
+            self.sock.close()
+            self.sock = None
+            with contextlib.suppress(OSError):
+                self.path.unlink()
+
+    def serve_forever(self) -> None:
+        """Accept requests until idle, interrupted or asked to stop."""
+        import pytest  # noqa: F401, PLC0415
+
+        sock = self.listen()
+        try:
+            while True:
+                try:
+                    conn, _ = sock.accept()
+                except TimeoutError:
+                    break
+                conn.settimeout(None)
+                with conn:
+                    if not self.handle(conn):
+                        break
+        finally:
+            self.close()
+
+    def handle(self, conn: socket.socket) -> bool:
+        """Run one pytest session.
+
+        Args:
+            conn: Connection of the client.
+
+        Returns:
+            False when the worker should stop.
+        """
+        data, fds, _, _ = socket.recv_fds(conn, ipc.MAX_MESSAGE, 2)
+        try:
+            message = ipc.receive(conn, bytearray(data))
+            if message is None or len(fds) != 2:  # noqa: PLR2004
+                return True
+            if message["key"] != self.key:
+                self.close()
+                ipc.send(conn, {"restart": True})
+                return False
+            returncode = self.run_pytest(message["args"], fds)
+            ipc.send(conn, {"returncode": returncode})
+        except (OSError, ValueError) as exc:
+            LOG.warning("Failed to handle request: %s", exc)
+        finally:
+            for fd in fds:
+                os.close(fd)
+        return True
+
+    def run_pytest(self, args: list[str], fds: list[int]) -> int:
+        """Run pytest, writing to the standard output and error of the client.
+
+        Args:
+            args: Arguments of pytest.
+            fds: Standard output and error of the client.
+
+        Returns:
+            The exit code of pytest.
+        """
+        import pytest  # noqa: PLC0415
+
+        self.evict_changed_modules()
+        before = set(sys.modules)
+        saved = [os.dup(1), os.dup(2)]
+        os.dup2(fds[0], 1)
+        os.dup2(fds[1], 2)
+        try:
+            returncode = int(pytest.main(args))
+        except Exception:
+            LOG.exception("Unexpected error while running pytest %s", args)
+            returncode = INTERNAL_ERROR
+        finally:
+            for stream in (sys.stdout, sys.stderr):
+                with contextlib.suppress(OSError, ValueError):
+                    stream.flush()
+            for target, fd in enumerate(saved, start=1):
+                os.dup2(fd, target)
+                os.close(fd)
+        self.track(set(sys.modules) - before)
+        return returncode
+
+    def track(self, names: Iterable[str]) -> None:
+        """Remember the user modules imported by the tests.
+
+        Args:
+            names: Names of the modules imported by a session.
+        """
+        for name in names:
+            path = getattr(sys.modules.get(name), "__file__", None)
+            if path and not path.startswith(self.installed):
+                self.modules[name] = (path, _mtime(path))
+
+    def evict_changed_modules(self) -> None:
+        """Drop the user modules when any of their files changed.
+
+        They are all dropped, since unchanged modules may hold on to objects
+        of the changed ones. Installed packages, like testinfra and its
+        backends, are kept.
+        """
+        if all(_mtime(path) == mtime for path, mtime in self.modules.values()):
+            return
+        for name in self.modules:
+            sys.modules.pop(name, None)
+        self.modules.clear()
+        importlib.invalidate_caches()
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Run a worker until it stops.
+
+    Args:
+        argv: The socket path and the worker key.
+    """
+    path, key = argv or sys.argv[1:3]
+    signal.signal(signal.SIGTERM, ipc.exit_on_signal)
+    with contextlib.suppress(KeyboardInterrupt):
+        Worker(Path(path), key).serve_forever()
+
+
+if __name__ == "__main__":
+    main()
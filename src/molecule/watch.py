@@ -0,0 +1,400 @@
+"""Watch mode, converging scenarios again whenever their sources change."""
+
+from __future__ import annotations
+
+import contextlib
+import ctypes
+import ctypes.util
+import errno
+import fnmatch
+import logging
+import os
+import select
+import stat
+import sys
+import time
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from molecule import config as config_module
+from molecule import logger
+from molecule.command import base
+from molecule.exceptions import MoleculeError
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from molecule.config import Config
+    from molecule.types import CommandArgs, MoleculeArgs
+
+
+LOG = logging.getLogger(__name__)
+
+WATCH_DEBOUNCE = 0.5
+WATCH_POLL_INTERVAL = 1.0
+IGNORED_DIRECTORIES = frozenset(
+    (
+        ".ansible",
+        ".cache",
+        ".git",
+        ".mypy_cache",
+        ".pytest_cache",
+        ".tox",
+        ".venv",
+        "__pycache__",
+        "node_modules",
+    ),
+)
+IGNORED_SUFFIXES = (".pyc", ".swp", ".swx", "~")
+
+# inotify(7) constants
+_IN_NONBLOCK = os.O_NONBLOCK
+_IN_CLOEXEC = os.O_CLOEXEC
+_IN_MASK = (
+    0x00000002  # IN_MODIFY
+    | 0x00000004  # IN_ATTRIB
+    | 0x00000040  # IN_MOVED_FROM
+    | 0x00000080  # IN_MOVED_TO
+    | 0x00000100  # IN_CREATE
+    | 0x00000200  # IN_DELETE
+)
+
+FileStates = dict[str, tuple[int, int]]
+
+
+def scan(paths: Iterable[Path]) -> tuple[FileStates, list[str]]:
+    """Record the state of every file below the given paths.
+
+    Args:
+        paths: Files and directories to scan.
+
+    Returns:
+        The ``(mtime_ns, size)`` of each file, and the directories visited.
+    """
+    files: FileStates = {}
+    directories: list[str] = []
+    seen: set[tuple[int, int]] = set()
+    stack = [os.path.abspath(path) for path in paths]  # noqa: PTH100
+    while stack:
+        path = stack.pop()
+        try:
+            st = os.stat(path)  # noqa: PTH116
+        except OSError:
+            continue
+        if not stat.S_ISDIR(st.st_mode):
+            files[path] = (st.st_mtime_ns, st.st_size)
+            continue
+        if (st.st_dev, st.st_ino) in seen:
+            continue
+        seen.add((st.st_dev, st.st_ino))
+        directories.append(path)
+        with contextlib.suppress(OSError):
+            stack.extend(_scan_directory(path, files))
+    return files, directories
+
+
+def _scan_directory(path: str, files: FileStates) -> list[str]:
+    """Record the state of the files in a directory.
+
+    Args:
+        path: The directory to scan.
+        files: Mapping updated with the state of each file.
+
+    Returns:
+        The subdirectories that are not ignored.
+    """
+    subdirectories = []
+    for entry in os.scandir(path):
+        with contextlib.suppress(OSError):
+            if entry.is_dir():
+                if entry.name not in IGNORED_DIRECTORIES:
+                    subdirectories.append(entry.path)
+            elif not entry.name.endswith(IGNORED_SUFFIXES):
+                entry_stat = entry.stat()
+                files[entry.path] = (entry_stat.st_mtime_ns, entry_stat.st_size)
+    return subdirectories
+
+
+class _Inotify:
+    """Minimal inotify binding, only used to sleep until something changes."""
+
+    def __init__(self) -> None:
+        """Create the inotify instance.
+
+        Raises:
+            OSError: If inotify is not available.
+        """
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self.fd = self._libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if self.fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+
+    def watch(self, directories: Iterable[str]) -> None:
+        """Watch directories, adding a directory again is a no-op.
+
+        Args:
+            directories: Directories to watch.
+
+        Raises:
+            OSError: If the watch limit is reached.
+        """
+        for directory in directories:
+            if self._libc.inotify_add_watch(self.fd, os.fsencode(directory), _IN_MASK) < 0:
+                err = ctypes.get_errno()
+                if err == errno.ENOSPC:
+                    raise OSError(err, os.strerror(err))
+
+    def wait(self, timeout: float | None) -> bool:
+        """Wait for events and discard them.
+
+        Args:
+            timeout: Seconds to wait, None to wait forever.
+
+        Returns:
+            Whether any event arrived.
+        """
+        readable, _, _ = select.select([self.fd], [], [], timeout)
+        if not readable:
+            return False
+        with contextlib.suppress(BlockingIOError):
+            while os.read(self.fd, 65536):
+                pass
+        return True
+
+    def close(self) -> None:
+        """Release the inotify instance."""
+        os.close(self.fd)
+
+
+class Watcher:
+    """Wait for files below a set of paths to change.
+
+    Uses inotify where available and falls back to polling otherwise. In both
+    cases the result is confirmed by comparing file states, so events for
+    ignored or unchanged files do not count as changes.
+    """
+
+    def __init__(
+        self,
+        paths: Iterable[Path],
+        *,
+        debounce: float = WATCH_DEBOUNCE,
+        poll_interval: float = WATCH_POLL_INTERVAL,
+    ) -> None:
+        """Record the current file states and start watching.
+
+        Args:
+            paths: Files and directories to watch.
+            debounce: Quiet period that ends a burst of changes, in seconds.
+            poll_interval: Polling interval without inotify, in seconds.
+        """
+        self.paths = sorted(set(paths))
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+        self._files, directories = scan(self.paths)
+        self._inotify: _Inotify | None = None
+        if sys.platform.startswith("linux"):
+            try:
+                self._inotify = _Inotify()
+                self._inotify.watch(directories)
+            except (AttributeError, OSError) as exc:
+                LOG.debug("inotify is not available (%s), polling for changes instead.", exc)
+                self.close()
+
+    def close(self) -> None:
+        """Stop watching."""
+        if self._inotify is not None:
+            self._inotify.close()
+            self._inotify = None
+
+    def _sleep(self, timeout: float | None) -> bool:
+        """Sleep until an event arrives or the timeout expires.
+
+        Args:
+            timeout: Seconds to wait, None to wait for an event.
+
+        Returns:
+            Whether an event arrived. Always True when polling.
+        """
+        if self._inotify is not None:
+            return self._inotify.wait(timeout)
+        time.sleep(self.poll_interval if timeout is None else timeout)
+        return True
+
+    def _scan(self) -> FileStates:
+        """Scan the watched paths, watching directories created meanwhile.
+
+        Returns:
+            The state of every watched file.
+        """
+        files, directories = scan(self.paths)
+        if self._inotify is not None:
+            with contextlib.suppress(OSError):
+                self._inotify.watch(directories)
+        return files
+
+    def wait(self) -> set[str]:
+        """Block until files change and no further change arrives for a while.
+
+        Returns:
+            Paths of the files that were added, modified or removed.
+        """
+        while True:
+            self._sleep(None)
+            files = self._scan()
+            if files == self._files:
+                continue
+            # Debounce bursts, e.g. editors saving several files or swapping
+            # a temporary file into place.
+            while self._sleep(self.debounce):
+                if self._inotify is None:
+                    latest = self._scan()
+                    if latest == files:
+                        break
+                    files = latest
+            if self._inotify is not None:
+                files = self._scan()
+            changed = {
+                path
+                for path in files.keys() | self._files.keys()
+                if files.get(path) != self._files.get(path)
+            }
+            self._files = files
+            if changed:
+                return changed
+
+
+def watched_paths(config: Config) -> set[Path]:
+    """Return the sources a scenario's converge depends on.
+
+    Args:
+        config: Configuration of the scenario.
+
+    Returns:
+        The scenario directory, the role or collection sources, the inventory
+        links and the configuration inputs.
+    """
+    scenario_directory = Path(config.scenario.directory)
+    paths = {scenario_directory, Path(config.project_directory)}
+    if config.provisioner is not None:
+        paths.update(scenario_directory / source for source in config.provisioner.links.values())
+    return paths | {Path(path) for path in setup_inputs(config)}
+
+
+def setup_inputs(config: Config) -> set[str]:
+    """Return the files the configuration, and so command setup, is built from.
+
+    Args:
+        config: Configuration of the scenario.
+
+    Returns:
+        Absolute paths of molecule.yml, the base configs and the env file.
+    """
+    paths = [config.molecule_file, *config.args.get("base_config", [])]
+    if config.env_file:
+        paths.append(config.env_file)
+    return {os.path.abspath(path) for path in paths}  # noqa: PTH100
+
+
+def converge(config: Config, actions: list[str]) -> bool:
+    """Run actions against a scenario's existing instances.
+
+    Args:
+        config: Configuration of the scenario.
+        actions: Subcommands to run, in order.
+
+    Returns:
+        Whether every action succeeded.
+    """
+    log = logger.get_scenario_logger(__name__, config.scenario.name, "watch")
+    for action in actions:
+        try:
+            base.execute_subcommand(config, action)
+        except MoleculeError as exc:
+            log.error("%s failed: %s", action, exc.message or exc)  # noqa: TRY400
+            return False
+        # Setup wrote everything the configuration needs, later actions and
+        # iterations reuse it until the configuration changes.
+        config.skip_setup = True
+    return True
+
+
+def watch(configs: list[Config], *, verify: bool = False) -> None:
+    """Converge the scenarios again each time their sources change.
+
+    Runs until interrupted. A change to molecule.yml, a base config or the env
+    file reloads the configuration of the affected scenario, any other change
+    reuses it.
+
+    Args:
+        configs: Configurations of the scenarios to watch.
+        verify: Whether to run verify after each converge.
+    """
+    actions = ["converge", "verify"] if verify else ["converge"]
+    paths = set().union(*(watched_paths(c) for c in configs))
+    watcher = Watcher(paths)
+    try:
+        while True:
+            LOG.info("Watching %d paths for changes, press Ctrl+C to stop.", len(paths))
+            changed = watcher.wait()
+            for index, config in enumerate(configs):
+                if changed & setup_inputs(config):
+                    configs[index] = config_module.Config(
+                        molecule_file=config.molecule_file,
+                        args=config.args,
+                        command_args=config.command_args,
+                        ansible_args=config.ansible_args,
+                    )
+                converge(configs[index], actions)
+
+            new_paths = set().union(*(watched_paths(c) for c in configs))
+            if new_paths != paths:
+                paths = new_paths
+                watcher.close()
+                watcher = Watcher(paths)
+    except KeyboardInterrupt:
+        LOG.info("Stopped watching.")
+    finally:
+        watcher.close()
+
+
+def watch_cmdline_scenarios(  # noqa: PLR0913
+    scenario_names: list[str] | None,
+    args: MoleculeArgs,
+    command_args: CommandArgs,
+    ansible_args: tuple[str, ...] = (),
+    excludes: list[str] | None = None,
+    *,
+    verify: bool = False,
+) -> None:
+    """Run the converge sequence once, then converge on every change.
+
+    Args:
+        scenario_names: Name of scenarios to run, or ``None`` to run all.
+        args: ``args`` dict from ``click`` command context
+        command_args: dict of command arguments, including the target
+        ansible_args: Optional tuple of arguments to pass to the `ansible-playbook` command
+        excludes: Name of scenarios to not run.
+        verify: Whether to run verify after each converge.
+    """
+    try:
+        base.execute_cmdline_scenarios(scenario_names, args, command_args, ansible_args, excludes)
+    except SystemExit as exc:
+        # A failed first converge is fixed by editing the sources, keep watching.
+        if not exc.code:
+            raise
+        LOG.warning("Converge failed, waiting for changes.")
+
+    configs = [
+        c
+        for c in base.get_configs(args, command_args, ansible_args)
+        if (
+            scenario_names is None
+            or any(fnmatch.fnmatchcase(c.scenario.name, name) for name in scenario_names)
+        )
+        and not any(fnmatch.fnmatchcase(c.scenario.name, name) for name in excludes or [])
+    ]
+    watch(configs, verify=verify)
@@ -17,7 +17,7 @@ from pathlib import Path
 from typing import TYPE_CHECKING
 
 from molecule import config as config_module
-from molecule import logger, util
+from molecule import logger, pool, state, util
 from molecule.command.base import (
     execute_scenario,
     execute_subcommand_default,
@@ -70,6 +70,13 @@ def run_one_scenario(
     if not verbose and not debug:
         os.environ["MOLECULE_QUIET_ANSIBLE"] = "1"
 
+    logger.configure()
+    cfg = config_module.Config(
+        molecule_file=molecule_file,
+        args=args,
+        command_args={**command_args},
+        ansible_args=ansible_args,
+    )
     # Force prepare to always run. With shared_state, all scenarios share
     # one state file and a single "prepared" flag. In sequential mode this
     # isn't a problem because all Config/State objects are created before
@@ -77,15 +84,14 @@ def run_one_scenario(
     # In worker mode each Config is created on-demand; later workers read
     # the file after earlier workers already wrote prepared=True, causing
     # their per-scenario prepare playbooks to be skipped.
-    worker_command_args: CommandArgs = {**command_args, "force": True}
-
-    logger.configure()
-    cfg = config_module.Config(
-        molecule_file=molecule_file,
-        args=args,
-        command_args=worker_command_args,
-        ansible_args=ansible_args,
-    )
+    # The sqlite state backend tracks "prepared" per scenario, so it does
+    # not need this. Instances restored from a snapshot or leased from the
+    # pool were prepared before, so prepare is not forced for them either,
+    # unless state is shared: the restored and leased flags are then those
+    # of another scenario.
+    own_prepared = not cfg.shared_state and bool(cfg.state.restored or cfg.state.leased)
+    if state.get_backend() != "sqlite" and not own_prepared:
+        cfg.command_args["force"] = True
     scenario = cfg.scenario
 
     try:
@@ -95,6 +101,8 @@ def run_one_scenario(
         ansible_output = getattr(exc, "ansible_output", "") or ""
         failed_step = getattr(cfg, "action", "") or ""
         return copy.deepcopy(scenario.results), error_msg, ansible_output, failed_step
+    finally:
+        pool.wait()
     return copy.deepcopy(scenario.results), None, "", ""
 
 
@@ -236,6 +236,27 @@ def test_command_setup(
     patched_write_config.assert_called_once_with()
 
 
+def test_command_setup_skipped(
+    patched_write_config: MagicMock,
+    patched_manage_inventory: MagicMock,
+    patched_config_validate: MagicMock,
+    config_instance: config.Config,
+) -> None:
+    """Setup is skipped when the config says its output is current.
+
+    Args:
+        patched_write_config: Mocked write_config function.
+        patched_manage_inventory: Mocked manage_inventory function.
+        patched_config_validate: Mocked config.Config._validate function.
+        config_instance: Mocked config_instance fixture.
+    """
+    config_instance.skip_setup = True
+    ExtendedBase(config_instance)
+
+    patched_manage_inventory.assert_not_called()
+    patched_write_config.assert_not_called()
+
+
 @pytest.mark.usefixtures("config_instance")
 def test_execute_cmdline_scenarios(patched_execute_scenario: MagicMock) -> None:
     """Ensure execute_cmdline_scenarios runs normally.
@@ -19,11 +19,13 @@
 #  DEALINGS IN THE SOFTWARE.
 from __future__ import annotations
 
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 import pytest
 
 from molecule.command import create
+from molecule.exceptions import MoleculeError
 
 
 if TYPE_CHECKING:
@@ -77,3 +79,76 @@ def test_execute_skips_when_instances_already_created(  # noqa: D103
     assert msg in caplog.text
 
     assert not command_patched_ansible_create.called
+
+
+def test_execute_restores_snapshot(
+    mocker: MockerFixture,
+    command_patched_ansible_create: Mock,
+    patched_config_validate: Mock,
+    config_instance: config.Config,
+) -> None:
+    """A recorded snapshot replaces create and prepare."""
+    config_instance.command_args = {"subcommand": "create"}
+    name = config_instance.scenario.snapshot_name
+    config_instance.scenario.add_snapshot(name)
+    restore = mocker.patch("molecule.driver.delegated.Delegated.restore", return_value=True)
+
+    create.Create(config_instance).execute()
+
+    restore.assert_called_once_with(name)
+    assert not command_patched_ansible_create.called
+    assert config_instance.state.created
+    assert config_instance.state.prepared
+    assert config_instance.state.restored == name
+
+
+def test_execute_creates_without_snapshot(
+    mocker: MockerFixture,
+    command_patched_ansible_create: Mock,
+    patched_config_validate: Mock,
+    config_instance: config.Config,
+) -> None:
+    """Without a recorded snapshot the driver is not asked to restore."""
+    config_instance.command_args = {"subcommand": "create"}
+    restore = mocker.patch("molecule.driver.delegated.Delegated.restore", return_value=True)
+
+    create.Create(config_instance).execute()
+
+    assert not restore.called
+    command_patched_ansible_create.assert_called_once_with()
+
+
+def test_execute_creates_when_restore_fails(
+    mocker: MockerFixture,
+    command_patched_ansible_create: Mock,
+    patched_config_validate: Mock,
+    config_instance: config.Config,
+) -> None:
+    """A failed restore falls back to a regular create and forgets the snapshot."""
+    config_instance.command_args = {"subcommand": "create"}
+    name = config_instance.scenario.snapshot_name
+    config_instance.scenario.add_snapshot(name)
+    mocker.patch(
+        "molecule.driver.delegated.Delegated.restore",
+        side_effect=MoleculeError("restore failed"),
+    )
+
+    create.Create(config_instance).execute()
+
+    command_patched_ansible_create.assert_called_once_with()
+    assert config_instance.state.created
+    assert not config_instance.state.prepared
+    assert not config_instance.state.restored
+    assert name not in config_instance.scenario.snapshots
+
+
+def test_snapshot_name_covers_requirements(
+    patched_config_validate: Mock,
+    config_instance: config.Config,
+) -> None:
+    """Changing the dependency requirements invalidates earlier snapshots."""
+    name = config_instance.scenario.snapshot_name
+    requirements = Path(config_instance.scenario.directory) / "requirements.yml"
+    requirements.write_text("collections:\n  - community.general\n", encoding="utf-8")
+
+    assert config_instance.scenario.snapshot_name != name
@@ -19,11 +19,13 @@
 #  DEALINGS IN THE SOFTWARE.
 from __future__ import annotations
 
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 import pytest
 
-from molecule.command import destroy
+from molecule.command import create, destroy
+from molecule.pool import InstancePool
 
 
 if TYPE_CHECKING:
@@ -88,3 +90,74 @@ def test_execute_skips_when_destroy_strategy_is_never(  # noqa: D103
     assert msg in caplog.text
 
     assert not _patched_ansible_destroy.called
+
+
+def test_execute_returns_instances_to_pool(  # noqa: D103
+    mocker: MockerFixture,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    _patched_destroy_setup: Mock,  # noqa: PT019
+    _patched_ansible_destroy: Mock,  # noqa: PT019
+    command_patched_ansible_create: Mock,
+    config_instance: config.Config,
+) -> None:
+    monkeypatch.setenv("MOLECULE_POOL_SIZE", "1")
+    instance_pool = InstancePool(tmp_path, 1)
+    mocker.patch("molecule.pool.InstancePool.from_config", return_value=instance_pool)
+    restore = mocker.patch("molecule.driver.delegated.Delegated.restore", return_value=True)
+    config_instance.command_args = {"subcommand": "destroy"}
+    scenario = config_instance.scenario
+    scenario.add_snapshot(scenario.snapshot_name)
+    config_instance.state.change_state("created", value=True)
+    config_instance.state.change_state("prepared", value=True)
+    Path(config_instance.driver.instance_config).write_text("- instance: pooled\n")
+
+    destroy.Destroy(config_instance).execute()
+
+    # Returned instances are reset when leased again, not by destroy.
+    assert not restore.called
+    assert not _patched_ansible_destroy.called
+    assert not config_instance.state.created
+    assert len(instance_pool.entries()) == 1
+
+    # The initial destroy of the next run leaves pooled instances alone.
+    destroy.Destroy(config_instance).execute()
+    assert not _patched_ansible_destroy.called
+
+    # Create leases the pooled instances and resets them.
+    config_instance.command_args = {"subcommand": "create"}
+    create.Create(config_instance).execute()
+    restore.assert_called_once_with(scenario.snapshot_name)
+    assert not command_patched_ansible_create.called
+    assert Path(config_instance.driver.instance_config).read_text() == "- instance: pooled\n"
+    assert config_instance.state.prepared
+    lease_id = config_instance.state.leased
+    assert lease_id is not None
+
+    # A pool size of 0 destroys leased instances and drains the pool.
+    instance_pool.release("- instance: other\n", scenario.snapshot_name)
+    instance_pool.size = 0
+    destroy.Destroy(config_instance).execute()
+    _patched_ansible_destroy.assert_called_once_with()
+    assert instance_pool.leased(lease_id) is None
+    assert not instance_pool.entries()
+    assert config_instance.state.leased is None
+
+
+def test_execute_skips_pool_when_disabled(  # noqa: D103
+    mocker: MockerFixture,
+    monkeypatch: pytest.MonkeyPatch,
+    _patched_destroy_setup: Mock,  # noqa: PT019
+    _patched_ansible_destroy: Mock,  # noqa: PT019
+    config_instance: config.Config,
+) -> None:
+    monkeypatch.delenv("MOLECULE_POOL_SIZE", raising=False)
+    from_config = mocker.patch("molecule.pool.InstancePool.from_config")
+    config_instance.command_args = {"subcommand": "destroy"}
+    config_instance.state.change_state("created", value=True)
+
+    destroy.Destroy(config_instance).execute()
+
+    _patched_ansible_destroy.assert_called_once_with()
+    assert not from_config.called
+    assert not config_instance.state.created
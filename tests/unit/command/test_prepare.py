@@ -116,3 +116,28 @@ def test_prepare_execute_skips_when_playbook_not_configured(  # noqa: D103
     assert record.molecule_scenario == "default"
 
     assert not _patched_ansible_prepare.called
+
+
+def test_prepare_execute_takes_snapshot(
+    mocker: MockerFixture,
+    _patched_ansible_prepare: Mock,  # noqa: PT019
+    patched_config_validate: Mock,
+    config_instance: config.Config,
+) -> None:
+    """A snapshot is taken once after prepare when the driver supports it."""
+    pb = os.path.join(config_instance.scenario.directory, "prepare.yml")  # noqa: PTH118
+    util.write_file(pb, "")
+    snapshot = mocker.patch("molecule.driver.delegated.Delegated.snapshot", return_value=True)
+    config_instance.action = "prepare"
+    config_instance.command_args = {"force": True}
+
+    prepare.Prepare(config_instance).execute()
+    prepare.Prepare(config_instance).execute()
+
+    name = config_instance.scenario.snapshot_name
+    snapshot.assert_called_once_with(name)
+    assert config_instance.scenario.snapshots == [name]
+
+    # Changing the prepare playbook changes the snapshot name.
+    util.write_file(pb, "- hosts: all\n")
+    assert config_instance.scenario.snapshot_name != name
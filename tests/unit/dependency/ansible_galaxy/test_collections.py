@@ -21,9 +21,12 @@ from __future__ import annotations
 
 import os
 
+from subprocess import CalledProcessError
+
 import pytest
 
 from molecule import config
+from molecule.dependency import ansible_galaxy
 from molecule.dependency.ansible_galaxy import collections
 
 
@@ -169,6 +172,7 @@ def test_collections_execute(  # type: ignore[no-untyped-def]  # noqa: ANN201, D
         debug=False,
         check=True,
         command_borders=True,
+        capture=False,
     )
 
     msg = "Dependency completed successfully."
@@ -239,3 +243,106 @@ def test_collections_role_file(role_file, _instance):  # type: ignore[no-untyped
 
 def test_collections_has_requirements_file(_instance):  # type: ignore[no-untyped-def]  # noqa: ANN201, PT019, D103
     assert not _instance._has_requirements_file()
+
+
+def test_collections_execute_skips_unchanged_requirements(  # type: ignore[no-untyped-def]  # noqa: ANN201, D103
+    patched_run_command,
+    _instance,  # noqa: PT019
+    mocker,
+    tmp_path,
+):
+    requirements = tmp_path / "collections.yml"
+    requirements.write_text("collections:\n  - ns.coll\n")
+    manifest = tmp_path / "installed" / "ansible_collections" / "ns" / "coll" / "MANIFEST.json"
+    manifest.parent.mkdir(parents=True)
+    manifest.write_text('{"collection_info": {"version": "1.2.3"}}')
+    _instance._config.config_data["dependency"]["options"]["requirements-file"] = str(requirements)
+    mocker.patch.object(_instance._config.runtime, "cache_dir", tmp_path / "cache")
+    mocker.patch.object(_instance, "install_paths", return_value=[tmp_path / "installed"])
+    mocker.patch("molecule.dependency.artifacts.ArtifactCache.download", return_value=False)
+
+    _instance.execute()
+    _instance.execute()
+
+    assert patched_run_command.call_count == 1
+    assert _instance._config.scenario.results.actions[0].states[-1].state == "skipped"
+
+    # Content changed behind our back is installed again.
+    manifest.write_text('{"collection_info": {"version": "1.0.0"}}')
+    _instance.execute()
+
+    assert patched_run_command.call_count == 2  # noqa: PLR2004
+
+    # So are changed requirements.
+    requirements.write_text("collections:\n  - ns.coll\n  - ns.other\n")
+    _instance.execute()
+
+    assert patched_run_command.call_count == 3  # noqa: PLR2004
+
+
+def test_collections_execute_installs_from_artifact_cache(  # type: ignore[no-untyped-def]  # noqa: ANN201, D103
+    patched_run_command,
+    _instance,  # noqa: PT019
+    mocker,
+    tmp_path,
+):
+    requirements = tmp_path / "collections.yml"
+    requirements.write_text("collections:\n  - ns.coll\n")
+    _instance._config.config_data["dependency"]["options"]["requirements-file"] = str(requirements)
+    install = mocker.patch(
+        "molecule.dependency.artifacts.ArtifactCache.install",
+        return_value=True,
+    )
+
+    _instance.execute()
+
+    cmd, wanted, _ = install.call_args.args[1:]
+    assert "--requirements-file" not in cmd
+    assert wanted == {"ns.coll": "*"}
+    assert not patched_run_command.called
+
+
+def test_collections_execute_retries_without_mutating_schedule(  # type: ignore[no-untyped-def]  # noqa: ANN201, D103
+    patched_run_command,
+    _patched_ansible_galaxy_has_requirements_file,  # noqa: PT019
+    _instance,  # noqa: PT019
+    mocker,
+):
+    sleep = mocker.patch("molecule.dependency.retry.sleep")
+    patched_run_command.side_effect = [
+        CalledProcessError(1, "ansible-galaxy", stderr="Connection refused"),
+        patched_run_command.return_value,
+    ]
+    _instance._sh_command = "patched-command"
+    _instance.execute()
+
+    assert patched_run_command.call_count == 2  # noqa: PLR2004
+    sleep.assert_called_once()
+    assert _instance.SLEEP == collections.Collections.SLEEP
+
+
+def test_galaxy_prints_concurrent_installs_in_order(  # type: ignore[no-untyped-def]  # noqa: ANN201, D103
+    patched_config_validate,
+    config_instance: config.Config,
+    mocker,
+):
+    galaxy = ansible_galaxy.AnsibleGalaxy(config_instance)
+    roles, collections_invoker = galaxy.invocations
+    for invoker, output in ((roles, "roles output\n"), (collections_invoker, "collections\n")):
+        mocker.patch.object(invoker, "_has_requirements_file", return_value=True)
+        mocker.patch.object(invoker, "needs_install", return_value=True)
+        mocker.patch.object(invoker, "install_requirements", return_value=output)
+    mocker.patch.object(roles, "installs_collections", return_value=False)
+    collections_invoker.install_requirements.side_effect = CalledProcessError(  # type: ignore[attr-defined]
+        2,
+        "ansible-galaxy",
+        output="failed\n",
+    )
+    write_output = mocker.patch.object(config_instance.app, "write_output")
+
+    with pytest.raises(SystemExit):
+        galaxy.execute()
+
+    roles.install_requirements.assert_called_once_with(capture=True)  # type: ignore[attr-defined]
+    assert [c.args[0] for c in write_output.call_args_list] == ["roles output\n", "failed\n"]
+    assert [c.kwargs["returncode"] for c in write_output.call_args_list] == [0, 2]
@@ -168,6 +168,7 @@ def test_execute(  # type: ignore[no-untyped-def]  # noqa: ANN201, D103
         debug=False,
         check=True,
         command_borders=True,
+        capture=False,
     )
 
     msg = "Dependency completed successfully."
@@ -235,3 +236,52 @@ def test_role_file(role_file, _instance):  # type: ignore[no-untyped-def]  # noq
 
 def test_roles_has_requirements_file(_instance):  # type: ignore[no-untyped-def]  # noqa: ANN201, PT019, D103
     assert not _instance._has_requirements_file()
+
+
+@pytest.mark.parametrize(
+    ("entry", "installed"),
+    (
+        ("dep.role1", "dep.role1"),
+        ("https://example.com/org/role2.git,v1,role2", "role2"),
+        ("{src: 'git+https://example.com/org/role3.git'}", "role3"),
+    ),
+)
+def test_roles_execute_skips_installed_requirements(  # type: ignore[no-untyped-def]  # noqa: ANN201, D103
+    patched_run_command,
+    _instance,  # noqa: PT019
+    mocker,
+    tmp_path,
+    entry,
+    installed,
+):
+    requirements = tmp_path / "requirements.yml"
+    requirements.write_text(f"- {entry}\n")
+    info = tmp_path / "roles" / installed / "meta" / ".galaxy_install_info"
+    info.parent.mkdir(parents=True)
+    info.write_text("version: v1\n")
+    _instance._config.config_data["dependency"]["options"]["role-file"] = str(requirements)
+    mocker.patch.object(_instance._config.runtime, "cache_dir", tmp_path / "cache")
+    mocker.patch.object(_instance, "install_paths", return_value=[tmp_path / "roles"])
+
+    _instance.execute()
+    _instance.execute()
+
+    assert patched_run_command.call_count == 1
+
+
+def test_roles_execute_with_force_does_not_skip(  # type: ignore[no-untyped-def]  # noqa: ANN201, D103
+    patched_run_command,
+    _instance,  # noqa: PT019
+    mocker,
+    tmp_path,
+):
+    requirements = tmp_path / "requirements.yml"
+    requirements.write_text("roles: []\n")
+    _instance._config.config_data["dependency"]["options"]["role-file"] = str(requirements)
+    _instance._config.config_data["dependency"]["options"]["force"] = True
+    mocker.patch.object(_instance._config.runtime, "cache_dir", tmp_path / "cache")
+
+    _instance.execute()
+    _instance.execute()
+
+    assert patched_run_command.call_count == 2  # noqa: PLR2004
@@ -0,0 +1,209 @@
+"""Unit tests for the galaxy artifact cache."""
+
+from __future__ import annotations
+
+import io
+import json
+import tarfile
+
+from subprocess import CompletedProcess
+from typing import TYPE_CHECKING
+
+import pytest
+
+from molecule.dependency import artifacts
+from molecule.exceptions import MoleculeError
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest_mock import MockerFixture
+
+
+def _tarball(
+    directory: Path,
+    name: str,
+    version: str,
+    dependencies: dict[str, str] | None = None,
+) -> Path:
+    """Build a collection tarball holding only its MANIFEST.json.
+
+    Args:
+        directory: Directory to write the tarball to.
+        name: Fully qualified collection name.
+        version: Version of the collection.
+        dependencies: Dependencies of the collection.
+
+    Returns:
+        Path to the tarball.
+    """
+    namespace, collection = name.split(".")
+    info = {
+        "namespace": namespace,
+        "name": collection,
+        "version": version,
+        "dependencies": dependencies or {},
+    }
+    data = json.dumps({"collection_info": info}).encode()
+    path = directory / f"{namespace}-{collection}-{version}.tar.gz"
+    with tarfile.open(path, "w:gz") as tar:
+        member = tarfile.TarInfo("MANIFEST.json")
+        member.size = len(data)
+        tar.addfile(member, io.BytesIO(data))
+    return path
+
+
+@pytest.mark.parametrize(
+    ("version", "spec", "pre", "expected"),
+    (
+        ("1.2.0", "*", False, True),
+        ("1.2.0", ">=1.0.0,<2.0.0", False, True),
+        ("2.0.0", ">=1.0.0,<2.0.0", False, False),
+        ("1.2.0", "1.2.0", False, True),
+        ("1.2.1", "1.2.0", False, False),
+        ("2.0.0-beta.1", ">=1.0.0", False, False),
+        ("2.0.0-beta.1", ">=1.0.0", True, True),
+        ("not-a-version", "*", False, False),
+    ),
+)
+def test_matches(version: str, spec: str, *, pre: bool, expected: bool) -> None:
+    """Galaxy version ranges are evaluated like ansible-galaxy does."""
+    assert artifacts.matches(version, spec, pre=pre) is expected
+
+
+def test_collection_requirements(tmp_path: Path) -> None:
+    """Only galaxy collections can be served from the cache."""
+    requirements = tmp_path / "collections.yml"
+    requirements.write_text(
+        "collections:\n  - ns.one\n  - name: ns.two\n    version: '>=1.0.0'\n",
+    )
+    assert artifacts.collection_requirements(str(requirements)) == {
+        "ns.one": "*",
+        "ns.two": ">=1.0.0",
+    }
+
+    requirements.write_text("collections:\n  - name: https://example.com/c.git\n    type: git\n")
+    assert artifacts.collection_requirements(str(requirements)) is None
+
+
+def test_add_and_resolve(tmp_path: Path) -> None:
+    """The newest matching versions are picked, along with their dependencies."""
+    cache = artifacts.ArtifactCache(tmp_path / "cache")
+    for tarball in (
+        _tarball(tmp_path, "ns.one", "1.0.0", {"ns.dep": ">=2.0.0"}),
+        _tarball(tmp_path, "ns.one", "1.1.0", {"ns.dep": ">=2.0.0"}),
+        _tarball(tmp_path, "ns.one", "2.0.0"),
+        _tarball(tmp_path, "ns.dep", "2.1.0"),
+    ):
+        cache.add(tarball)
+
+    tarballs = cache.resolve({"ns.one": "<2.0.0"})
+    assert tarballs is not None
+    assert {path.parent.name for path in tarballs} == {"sha256"}
+    assert sorted(artifact.version for artifact in cache.versions("ns.one")) == [
+        "1.0.0",
+        "1.1.0",
+        "2.0.0",
+    ]
+    assert cache.versions("ns.one")[1].path in tarballs
+    assert cache.versions("ns.dep")[0].path in tarballs
+
+    assert cache.resolve({"ns.one": "*", "ns.dep": "<2.0.0"}) is None
+    assert cache.resolve({"ns.missing": "*"}) is None
+
+
+def test_install_downloads_missing_requirements(mocker: MockerFixture, tmp_path: Path) -> None:
+    """Only requirements missing from the cache are downloaded."""
+    cache = artifacts.ArtifactCache(tmp_path / "cache")
+    cache.add(_tarball(tmp_path, "ns.one", "1.0.0"))
+
+    def download(_config: object, args: list[str]) -> bool:
+        cache.add(_tarball(tmp_path, "ns.two", "1.1.0"))
+        return args == ["--server", "https://galaxy.example.com", "ns.two:*"]
+
+    downloads = mocker.patch.object(cache, "download", side_effect=download)
+    config = mocker.Mock()
+    config.app.run_command.return_value = CompletedProcess([], 0)
+    options = {"server": "https://galaxy.example.com", "force": False}
+    requirements = {"ns.one": ">=1.0.0", "ns.two": "*"}
+
+    assert cache.install(config, ["ansible-galaxy"], requirements, options)
+    cmd = config.app.run_command.call_args.args[0]
+    assert cmd[:2] == ["ansible-galaxy", "--offline"]
+    assert sorted(cmd[2:]) == sorted(str(path) for path in cache.resolve(requirements) or [])
+    assert downloads.call_count == 1
+
+    # Once populated, the cache is used without any network access.
+    assert cache.install(config, ["ansible-galaxy"], requirements, options)
+    assert downloads.call_count == 1
+
+
+def test_install_upgrade_downloads_every_requirement(
+    mocker: MockerFixture,
+    tmp_path: Path,
+) -> None:
+    """The upgrade option resolves requirements to the newest versions of the server."""
+    cache = artifacts.ArtifactCache(tmp_path / "cache")
+    cache.add(_tarball(tmp_path, "ns.one", "1.0.0"))
+
+    def download(_config: object, args: list[str]) -> bool:
+        cache.add(_tarball(tmp_path, "ns.one", "1.1.0"))
+        return args == ["ns.one:>=1.0.0"]
+
+    mocker.patch.object(cache, "download", side_effect=download)
+    config = mocker.Mock()
+    config.app.run_command.return_value = CompletedProcess([], 0)
+
+    assert cache.install(config, ["ansible-galaxy"], {"ns.one": ">=1.0.0"}, {"upgrade": True})
+    assert config.app.run_command.call_args.args[0] == [
+        "ansible-galaxy",
+        "--offline",
+        str(cache.versions("ns.one")[0].path),
+    ]
+    assert [a.version for a in cache.versions("ns.one")] == ["1.1.0", "1.0.0"]
+
+
+def test_install_falls_back_to_cached_artifacts(mocker: MockerFixture, tmp_path: Path) -> None:
+    """Cached artifacts are installed when the download fails, or offline."""
+    cache = artifacts.ArtifactCache(tmp_path / "cache")
+    artifact = cache.add(_tarball(tmp_path, "ns.one", "1.0.0"))
+    assert artifact is not None
+    download = mocker.patch.object(cache, "download", return_value=False)
+    config = mocker.Mock()
+    config.app.run_command.return_value = CompletedProcess([], 0)
+    cmd = ["ansible-galaxy", "collection", "install"]
+
+    assert cache.install(config, cmd, {"ns.one": "*"}, {"upgrade": True})
+    download.assert_called_once()
+    assert config.app.run_command.call_args.args[0] == [*cmd, "--offline", str(artifact.path)]
+
+    download.reset_mock()
+    assert cache.install(config, cmd, {"ns.one": "*"}, {"offline": True, "upgrade": True})
+    download.assert_not_called()
+
+    assert not cache.install(config, cmd, {"ns.one": ">=2.0.0"}, {"offline": True})
+
+
+def test_require_collection_installs_from_cache(mocker: MockerFixture, tmp_path: Path) -> None:
+    """Driver collections that are missing are installed through the cache, quietly."""
+    config = mocker.Mock()
+    config.runtime.cache_dir = tmp_path
+    config.runtime.environ = {"PATH": "/bin"}
+    config.runtime.config.collections_paths = ["/collections", "/usr/share/collections"]
+    mocker.patch.object(artifacts, "_installed_version", return_value="1.0.0")
+    install = mocker.patch.object(artifacts.ArtifactCache, "install", return_value=True)
+
+    artifacts.require_collection(config, "ns.one", "1.0.0")
+    install.assert_not_called()
+
+    artifacts.require_collection(config, "ns.one", "2.0.0")
+    assert install.call_args.args[2] == {"ns.one": ">=2.0.0"}
+    assert install.call_args.args[3] == {"pre": False}
+    env = install.call_args.kwargs["env"]
+    assert env["ANSIBLE_COLLECTIONS_PATH"] == "/collections:/usr/share/collections"
+    config.runtime.require_collection.assert_not_called()
+
+    install.return_value = False
+    with pytest.raises(MoleculeError):
+        artifacts.require_collection(config, "ns.one", "2.0.0")
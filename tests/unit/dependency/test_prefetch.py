@@ -0,0 +1,67 @@
+"""Unit tests for installing galaxy requirements ahead of the scenarios."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from molecule.dependency import prefetch
+from molecule.dependency.ansible_galaxy.base import AnsibleGalaxyBase
+
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+    from molecule.config import Config
+
+
+def test_pending_deduplicates_requirement_sets(
+    mocker: MockerFixture,
+    config_instance: Config,
+) -> None:
+    """Scenarios listing the same requirements install them once."""
+    mocker.patch.object(
+        AnsibleGalaxyBase,
+        "pending_install",
+        autospec=True,
+        side_effect=lambda invoker: Path(type(invoker).__name__),
+    )
+
+    installers = prefetch.pending([config_instance, config_instance])
+
+    assert [type(installer).__name__ for installer in installers] == ["Roles", "Collections"]
+
+
+def test_pending_skips_scenarios_without_dependency_step(
+    mocker: MockerFixture,
+    config_instance: Config,
+) -> None:
+    """Scenarios whose sequence does not install dependencies are ignored."""
+    pending_install = mocker.patch.object(AnsibleGalaxyBase, "pending_install")
+    config_instance.config_data["scenario"]["test_sequence"] = ["converge"]
+    config_instance.command_args["subcommand"] = "test"
+
+    assert prefetch.pending([config_instance]) == []
+    pending_install.assert_not_called()
+
+
+def test_install_requirements(mocker: MockerFixture) -> None:
+    """Each set is installed once, sets sharing install paths in one worker."""
+    shared = [mocker.Mock(**{"install_paths.return_value": [Path("a")]}) for _ in range(2)]
+    other = mocker.Mock(**{"install_paths.return_value": [Path("b")]})
+    mocker.patch.object(prefetch, "pending", return_value=[*shared, other])
+    install_all = mocker.patch.object(prefetch, "_install_all")
+
+    prefetch.install_requirements([])
+
+    assert sorted(len(call.args[0]) for call in install_all.call_args_list) == [1, 2]
+
+
+def test_install_requirements_leaves_a_single_set_to_the_step(mocker: MockerFixture) -> None:
+    """A single set is installed by the dependency step as usual."""
+    installer = mocker.Mock()
+    mocker.patch.object(prefetch, "pending", return_value=[installer])
+
+    prefetch.install_requirements([])
+
+    installer.install.assert_not_called()
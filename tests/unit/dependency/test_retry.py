@@ -0,0 +1,78 @@
+"""Unit tests for retrying dependency installs."""
+
+from __future__ import annotations
+
+from subprocess import CalledProcessError
+from typing import TYPE_CHECKING
+
+import pytest
+
+from molecule.dependency import retry
+
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+
+@pytest.mark.parametrize(
+    ("returncode", "stderr", "expected"),
+    (
+        (1, "ERROR! Unknown error when attempting to call Galaxy at 'https://x': timed out", True),
+        (1, "urlopen error [Errno -3] Temporary failure in name resolution", True),
+        (1, "HTTP Error 503: Service Unavailable", True),
+        (1, "ERROR! Failed to resolve the requested dependencies map.", False),
+        (1, "ERROR! HTTP Error 404: Not Found", False),
+        (1, "something unexpected", True),
+        (127, "", False),
+        (-9, "", False),
+    ),
+)
+def test_is_transient(returncode: int, stderr: str, *, expected: bool) -> None:
+    """Network and server errors are transient, resolution errors are not."""
+    error = CalledProcessError(returncode, "ansible-galaxy", output="", stderr=stderr)
+    assert retry.is_transient(error) is expected
+
+
+def test_sleep_time_is_jittered_exponential() -> None:
+    """Each retry sleeps between half and all of the exponential delay."""
+    policy = retry.RetryPolicy(delay=2, factor=3)
+    for attempt, delay in enumerate((2, 6, 18)):
+        assert delay / 2 <= policy.sleep_time(attempt) <= delay
+
+
+def test_call_retries_transient_failures(mocker: MockerFixture) -> None:
+    """Transient failures are retried until the call succeeds."""
+    sleep = mocker.patch("molecule.dependency.retry.sleep")
+    transient = CalledProcessError(1, "cmd", stderr="Connection reset by peer")
+    func = mocker.Mock(side_effect=[transient, transient, "done"])
+
+    assert retry.RetryPolicy().call(func, mocker.Mock()) == "done"
+    assert sleep.call_count == 2  # noqa: PLR2004
+
+
+def test_call_fails_fast_on_permanent_failures(mocker: MockerFixture) -> None:
+    """Permanent failures are raised without sleeping."""
+    sleep = mocker.patch("molecule.dependency.retry.sleep")
+    permanent = CalledProcessError(1, "cmd", stderr="HTTP Error 404: Not Found")
+
+    with pytest.raises(CalledProcessError):
+        retry.RetryPolicy().call(mocker.Mock(side_effect=permanent), mocker.Mock())
+    sleep.assert_not_called()
+
+
+def test_call_stops_at_the_deadline(mocker: MockerFixture) -> None:
+    """No retry starts once its sleep would end past the deadline."""
+    clock = [0.0]
+    mocker.patch("molecule.dependency.retry.monotonic", side_effect=lambda: clock[0])
+    sleep = mocker.patch(
+        "molecule.dependency.retry.sleep",
+        side_effect=lambda seconds: clock.__setitem__(0, clock[0] + seconds),
+    )
+    transient = CalledProcessError(1, "cmd", stderr="timed out")
+    func = mocker.Mock(side_effect=transient)
+
+    with pytest.raises(CalledProcessError):
+        retry.RetryPolicy(retries=10, delay=4, deadline=10).call(func, mocker.Mock())
+    # Sleeps of 2-4 and 4-8 seconds fit in 10 seconds, the next 8-16 does not.
+    assert sleep.call_count <= 2  # noqa: PLR2004
+    assert func.call_count == sleep.call_count + 1
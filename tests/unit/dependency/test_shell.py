@@ -129,6 +129,7 @@ def test_shell_execute(  # type: ignore[no-untyped-def]  # noqa: ANN201, D103
             debug=False,
             check=True,
             command_borders=True,
+            capture=False,
         )
 
         # Check for scenario-aware log records instead of text
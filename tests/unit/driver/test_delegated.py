@@ -65,6 +65,11 @@ def _instance(config_instance: config.Config):  # type: ignore[no-untyped-def]
     return delegated.Delegated(config_instance)
 
 
+@pytest.fixture(autouse=True)
+def _clear_inventory_cache() -> None:
+    delegated._INVENTORY_HOSTVARS_CACHE.clear()
+
+
 def test_delegated_config_private_member(_instance):  # type: ignore[no-untyped-def]  # noqa: ANN201, PT019, D103
     assert isinstance(_instance._config, config.Config)
 
@@ -295,7 +300,7 @@ def test_ansible_connection_options_handles_missing_results_key_when_managed(  #
     _instance,  # noqa: PT019
 ):
     m = mocker.patch("molecule.util.safe_load_file")
-    m.side_effect = StopIteration
+    m.return_value = [{"instance": "bar"}]
 
     assert _instance.ansible_connection_options("foo") == {}
 
@@ -386,6 +391,37 @@ def test_get_instance_config(mocker: MockerFixture, _instance):  # type: ignore[
     assert x == _instance._get_instance_config("foo")
 
 
+def test_get_instance_config_raises_key_error_for_unknown_instance(  # type: ignore[no-untyped-def]  # noqa: ANN201, D103
+    mocker: MockerFixture,
+    _instance,  # noqa: PT019
+):
+    m = mocker.patch("molecule.util.safe_load_file")
+    m.return_value = [{"instance": "foo"}]
+
+    with pytest.raises(KeyError):
+        _instance._get_instance_config("bar")
+
+
+def test_get_instance_config_index_cached_until_file_changes(  # type: ignore[no-untyped-def]  # noqa: ANN201, D103
+    mocker: MockerFixture,
+    _instance,  # noqa: PT019
+):
+    instance_config = _instance._config.driver.instance_config
+    with open(instance_config, "w") as f:  # noqa: PTH123
+        f.write("- instance: foo\n  address: 10.0.0.1\n- instance: bar\n  address: 10.0.0.2\n")
+    load = mocker.spy(delegated.util, "safe_load_file")
+
+    assert _instance._get_instance_config("foo")["address"] == "10.0.0.1"
+    assert _instance._get_instance_config("bar")["address"] == "10.0.0.2"
+    assert load.call_count == 1
+
+    with open(instance_config, "w") as f:  # noqa: PTH123
+        f.write("- instance: foo\n  address: 10.0.0.100\n")
+
+    assert _instance._get_instance_config("foo")["address"] == "10.0.0.100"
+    assert load.call_count == 2  # noqa: PLR2004
+
+
 def test_ansible_inventory_args(_instance):  # type: ignore[no-untyped-def]  # noqa: ANN201, PT019, D103
     args = _instance._ansible_inventory_args()
 
@@ -573,10 +609,16 @@ def test_get_inventory_login_options_maps_ansible_vars(  # type: ignore[no-untyp
 ):
     m = mocker.patch("molecule.driver.delegated.Delegated._run_ansible_inventory")
     m.return_value = {
-        "ansible_host": "172.16.0.2",
-        "ansible_user": "cloud-user",
-        "ansible_port": 22,
-        "ansible_ssh_private_key_file": "/foo/bar",
+        "_meta": {
+            "hostvars": {
+                "foo": {
+                    "ansible_host": "172.16.0.2",
+                    "ansible_user": "cloud-user",
+                    "ansible_port": 22,
+                    "ansible_ssh_private_key_file": "/foo/bar",
+                },
+            },
+        },
     }
 
     x = {
@@ -593,9 +635,10 @@ def test_get_inventory_login_options_partial_vars(  # type: ignore[no-untyped-de
     _instance,  # noqa: PT019
 ):
     m = mocker.patch("molecule.driver.delegated.Delegated._run_ansible_inventory")
-    m.return_value = {"ansible_host": "172.16.0.2"}
+    m.return_value = {"_meta": {"hostvars": {"foo": {"ansible_host": "172.16.0.2"}}}}
 
     assert _instance._get_inventory_login_options("foo") == {"address": "172.16.0.2"}
+    assert _instance._get_inventory_login_options("bar") == {}
 
 
 def test_get_inventory_login_options_returns_empty_dict_when_lookup_fails(  # type: ignore[no-untyped-def]  # noqa: ANN201, D103
@@ -625,6 +668,52 @@ def test_get_ansible_native_hosts_returns_sorted_hostvars_keys(  # type: ignore[
     assert _instance.get_ansible_native_hosts() == ["instance-1", "instance-2"]
 
 
+def test_inventory_hostvars_queried_once_per_inventory_state(  # type: ignore[no-untyped-def]  # noqa: ANN201, D103
+    mocker: MockerFixture,
+    _instance,  # noqa: PT019
+):
+    m = mocker.patch("molecule.driver.delegated.Delegated._run_ansible_inventory")
+    m.return_value = {
+        "_meta": {"hostvars": {f"instance-{i}": {"ansible_host": f"10.0.0.{i}"} for i in range(5)}},
+    }
+    provisioner = _instance._config.provisioner
+    provisioner.manage_inventory()
+
+    assert len(_instance.get_ansible_native_hosts()) == 5  # noqa: PLR2004
+    for i in range(5):
+        assert _instance._get_inventory_login_options(f"instance-{i}") == {
+            "address": f"10.0.0.{i}",
+        }
+    m.assert_called_once_with(["--list"])
+
+    # writing the same inventory again keeps the cached result
+    provisioner.manage_inventory()
+    _instance.get_ansible_native_hosts()
+    assert m.call_count == 1
+
+    # a change to the written inventory invalidates it
+    provisioner._config.config_data["provisioner"]["inventory"]["host_vars"] = {
+        "instance-0": {"ansible_user": "foo"},
+    }
+    provisioner.manage_inventory()
+    _instance.get_ansible_native_hosts()
+    assert m.call_count == 2  # noqa: PLR2004
+
+
+def test_inventory_hostvars_failures_not_cached(  # type: ignore[no-untyped-def]  # noqa: ANN201, D103
+    mocker: MockerFixture,
+    _instance,  # noqa: PT019
+):
+    m = mocker.patch("molecule.driver.delegated.Delegated._run_ansible_inventory")
+    m.return_value = None
+    _instance._config.provisioner.manage_inventory()
+
+    assert _instance.get_ansible_native_hosts() == []
+    m.return_value = {"_meta": {"hostvars": {"instance": {}}}}
+    assert _instance.get_ansible_native_hosts() == ["instance"]
+    assert m.call_count == 2  # noqa: PLR2004
+
+
 def test_get_ansible_native_hosts_returns_empty_list_when_lookup_fails(  # type: ignore[no-untyped-def]  # noqa: ANN201, D103
     mocker: MockerFixture,
     _instance,  # noqa: PT019
@@ -640,13 +729,13 @@ def test_get_ansible_native_hosts_returns_empty_list_when_lookup_fails(  # type:
     ["_driver_managed_section_data"],  # noqa: PT007
     indirect=True,
 )
-def test_login_options_falls_back_to_inventory_on_stop_iteration(  # type: ignore[no-untyped-def]  # noqa: ANN201, D103
+def test_login_options_falls_back_to_inventory_on_key_error(  # type: ignore[no-untyped-def]  # noqa: ANN201, D103
     mocker: MockerFixture,
     _instance,  # noqa: PT019
 ):
     mocker.patch(
         "molecule.driver.delegated.Delegated._get_instance_config",
-        side_effect=StopIteration,
+        side_effect=KeyError,
     )
     m = mocker.patch("molecule.driver.delegated.Delegated._get_inventory_login_options")
     m.return_value = {"address": "172.16.0.2", "user": "cloud-user"}
@@ -714,3 +803,34 @@ def test_status_falls_back_to_blank_placeholder_when_inventory_empty(  # type: i
     result = _instance.status()
 
     assert [s.instance_name for s in result] == [""]
+
+
+def test_clone_and_discard_need_pool_playbooks(
+    _instance: delegated.Delegated,  # noqa: PT019
+    mocker: MockerFixture,
+) -> None:
+    """Pooled instances are only cloned and destroyed by dedicated playbooks.
+
+    Args:
+        _instance: The delegated driver.
+        mocker: Pytest mocker fixture.
+    """
+    provisioner = _instance._config.provisioner
+    assert provisioner is not None
+    clone = mocker.patch.object(provisioner, "clone")
+    discard = mocker.patch.object(provisioner, "discard")
+
+    assert not _instance.clone("snap", "entry", "instance_config.yml")
+    assert not _instance.discard("entry", "instance_config.yml")
+    assert not clone.called
+    assert not discard.called
+
+    scenario_directory = _instance._config.scenario.directory
+    for name in ("clone.yml", "discard.yml"):
+        with open(os.path.join(scenario_directory, name), "w") as stream:  # noqa: PTH118, PTH123
+            stream.write("---\n")
+
+    assert _instance.clone("snap", "entry", "instance_config.yml")
+    assert _instance.discard("entry", "instance_config.yml")
+    clone.assert_called_once_with("snap", "entry", "instance_config.yml")
+    discard.assert_called_once_with("entry", "instance_config.yml")
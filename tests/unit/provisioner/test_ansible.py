@@ -20,6 +20,7 @@
 from __future__ import annotations
 
 import collections
+import io
 import os
 
 from pathlib import Path
@@ -28,7 +29,7 @@ from typing import TYPE_CHECKING, Any
 import pytest
 
 from molecule import config, util
-from molecule.exceptions import MoleculeError
+from molecule.exceptions import MoleculeError, ScenarioFailureError
 from molecule.provisioner import ansible, ansible_playbooks
 from tests.unit.conftest import os_split  # pylint:disable=C0411
 
@@ -450,6 +451,53 @@ def test_side_effect(  # noqa: D103
     _patched_ansible_playbook.return_value.execute.assert_called_once_with()
 
 
+def test_fact_cache_opt_in(instance: ansible.Ansible) -> None:  # noqa: D103
+    assert "fact_caching" not in instance.config_options["defaults"]
+    assert not instance.fact_cache_enabled
+
+    instance._config.config_data["ansible"]["fact_cache"] = True
+
+    defaults = instance.config_options["defaults"]
+    assert defaults["fact_caching"] == "jsonfile"
+    assert defaults["fact_caching_connection"] == instance.fact_cache_directory
+    assert defaults["gathering"] == "smart"
+    assert instance.fact_cache_enabled
+
+
+@pytest.mark.parametrize("step", ("prepare", "side_effect"))
+def test_step_clears_fact_cache(  # noqa: D103
+    instance: ansible.Ansible,
+    _patched_ansible_playbook: Mock,  # noqa: PT019
+    step: str,
+) -> None:
+    fact_cache = Path(instance.fact_cache_directory)
+    fact_cache.mkdir(parents=True)
+    (fact_cache / "instance").write_text("{}")
+
+    getattr(instance, step)()
+
+    assert not fact_cache.exists()
+
+
+def test_fact_cache_disabled_per_step(  # noqa: D103
+    instance: ansible.Ansible,
+    monkeypatch: pytest.MonkeyPatch,
+    _patched_ansible_playbook: Mock,  # noqa: PT019
+) -> None:
+    instance._config.config_data["ansible"]["fact_cache"] = True
+    monkeypatch.setenv("MOLECULE_FACT_CACHE_DISABLE", "verify, side_effect")
+    instance._config.action = "converge"
+    assert instance.fact_cache_enabled
+
+    instance._config.action = "verify"
+    assert not instance.fact_cache_enabled
+    instance._get_ansible_playbook(instance.playbooks.converge)
+    _patched_ansible_playbook.return_value.add_env_arg.assert_called_once_with(
+        "ANSIBLE_CACHE_PLUGIN",
+        "memory",
+    )
+
+
 def test_create(  # noqa: D103
     instance: ansible.Ansible,
     mocker: MockerFixture,
@@ -522,6 +570,43 @@ def test_verify(  # noqa: D103
         _patched_ansible_playbook.return_value.execute.assert_called_once_with()
 
 
+def test_verify_runs_playbooks_concurrently(  # noqa: D103
+    instance: ansible.Ansible,
+    mocker: MockerFixture,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("MOLECULE_PLAYBOOK_CONCURRENCY", "2")
+    monkeypatch.delenv("MOLECULE_QUIET_ANSIBLE", raising=False)
+    stdout = io.StringIO()
+    monkeypatch.setattr("molecule.app.original_stdout", stdout)
+    instance._config.command_args["command_borders"] = False
+
+    def playbook(path: str, *_args: object, **_kwargs: object) -> Mock:
+        pb = mocker.Mock()
+        if path.endswith("ok.yml"):
+            pb.execute.return_value = "ok output\n"
+        else:
+            error = ScenarioFailureError("failed", code=2, ansible_output=f"{path} output\n")
+            pb.execute.side_effect = error
+        return pb
+
+    mocker.patch("molecule.provisioner.ansible_playbook.AnsiblePlaybook", side_effect=playbook)
+
+    with pytest.raises(ScenarioFailureError) as exc_info:
+        instance.verify(["bad1.yml", "ok.yml", "bad2.yml"])
+
+    assert exc_info.value.message == "Playbooks failed: bad1.yml, bad2.yml"
+    assert exc_info.value.code == 2  # noqa: PLR2004
+    out = stdout.getvalue()
+    assert out.index("bad1.yml output") < out.index("ok output") < out.index("bad2.yml output")
+
+
+def test_playbook_concurrency_invalid(monkeypatch: pytest.MonkeyPatch) -> None:  # noqa: D103
+    monkeypatch.setenv("MOLECULE_PLAYBOOK_CONCURRENCY", "0")
+    with pytest.raises(MoleculeError):
+        ansible.get_playbook_concurrency()
+
+
 def test_ansible_write_config(instance):  # type: ignore[no-untyped-def]  # noqa: ANN201, D103
     instance.write_config()
 
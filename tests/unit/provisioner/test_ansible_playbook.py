@@ -20,6 +20,7 @@
 from __future__ import annotations
 
 from subprocess import CompletedProcess
+from typing import TYPE_CHECKING
 
 import pytest
 
@@ -28,6 +29,10 @@ from molecule.exceptions import MoleculeError
 from molecule.provisioner import ansible_playbook
 
 
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+
 @pytest.fixture
 def _instance(config_instance: config.Config) -> ansible_playbook.AnsiblePlaybook:
     config_instance.scenario.results.add_action_result("ansible_playbook")
@@ -334,6 +339,21 @@ def test_execute_playbook(patched_run_command, _instance):  # type: ignore[no-un
     assert result == "patched-run-command-stdout"
 
 
+def test_execute_playbook_captured(  # noqa: D103
+    mocker: MockerFixture,
+    _instance: ansible_playbook.AnsiblePlaybook,  # noqa: PT019
+) -> None:
+    run = mocker.patch.object(
+        _instance._config.runtime,
+        "run",
+        return_value=CompletedProcess(args=[], returncode=0, stdout="out", stderr="warn"),
+    )
+    _instance._ansible_command = ["ansible-playbook", "playbook"]
+
+    assert _instance.execute(capture=True) == "outwarn"
+    assert run.call_args.kwargs["tee"] is False
+
+
 def test_ansible_execute_bakes(_inventory_directory, patched_run_command, _instance):  # type: ignore[no-untyped-def]  # noqa: ANN201, PT019, D103
     _instance.execute()
 
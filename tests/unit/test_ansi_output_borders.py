@@ -3,15 +3,19 @@
 from __future__ import annotations
 
 import io
+import os
 import re
+import signal
 import sys
 
 import pytest
 
+from molecule import ansi_output
 from molecule.ansi_output import (
     AnsiOutput,
     BorderedStream,
     CommandBorders,
+    ShadowBuffer,
     get_line_style,
     split_command_to_strings,
 )
@@ -83,6 +87,8 @@ def test_split_command_to_strings_short_options() -> None:
         ("\x1b[32;1mGreen bold\x1b[0m", "\x1b[32;1m"),
         ("\033[33mYellow\033[0m", "\033[33m"),
         ("\x1b[0mReset only", ""),  # Reset sequences are ignored
+        ("\x1b[0;32mReset green", "\x1b[32m"),
+        ("\x1b[1;30mBold reset", ""),
     ),
     ids=[
         "empty_string",
@@ -92,6 +98,8 @@ def test_split_command_to_strings_short_options() -> None:
         "green_bold_combination",
         "yellow_octal_escape",
         "reset_sequence_only",
+        "reset_then_color",
+        "other_reset_sequence",
     ],
 )
 def test_get_line_style(input_line: str, expected: str) -> None:
@@ -201,6 +209,32 @@ def test_bordered_stream_getvalue() -> None:
     assert "Test line\n" in result
 
 
+def test_bordered_stream_shadow_buffer_is_bounded() -> None:
+    """Only the most recent text is kept, or none when disabled."""
+    buffer = ShadowBuffer(8)
+    buffer.write("abcdef")
+    buffer.write("ghij")
+    assert buffer.getvalue() == "cdefghij"
+
+    stream = BorderedStream(AnsiOutput(), io.StringIO(), shadow_limit=0)
+    stream.write("Test line\n")
+    assert stream.getvalue() == ""
+
+
+@pytest.mark.skipif(not hasattr(signal, "SIGWINCH"), reason="requires SIGWINCH")
+def test_terminal_width_refreshed_on_resize(monkeypatch: pytest.MonkeyPatch) -> None:
+    """The terminal width is looked up again only after a resize."""
+    monkeypatch.delenv("COLUMNS", raising=False)
+    monkeypatch.setattr(ansi_output.terminal_width, "columns", {})
+    sizes = iter((os.terminal_size((80, 24)), os.terminal_size((120, 24))))
+    monkeypatch.setattr(ansi_output.shutil, "get_terminal_size", lambda: next(sizes))
+
+    assert ansi_output.terminal_width() == 80  # noqa: PLR2004
+    assert ansi_output.terminal_width() == 80  # noqa: PLR2004
+    signal.raise_signal(signal.SIGWINCH)
+    assert ansi_output.terminal_width() == 120  # noqa: PLR2004
+
+
 def test_command_borders_basic_functionality(monkeypatch: pytest.MonkeyPatch) -> None:
     """Test CommandBorders basic functionality."""
     # Override the autouse _no_color fixture
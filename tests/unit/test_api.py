@@ -20,14 +20,23 @@
 #  DEALINGS IN THE SOFTWARE.
 from __future__ import annotations
 
-from unittest.mock import MagicMock, patch
+from importlib.metadata import EntryPoint
+from typing import TYPE_CHECKING
+from unittest.mock import patch
 
 from molecule import api
 from molecule.driver.base import Driver
 from molecule.exceptions import MoleculeError
+from molecule.verifier import ansible
 from molecule.verifier.base import Verifier
 
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    import pytest
+
+
 def test_api_drivers() -> None:  # noqa: D103
     results = api.drivers()
 
@@ -43,48 +52,125 @@ def test_api_verifiers() -> None:  # noqa: D103
     assert all(elem in api.verifiers() for elem in x)
 
 
-def test_drivers_logs_exception_on_plugin_failure() -> None:
-    """Drivers that raise MoleculeError or TypeError are logged and skipped."""
+class _BrokenDriver(Driver):
+    def __init__(self, config: object = None) -> None:  # noqa: ARG002  # pylint: disable=super-init-not-called
+        msg = "cannot initialize"
+        raise MoleculeError(msg)
+
+
+class _RenamedVerifier(ansible.Ansible):
+    name = "renamed"  # type: ignore[assignment]
 
-    class _BrokenDriver(Driver):
-        def __init__(self, config: object = None) -> None:  # noqa: ARG002  # pylint: disable=super-init-not-called
-            msg = "cannot initialize"
-            raise MoleculeError(msg)
 
-    mock_pm = MagicMock()
-    mock_pm.get_plugins.return_value = [_BrokenDriver]
-    mock_pm.get_name.return_value = "_BrokenDriver"
+class _BrokenVerifier(Verifier):
+    def __init__(self, config: object = None) -> None:  # noqa: ARG002  # pylint: disable=super-init-not-called
+        msg = "boom"
+        raise RuntimeError(msg)
 
+
+def test_drivers_logs_exception_on_plugin_failure() -> None:
+    """Drivers that raise MoleculeError or TypeError are logged and skipped."""
     with (
-        patch("molecule.api.pluggy.PluginManager", return_value=mock_pm),
+        patch(
+            "molecule.api._entry_points",
+            return_value={"broken": f"{__name__}:_BrokenDriver"},
+        ),
         patch("molecule.api.LOG") as mock_log,
     ):
         api.drivers.cache_clear()
         result = api.drivers.__wrapped__(None)
+        assert "broken" in result
+        assert dict(result.items()) == {}
+        assert "broken" not in result
 
-    assert result == {}
     mock_log.exception.assert_called_once()
-    assert "_BrokenDriver" in mock_log.exception.call_args[0][1]
+    assert "broken" in mock_log.exception.call_args[0]
 
 
 def test_verifiers_logs_exception_on_plugin_failure() -> None:
     """Verifiers that raise an exception are logged and skipped."""
-
-    class _BrokenVerifier(Verifier):
-        def __init__(self, config: object = None) -> None:  # noqa: ARG002  # pylint: disable=super-init-not-called
-            msg = "boom"
-            raise RuntimeError(msg)
-
-    mock_pm = MagicMock()
-    mock_pm.get_plugins.return_value = [_BrokenVerifier]
-
     with (
-        patch("molecule.api.pluggy.PluginManager", return_value=mock_pm),
+        patch(
+            "molecule.api._entry_points",
+            return_value={"broken": f"{__name__}:_BrokenVerifier"},
+        ),
         patch("molecule.api.LOG") as mock_log,
     ):
         api.verifiers.cache_clear()
         result = api.verifiers.__wrapped__(None)
+        assert result.get("broken") is None
 
-    assert result == {}
+    assert len(result) == 0
     mock_log.exception.assert_called_once()
-    assert "_BrokenVerifier" in mock_log.exception.call_args[0][1]
+    assert "broken" in mock_log.exception.call_args[0]
+
+
+def test_drivers_are_loaded_lazily() -> None:
+    """Listing driver names does not import the driver classes."""
+    with patch("molecule.api.EntryPoint") as entry_point:
+        result = api.drivers.__wrapped__(None)
+        assert "default" in list(result)
+        entry_point.assert_not_called()
+
+    assert result["default"].name == "default"
+
+
+def test_entry_points_index_is_reused(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """The entry point index is read from disk while installed packages are unchanged.
+
+    Args:
+        tmp_path: Pytest tmp_path fixture.
+        monkeypatch: Pytest monkeypatch fixture.
+    """
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    api._entry_points.cache_clear()
+    eps = api._entry_points("molecule.driver")
+    assert eps["default"] == "molecule.driver.delegated:Delegated"
+    assert (tmp_path / "molecule" / "plugin-index.json").is_file()
+
+    api._entry_points.cache_clear()
+    with patch("molecule.api.entry_points") as entry_points:
+        assert (
+            api._entry_points("molecule.verifier")["ansible"] == "molecule.verifier.ansible:Ansible"
+        )
+        entry_points.assert_not_called()
+
+    api._entry_points.cache_clear()
+    with (
+        patch("molecule.api._site_packages_digest", return_value="changed"),
+        patch("molecule.api.entry_points", return_value=[]) as entry_points,
+    ):
+        assert api._entry_points("molecule.driver") == {}
+        assert entry_points.called
+    api._entry_points.cache_clear()
+
+
+def test_plugins_use_declared_names(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Plugins are indexed by entry point name, and found by declared name once loaded.
+
+    Args:
+        tmp_path: Pytest tmp_path fixture.
+        monkeypatch: Pytest monkeypatch fixture.
+    """
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    eps = [
+        EntryPoint("alias", f"{__name__}:_RenamedVerifier", "molecule.verifier"),
+        EntryPoint("broken", f"{__name__}:_BrokenVerifier", "molecule.verifier"),
+    ]
+    api._entry_points.cache_clear()
+    with (
+        patch("molecule.api.entry_points", return_value=eps),
+        patch.object(_RenamedVerifier, "__init__", side_effect=AssertionError) as init,
+    ):
+        assert api._entry_points("molecule.verifier") == {
+            "alias": f"{__name__}:_RenamedVerifier",
+            "broken": f"{__name__}:_BrokenVerifier",
+        }
+        init.assert_not_called()
+
+    with patch("molecule.api.LOG"):
+        result = api.verifiers.__wrapped__(None)
+        assert sorted(result) == ["alias", "broken"]
+        assert isinstance(result["renamed"], _RenamedVerifier)
+    assert list(result) == ["renamed"]
+    api._entry_points.cache_clear()
@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+import io
 import subprocess
 
 from typing import TYPE_CHECKING, cast
@@ -151,3 +152,52 @@ class TestAppRunCommand:
         assert "ANSIBLE_LIBRARY" in merged_env, (
             "ANSIBLE_LIBRARY was lost during env merge — this causes module discovery failures"
         )
+
+
+def test_run_command_flushes_log_lines_first(app_instance: App) -> None:
+    """Verify pending log lines are written before the command runs.
+
+    Args:
+        app_instance: Molecule app instance.
+    """
+    calls: list[str] = []
+    mock_run = cast("MagicMock", app_instance.runtime.run)
+    mock_run.side_effect = lambda **_kwargs: calls.append("run") or mock_run.return_value
+    with patch(
+        "molecule.app.logger.flush_console_handlers",
+        side_effect=lambda: calls.append("flush"),
+    ):
+        app_instance.run_command(["echo", "hello"])
+
+    assert calls == ["flush", "run"]
+
+
+def test_write_output_honours_quiet_ansible(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Verify captured output goes to the original stdout unless Ansible is quiet.
+
+    Args:
+        monkeypatch: Pytest monkeypatch fixture.
+    """
+    stdout = io.StringIO()
+    monkeypatch.setattr("molecule.app.original_stdout", stdout)
+    monkeypatch.setenv("MOLECULE_QUIET_ANSIBLE", "1")
+    App.write_output("quiet\n")
+    assert not stdout.getvalue()
+
+    monkeypatch.delenv("MOLECULE_QUIET_ANSIBLE")
+    App.write_output("loud\n")
+    assert stdout.getvalue() == "loud\n"
+
+
+def test_run_command_captured(app_instance: App) -> None:
+    """Verify captured commands are neither teed nor bordered.
+
+    Args:
+        app_instance: Molecule app instance.
+    """
+    with patch("molecule.app.CommandBorders") as borders:
+        app_instance.run_command(["echo", "hello"], command_borders=True, capture=True)
+
+    mock_run = cast("MagicMock", app_instance.runtime.run)
+    assert mock_run.call_args.kwargs["tee"] is False
+    assert not borders.called
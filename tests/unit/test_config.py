@@ -522,11 +522,15 @@ def test_ansible_section_defaults() -> None:
     # Playbooks now have default filenames
     expected_playbooks = {
         "cleanup": "cleanup.yml",
+        "clone": "clone.yml",
         "create": "create.yml",
         "converge": "converge.yml",
         "destroy": "destroy.yml",
+        "discard": "discard.yml",
         "prepare": "prepare.yml",
+        "restore": "restore.yml",
         "side_effect": "side_effect.yml",
+        "snapshot": "snapshot.yml",
         "verify": "verify.yml",
     }
     assert defaults["ansible"]["playbooks"] == expected_playbooks
@@ -0,0 +1,137 @@
+"""Unit tests for the molecule serve daemon."""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import time
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from molecule import daemon
+from molecule.api import _site_packages_digest
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest_mock import MockerFixture
+
+
+def test_socket_path(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """The socket lives in the runtime dir unless overridden."""
+    monkeypatch.delenv("MOLECULE_SERVE_SOCKET", raising=False)
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+    assert daemon.socket_path() == tmp_path / "molecule" / "molecule.sock"
+
+    monkeypatch.setenv("MOLECULE_SERVE_SOCKET", str(tmp_path / "custom.sock"))
+    assert daemon.socket_path() == tmp_path / "custom.sock"
+
+
+def test_forward_without_server(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """Without a listening server the command runs in-process."""
+    monkeypatch.setenv("MOLECULE_SERVE_SOCKET", str(tmp_path / "missing.sock"))
+    assert daemon.forward(["list"]) is None
+
+
+def test_forward_skips_serve(monkeypatch: pytest.MonkeyPatch) -> None:
+    """The serve command itself and opted-out callers are never forwarded."""
+    monkeypatch.delenv("MOLECULE_NO_SERVE", raising=False)
+    assert daemon.forward(["serve"]) is None
+    monkeypatch.setenv("MOLECULE_NO_SERVE", "1")
+    assert daemon.forward(["list"]) is None
+
+
+def test_code_changed(tmp_path: Path) -> None:
+    """Changed sources and installed packages make the server stale."""
+    source = tmp_path / "module.py"
+    source.write_text("", encoding="utf-8")
+    mtimes = {str(tmp_path): tmp_path.stat().st_mtime_ns, str(source): source.stat().st_mtime_ns}
+    site_packages = _site_packages_digest()
+
+    assert not daemon.code_changed(site_packages, mtimes)
+    assert daemon.code_changed("other", mtimes)
+    os.utime(source, ns=(0, 0))
+    assert daemon.code_changed(site_packages, mtimes)
+    source.unlink()
+    assert daemon.code_changed(site_packages, mtimes)
+
+
+def test_code_mtimes_skips_bytecode() -> None:
+    """Bytecode caches, written by the children, are not tracked."""
+    mtimes = daemon.code_mtimes()
+
+    assert daemon.__file__ in mtimes
+    assert not any("__pycache__" in path for path in mtimes)
+
+
+def test_warm_runtime_is_kept_per_project_and_environment(
+    mocker: MockerFixture,
+    tmp_path: Path,
+) -> None:
+    """The Ansible runtime is only rebuilt for another project or environment."""
+    get_app = mocker.patch("molecule.app.get_app")
+    server = daemon.Server(tmp_path / "molecule.sock")
+    env = {"PATH": os.environ.get("PATH", "")}
+    saved_env, saved_cwd = dict(os.environ), os.getcwd()  # noqa: PTH109
+
+    server.warm_runtime({"env": env, "cwd": str(tmp_path)})
+    server.warm_runtime({"env": env, "cwd": str(tmp_path)})
+    get_app.assert_called_once_with(tmp_path)
+    assert dict(os.environ) == saved_env
+    assert os.getcwd() == saved_cwd  # noqa: PTH109
+
+    server.warm_runtime({"env": {**env, "FOO": "bar"}, "cwd": str(tmp_path)})
+    assert get_app.call_count == 2  # noqa: PLR2004
+    assert get_app.cache_clear.call_count == 2  # noqa: PLR2004
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires fork")
+def test_server_runs_forwarded_commands(tmp_path: Path) -> None:
+    """Commands forwarded to a running server report their exit code."""
+    sock = tmp_path / "molecule.sock"
+    env = {**os.environ, "MOLECULE_SERVE_SOCKET": str(sock)}
+    env.pop("MOLECULE_NO_SERVE", None)
+    server = subprocess.Popen(
+        [sys.executable, "-m", "molecule", "serve"],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        deadline = time.monotonic() + 60
+        while not sock.exists():
+            assert server.poll() is None
+            assert time.monotonic() < deadline
+            time.sleep(0.1)
+
+        def run(*args: str, **extra_env: str) -> subprocess.CompletedProcess[str]:
+            return subprocess.run(
+                [sys.executable, "-m", "molecule", *args],
+                env={**env, **extra_env},
+                cwd=tmp_path,
+                capture_output=True,
+                text=True,
+                check=False,
+            )
+
+        result = run("drivers")
+        assert result.returncode == 0
+        assert "default" in result.stdout
+
+        result = run("no-such-command")
+        assert result.returncode == 2  # noqa: PLR2004
+        assert "No such command" in result.stderr
+
+        # Callers with different import time settings fall back to in-process.
+        result = run("drivers", MOLECULE_DEBUG="1")
+        assert result.returncode == 0
+        assert server.poll() is None
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
+
+    assert not sock.exists()
@@ -0,0 +1,173 @@
+"""Unit tests for fused execution of playbook steps."""
+
+from __future__ import annotations
+
+import json
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+from molecule import fused, util
+from molecule.exceptions import ScenarioFailureError
+
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+    from molecule import config
+
+
+SEQUENCE = ["create", "prepare", "converge", "idempotence", "side_effect", "verify", "destroy"]
+
+
+@pytest.fixture
+def _playbooks(config_instance: config.Config, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("MOLECULE_FUSE_STEPS", "1")
+    config_instance.config_data["provisioner"]["options"] = {}
+    for name in ("converge", "side_effect", "verify"):
+        util.write_file(Path(config_instance.scenario.directory, f"{name}.yml"), "")
+
+
+def _output(*steps: tuple[str, str]) -> str:
+    return "".join(f"PLAY [molecule step: {step}] ***\n{body}\n" for step, body in steps)
+
+
+def test_plan_disabled(config_instance: config.Config, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Without MOLECULE_FUSE_STEPS every step runs on its own."""
+    monkeypatch.delenv("MOLECULE_FUSE_STEPS", raising=False)
+    assert fused.plan(config_instance, SEQUENCE) == [[step] for step in SEQUENCE]
+
+
+@pytest.mark.usefixtures("_playbooks")
+def test_plan(config_instance: config.Config) -> None:
+    """Consecutive playbook steps are grouped."""
+    assert fused.plan(config_instance, SEQUENCE) == [
+        ["create"],
+        ["prepare"],
+        ["converge", "idempotence", "side_effect", "verify"],
+        ["destroy"],
+    ]
+    # Idempotence cannot run ahead of converge, and one step alone is not fused.
+    assert fused.plan(config_instance, ["idempotence", "verify"]) == [["idempotence"], ["verify"]]
+
+    # Playbooks given in the sequence are imported instead.
+    sequence = ["converge", "side_effect side_effect.yml converge.yml", "verify"]
+    assert fused.plan(config_instance, sequence) == [sequence]
+
+    # The fused run cannot apply the environment of the verifier.
+    config_instance.config_data["verifier"]["env"] = {"FOO": "bar"}
+    assert fused.plan(config_instance, sequence) == [sequence[:2], ["verify"]]
+    config_instance.config_data["verifier"]["env"] = {}
+
+    # become only applies to converge, which a fused run cannot express.
+    config_instance.config_data["provisioner"]["options"] = {"become": True}
+    assert fused.plan(config_instance, SEQUENCE) == [[step] for step in SEQUENCE]
+
+
+@pytest.mark.usefixtures("_playbooks")
+def test_write_playbook(config_instance: config.Config) -> None:
+    """Each imported playbook follows a marker play, facts are dropped after side effects."""
+    path = fused.write_playbook(config_instance, ["converge", "side_effect", "verify"])
+
+    plays = util.safe_load_file(path)
+    assert [play.get("name") for play in plays[::2]] == [
+        "molecule step: converge",
+        "molecule step: side_effect",
+        "molecule step: verify",
+    ]
+    assert plays[1]["ansible.builtin.import_playbook"].endswith("converge.yml")
+    assert not plays[2]["tasks"]
+    assert plays[4]["tasks"][0]["ansible.builtin.meta"] == "clear_facts"
+
+    path = fused.write_playbook(config_instance, ["side_effect converge.yml side_effect.yml"])
+    plays = util.safe_load_file(path)
+    assert [play["ansible.builtin.import_playbook"] for play in plays[1:]] == [
+        str(Path(config_instance.scenario.directory, "converge.yml")),
+        str(Path(config_instance.scenario.directory, "side_effect.yml")),
+    ]
+
+
+@pytest.mark.usefixtures("_playbooks")
+def test_callback_env(config_instance: config.Config, monkeypatch: pytest.MonkeyPatch) -> None:
+    """The callback is added to those already configured."""
+    monkeypatch.setenv("ANSIBLE_CALLBACKS_ENABLED", "profile_tasks")
+    monkeypatch.setenv("ANSIBLE_CALLBACK_PLUGINS", "/plugins")
+
+    env = fused.callback_env(config_instance, "/results.json")
+
+    assert env["ANSIBLE_CALLBACKS_ENABLED"] == "profile_tasks,molecule_steps"
+    assert env["ANSIBLE_CALLBACK_PLUGINS"] == f"{fused.CALLBACK_PLUGINS}:/plugins"
+    assert Path(fused.CALLBACK_PLUGINS, "molecule_steps.py").is_file()
+
+
+@pytest.mark.usefixtures("_playbooks")
+def test_execute(mocker: MockerFixture, config_instance: config.Config) -> None:
+    """Each step gets a result and converge marks the instances converged."""
+    output = _output(("converge", "changed: [instance]"), ("idempotence", "ok: [instance]"))
+    mocker.patch("molecule.provisioner.ansible.Ansible.converge", return_value=output)
+
+    fused.execute(config_instance, ["converge", "idempotence"])
+
+    actions = config_instance.scenario.results.actions
+    assert [action.action for action in actions] == ["converge", "idempotence"]
+    assert [action.summary.state for action in actions] == ["successful", "successful"]
+    assert config_instance.state.converged
+
+
+@pytest.mark.usefixtures("_playbooks")
+def test_execute_not_idempotent(mocker: MockerFixture, config_instance: config.Config) -> None:
+    """Only the changes of the idempotence run count."""
+    output = _output(
+        ("converge", "TASK [install] ***\nchanged: [instance]"),
+        ("idempotence", "TASK [restart] ***\nchanged: [instance]"),
+    )
+    mocker.patch("molecule.provisioner.ansible.Ansible.converge", return_value=output)
+
+    with pytest.raises(ScenarioFailureError, match=r"\[instance\] => restart"):
+        fused.execute(config_instance, ["converge", "idempotence", "verify"])
+
+    actions = config_instance.scenario.results.actions
+    assert [action.summary.state for action in actions] == ["successful", "failed"]
+
+
+@pytest.mark.usefixtures("_playbooks")
+def test_execute_failure(mocker: MockerFixture, config_instance: config.Config) -> None:
+    """A failed run is attributed to the step the callback found failed."""
+    output = _output(
+        ("converge", "TASK [install] ***\nok: [instance]"),
+        ("side_effect", "TASK [break] ***\nfatal: [instance]: FAILED! => {}"),
+        ("verify", ""),
+    )
+    error = ScenarioFailureError("Ansible return code was 2", code=2, ansible_output=output)
+
+    def converge(playbook: str, env: dict[str, str]) -> str:
+        Path(env["MOLECULE_FUSED_RESULTS"]).write_text(json.dumps({"failed": [1]}))
+        raise error
+
+    mocker.patch("molecule.provisioner.ansible.Ansible.converge", side_effect=converge)
+
+    with pytest.raises(ScenarioFailureError):
+        fused.execute(config_instance, ["converge", "side_effect", "verify"])
+
+    actions = config_instance.scenario.results.actions
+    assert [action.action for action in actions] == ["converge", "side_effect"]
+    assert actions[1].summary.state == "failed"
+
+
+@pytest.mark.usefixtures("_playbooks")
+def test_execute_failure_without_failed_step(
+    mocker: MockerFixture,
+    config_instance: config.Config,
+) -> None:
+    """Without failed steps recorded, the last step started failed."""
+    output = _output(("converge", "ok: [instance]"), ("side_effect", "ERROR! syntax"))
+    error = ScenarioFailureError("Ansible return code was 4", code=4, ansible_output=output)
+    mocker.patch("molecule.provisioner.ansible.Ansible.converge", side_effect=error)
+
+    with pytest.raises(ScenarioFailureError):
+        fused.execute(config_instance, ["converge", "side_effect", "verify"])
+
+    actions = config_instance.scenario.results.actions
+    assert [action.summary.state for action in actions] == ["successful", "failed"]
@@ -19,12 +19,14 @@
 #  DEALINGS IN THE SOFTWARE.
 from __future__ import annotations
 
+import io
 import logging
 
 from typing import TYPE_CHECKING
 
 import pytest
 
+from molecule import logger
 from molecule.ansi_output import should_do_markup
 from molecule.command.base import Base
 from molecule.logger import get_scenario_logger, get_section_loggers
@@ -162,3 +164,62 @@ def test_scenario_logger_with_step(caplog):  # type: ignore[no-untyped-def]  # n
     assert hasattr(record, "molecule_scenario")
     assert record.molecule_step == "test"
     assert record.molecule_scenario == "test_scenario"
+
+
+def test_scenario_logger_is_cached():  # type: ignore[no-untyped-def]  # noqa: ANN201, D103
+    adapter = get_scenario_logger("test", "test_scenario", "converge")
+
+    assert get_scenario_logger("test", "test_scenario", "converge") is adapter
+    assert get_scenario_logger("test", "test_scenario", "verify") is not adapter
+
+
+def test_console_handler_batches_lines(monkeypatch):  # type: ignore[no-untyped-def]  # noqa: ANN201, D103
+    stream = io.StringIO()
+    monkeypatch.setattr(logger, "original_stderr", stream)
+    monkeypatch.setenv("NO_COLOR", "1")
+    # Keep the timer from flushing while the test runs.
+    monkeypatch.setattr(logger, "FLUSH_INTERVAL", 3600)
+    handler = logger.MoleculeConsoleHandler()
+    handler._interactive = False
+    # Forks in other tests flush registered handlers.
+    logger._console_handlers.discard(handler)
+    test_logger = logging.getLogger("molecule.test_batches")
+    monkeypatch.setattr(test_logger, "handlers", [handler])
+    monkeypatch.setattr(test_logger, "propagate", False)
+    monkeypatch.setattr(test_logger, "level", logging.INFO)
+
+    test_logger.info("first [b]bold[/]")
+    test_logger.info("second")
+    assert stream.getvalue() == ""
+
+    test_logger.warning("third")
+    assert stream.getvalue().splitlines() == [
+        "INFO     first bold",
+        "INFO     second",
+        "WARNING  third",
+    ]
+    handler.close()
+
+
+def test_console_handler_finds_other_handlers(monkeypatch):  # type: ignore[no-untyped-def]  # noqa: ANN201, D103
+    handler = logger.MoleculeConsoleHandler()
+    logger._console_handlers.discard(handler)
+    parent = logging.getLogger("molecule.test_other_handlers")
+    test_logger = logging.getLogger("molecule.test_other_handlers.child")
+    monkeypatch.setattr(parent, "handlers", [logging.NullHandler()])
+    monkeypatch.setattr(parent, "propagate", False)
+    monkeypatch.setattr(test_logger, "handlers", [handler])
+    monkeypatch.setattr(test_logger, "propagate", False)
+    record = test_logger.makeRecord(test_logger.name, logging.INFO, __file__, 0, "msg", (), None)
+
+    assert not handler._has_other_handlers(record)
+
+    # Changes to propagation and handler lists show up at once.
+    test_logger.propagate = True
+    assert handler._has_other_handlers(record)
+    test_logger.propagate = False
+    test_logger.handlers = [handler, parent.handlers[0]]
+    assert handler._has_other_handlers(record)
+    test_logger.removeHandler(parent.handlers[0])
+    assert not handler._has_other_handlers(record)
+    handler.close()
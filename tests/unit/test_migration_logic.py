@@ -82,13 +82,18 @@ def test_ansible_args_migration(tmp_path: Path, caplog: pytest.LogCaptureFixture
                     ],  # migrated from provisioner.ansible_args
                 },
             },
+            "fact_cache": False,
             "playbooks": {
                 "cleanup": "cleanup.yml",
+                "clone": "clone.yml",
                 "create": "create.yml",
                 "converge": "converge.yml",
                 "destroy": "destroy.yml",
+                "discard": "discard.yml",
                 "prepare": "prepare.yml",
+                "restore": "restore.yml",
                 "side_effect": "side_effect.yml",
+                "snapshot": "snapshot.yml",
                 "verify": "verify.yml",
             },
         },
@@ -182,13 +187,18 @@ def test_config_options_migration(tmp_path: Path, caplog: pytest.LogCaptureFixtu
                     "ansible_playbook": [],
                 },
             },
+            "fact_cache": False,
             "playbooks": {
                 "cleanup": "cleanup.yml",
+                "clone": "clone.yml",
                 "create": "create.yml",
                 "converge": "converge.yml",
                 "destroy": "destroy.yml",
+                "discard": "discard.yml",
                 "prepare": "prepare.yml",
+                "restore": "restore.yml",
                 "side_effect": "side_effect.yml",
+                "snapshot": "snapshot.yml",
                 "verify": "verify.yml",
             },
         },
@@ -277,13 +287,18 @@ def test_env_migration(tmp_path: Path, caplog: pytest.LogCaptureFixture) -> None
                     "ansible_playbook": [],
                 },
             },
+            "fact_cache": False,
             "playbooks": {
                 "cleanup": "cleanup.yml",
+                "clone": "clone.yml",
                 "create": "create.yml",
                 "converge": "converge.yml",
                 "destroy": "destroy.yml",
+                "discard": "discard.yml",
                 "prepare": "prepare.yml",
+                "restore": "restore.yml",
                 "side_effect": "side_effect.yml",
+                "snapshot": "snapshot.yml",
                 "verify": "verify.yml",
             },
         },
@@ -369,13 +384,18 @@ def test_playbooks_migration(tmp_path: Path, caplog: pytest.LogCaptureFixture) -
                     "ansible_playbook": [],
                 },
             },
+            "fact_cache": False,
             "playbooks": {
                 "cleanup": "cleanup.yml",  # default preserved
+                "clone": "clone.yml",  # default preserved
                 "create": "my_create.yml",  # user override from provisioner.playbooks
                 "converge": "my_converge.yml",  # user override from provisioner.playbooks
                 "destroy": "destroy.yml",  # default preserved
+                "discard": "discard.yml",  # default preserved
                 "prepare": "prepare.yml",  # default preserved
+                "restore": "restore.yml",  # default preserved
                 "side_effect": "side_effect.yml",  # default preserved
+                "snapshot": "snapshot.yml",  # default preserved
                 "verify": "verify.yml",  # default preserved
             },
         },
@@ -475,13 +495,18 @@ def test_multiple_keys_migration(tmp_path: Path, caplog: pytest.LogCaptureFixtur
                     "ansible_playbook": ["--verbose"],  # migrated from provisioner.ansible_args
                 },
             },
+            "fact_cache": False,
             "playbooks": {
                 "cleanup": "cleanup.yml",  # default preserved
+                "clone": "clone.yml",  # default preserved
                 "create": "create.yml",  # default preserved
                 "converge": "my_converge.yml",  # user override from provisioner.playbooks
                 "destroy": "destroy.yml",  # default preserved
+                "discard": "discard.yml",  # default preserved
                 "prepare": "prepare.yml",  # default preserved
+                "restore": "restore.yml",  # default preserved
                 "side_effect": "side_effect.yml",  # default preserved
+                "snapshot": "snapshot.yml",  # default preserved
                 "verify": "verify.yml",  # default preserved
             },
         },
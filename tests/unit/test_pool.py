@@ -0,0 +1,114 @@
+"""Unit tests for the instance pool."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+from molecule import pool
+from molecule.exceptions import MoleculeError
+
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+
+def test_get_pool_size(monkeypatch: pytest.MonkeyPatch) -> None:
+    """The pool is disabled unless MOLECULE_POOL_SIZE is set."""
+    monkeypatch.delenv("MOLECULE_POOL_SIZE", raising=False)
+    assert pool.get_pool_size() is None
+
+    monkeypatch.setenv("MOLECULE_POOL_SIZE", "0")
+    assert pool.get_pool_size() == 0
+
+    monkeypatch.setenv("MOLECULE_POOL_SIZE", "-1")
+    with pytest.raises(MoleculeError):
+        pool.get_pool_size()
+
+
+def test_lease_and_release(tmp_path: Path) -> None:
+    """Entries are leased once, oldest first, and can be returned."""
+    instance_pool = pool.InstancePool(tmp_path, 2)
+    assert instance_pool.lease() is None
+
+    first = instance_pool.release("- instance: first\n", "snap")
+    instance_pool.release("- instance: second\n", "snap")
+    assert not instance_pool.has_room()
+
+    lease = instance_pool.lease()
+    assert lease == first
+    assert instance_pool.leased(first.id) == first
+    assert instance_pool.has_room()
+
+    instance_pool.release(lease.instance_config, lease.snapshot, lease.id)
+    assert instance_pool.leased(first.id) is None
+    assert len(instance_pool.entries()) == 2  # noqa: PLR2004
+
+
+def test_forget(tmp_path: Path) -> None:
+    """A forgotten lease is neither leased nor available."""
+    instance_pool = pool.InstancePool(tmp_path, 1)
+    instance_pool.release("- instance: first\n", "snap")
+    lease = instance_pool.lease()
+    assert lease is not None
+
+    instance_pool.forget(lease.id)
+
+    assert instance_pool.leased(lease.id) is None
+    assert instance_pool.lease() is None
+
+
+def test_prune_and_drain(tmp_path: Path, mocker: MockerFixture) -> None:
+    """Stale leases and empty entries are pruned, and draining destroys clones."""
+    config = mocker.Mock()
+    instance_pool = pool.InstancePool(tmp_path, 3)
+    instance_pool.release("- instance: clone\n", "snap", cloned=True)
+    lease = instance_pool.lease(owner=str(tmp_path / "removed"))
+    assert lease is not None
+    assert lease.cloned
+    instance_pool.release("", "snap")
+
+    pool.prune(config, instance_pool)
+
+    config.driver.discard.assert_called_once_with(lease.id, str(tmp_path / f"{lease.id}.yml"))
+    assert instance_pool.leased(lease.id) is None
+    assert not instance_pool.entries()
+
+    instance_pool.release("- instance: clone\n", "snap", cloned=True)
+    instance_pool.release("- instance: named\n", "snap", clean=False)
+    assert instance_pool.has_named_entries()
+
+    pool.drain(config, instance_pool)
+
+    assert config.driver.discard.call_count == 2  # noqa: PLR2004
+    assert not instance_pool.entries()
+    assert not list(instance_pool.leased_directory.iterdir())
+
+
+def test_replenish(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, mocker: MockerFixture) -> None:
+    """Pre-warming clones instances in the background until the pool is full."""
+
+    def clone(name: str, entry: str, instance_config: str) -> bool:
+        Path(instance_config).write_text(f"- instance: {entry}-{name}\n")
+        return True
+
+    config = mocker.Mock()
+    config.driver.clone.side_effect = clone
+    instance_pool = pool.InstancePool(tmp_path, 2)
+
+    monkeypatch.delenv("MOLECULE_POOL_PREWARM", raising=False)
+    assert pool.replenish(config, instance_pool, "snap") is None
+
+    monkeypatch.setenv("MOLECULE_POOL_PREWARM", "1")
+    thread = pool.replenish(config, instance_pool, "snap")
+    assert thread is not None
+    thread.join()
+
+    leases = [instance_pool.lease() for _ in range(2)]
+    assert all(lease and lease.cloned and lease.clean for lease in leases)
+    assert {lease.instance_config for lease in leases if lease} == {
+        f"- instance: {lease.id}-snap\n" for lease in leases if lease
+    }
+    assert not list(tmp_path.glob("*.yml"))
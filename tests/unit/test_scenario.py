@@ -21,6 +21,7 @@ from __future__ import annotations
 
 import os
 import shutil
+import threading
 
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -28,12 +29,17 @@ from typing import TYPE_CHECKING
 import pytest
 
 from molecule import config, util
+from molecule import scenario as scenario_module
+from molecule.constants import RC_TIMEOUT
+from molecule.exceptions import MoleculeError
 from molecule.scenario import Scenario
 
 
 if TYPE_CHECKING:
     from unittest.mock import Mock
 
+    from pytest_mock import MockerFixture
+
 
 # NOTE(retr0h): The use of the `patched_config_validate` fixture, disables
 # config.Config._validate from executing.  Thus preventing odd side-effects
@@ -87,6 +93,79 @@ def test_prune(_instance: Scenario) -> None:  # noqa: PT019, D103
         assert not (e_dir / pruned_dir).is_dir()
 
 
+def test_prune_background(_instance: Scenario, tmp_path: Path) -> None:  # noqa: PT019, D103
+    e_dir = Path(_instance.ephemeral_directory)
+    target = tmp_path / "target"
+    target.mkdir()
+    (e_dir / "facts" / "deep").mkdir(parents=True)
+    util.write_file(str(e_dir / "facts" / "deep" / "host"), "")
+    util.write_file(str(e_dir / "ansible.cfg"), "")
+    (e_dir / "linked").symlink_to(target)
+
+    thread = _instance.prune(background=True)
+    assert thread is not None
+    thread.join()
+
+    assert not (e_dir / "facts").exists()
+    assert (e_dir / "ansible.cfg").is_file()
+    # links to directories are neither followed nor removed
+    assert (e_dir / "linked").is_symlink()
+    assert target.is_dir()
+
+
+def test_prune_background_is_waited_for(  # noqa: D103
+    _instance: Scenario,  # noqa: PT019
+    mocker: MockerFixture,
+) -> None:
+    started = threading.Event()
+    release = threading.Event()
+    done: list[str] = []
+
+    def prune_directory(path: str, *_args: object) -> None:
+        started.set()
+        release.wait(5)
+        done.append(path)
+
+    mocker.patch.object(Scenario, "_prune_directory", side_effect=prune_directory)
+    path = _instance.ephemeral_directory
+
+    thread = _instance.prune(background=True)
+    assert thread is not None
+    started.wait(5)
+    threading.Timer(0.1, release.set).start()
+    # Reusing the directory waits for the prune to finish.
+    scenario_module.wait_for_prune(path)
+    assert done == [path]
+    assert not thread.is_alive()
+
+
+def test_prune_background_logs_failure(  # noqa: D103
+    _instance: Scenario,  # noqa: PT019
+    mocker: MockerFixture,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    mocker.patch.object(Scenario, "_prune_directory", side_effect=OSError("busy"))
+
+    thread = _instance.prune(background=True)
+    assert thread is not None
+    thread.join()
+
+    assert "Failed to prune" in caplog.text
+    assert "busy" in caplog.text
+
+
+def test_prune_driver_safe_file_patterns(_instance: Scenario) -> None:  # noqa: PT019, D103
+    e_dir = Path(_instance.ephemeral_directory)
+    _instance.config.config_data["driver"]["safe_files"] = [str(e_dir / "keep-*")]
+    util.write_file(str(e_dir / "keep-me"), "")
+    util.write_file(str(e_dir / "drop-me"), "")
+
+    assert _instance.prune() is None
+
+    assert (e_dir / "keep-me").is_file()
+    assert not (e_dir / "drop-me").exists()
+
+
 def test_config_member(_instance: Scenario) -> None:  # noqa: PT019, D103
     assert isinstance(_instance.config, config.Config)
 
@@ -279,3 +358,58 @@ def test_ephemeral_directory_overridden_via_env_var(
     # Confirm MOLECULE_EPHEMERAL_DIRECTORY uses absolute path.
     assert Path(scenario.ephemeral_directory).is_absolute()
     assert scenario.ephemeral_directory.endswith("foo/bar")
+
+
+def test_acquire_lock_waits_for_release(
+    _instance: Scenario,  # noqa: PT019
+    mocker: MockerFixture,
+    tmp_path: Path,
+) -> None:
+    """Confirm a contended lock is retried quickly and the holder is reported.
+
+    Args:
+        _instance: A Scenario instance.
+        mocker: Pytest mocker fixture.
+        tmp_path: Pytest tmp_path fixture.
+    """
+    lock_file = tmp_path / ".lock"
+    lock_file.write_text("pid=1 host=other scenario=foo\n")
+    lockf = mocker.patch(
+        "molecule.scenario.fcntl.lockf",
+        side_effect=[OSError, OSError, None],
+    )
+    sleep = mocker.patch("molecule.scenario.sleep")
+    warning = mocker.patch("molecule.logger.ScenarioLoggerAdapter.warning")
+
+    _instance._acquire_lock(lock_file)
+
+    assert lockf.call_count == 3  # noqa: PLR2004
+    delays = [c.args[0] for c in sleep.call_args_list]
+    assert delays == [scenario_module.LOCK_POLL_INTERVAL, scenario_module.LOCK_POLL_INTERVAL * 2]
+    warning.assert_called_once()
+    assert "pid=1 host=other scenario=foo" in warning.call_args.args
+    assert f"pid={os.getpid()}" in lock_file.read_text()
+    assert _instance._lock is not None
+    assert not _instance._lock.closed
+
+
+def test_acquire_lock_timeout(
+    _instance: Scenario,  # noqa: PT019
+    mocker: MockerFixture,
+    tmp_path: Path,
+) -> None:
+    """Confirm MoleculeError is raised once the lock deadline passes.
+
+    Args:
+        _instance: A Scenario instance.
+        mocker: Pytest mocker fixture.
+        tmp_path: Pytest tmp_path fixture.
+    """
+    mocker.patch.object(scenario_module, "LOCK_TIMEOUT", 0)
+    mocker.patch("molecule.scenario.fcntl.lockf", side_effect=OSError)
+
+    with pytest.raises(MoleculeError) as exc:
+        _instance._acquire_lock(tmp_path / ".lock")
+
+    assert exc.value.code == RC_TIMEOUT
+    assert _instance._lock is None
@@ -19,11 +19,72 @@
 #  DEALINGS IN THE SOFTWARE.
 from __future__ import annotations
 
+import subprocess
+import sys
+
+import click
 import pytest
 
 from molecule import shell
+from molecule.click_cfg import click_group_ex
 
 
 def test_shell() -> None:  # noqa: D103
     with pytest.raises(SystemExit):
         shell.main()  # pylint: disable=no-value-for-parameter
+
+
+def test_shell_import_does_not_load_subcommands() -> None:
+    """Importing the CLI entry point must not import command modules."""
+    code = (
+        "import sys, molecule.shell; "
+        "print(','.join(sorted(m for m in sys.modules "
+        "if m.startswith(('molecule.command', 'molecule.config', 'molecule.app')))))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert result.stdout.strip() == ""
+    assert "molecule.command" not in result.stderr
+
+
+def test_shell_import_skips_heavy_modules() -> None:
+    """Rich and ansible_compat are only imported once a command needs them."""
+    code = (
+        "import sys, molecule.shell; "
+        "print(','.join(m for m in ('rich', 'ansible_compat') if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert result.stdout.strip() == ""
+
+
+def test_shell_lists_and_loads_subcommands_lazily() -> None:
+    """Subcommands are listed from the registry and imported on first use."""
+    ctx = click.Context(shell.main)
+
+    assert shell.main.list_commands(ctx) == sorted(shell.SUBCOMMANDS)
+    command = shell.main.get_command(ctx, "list")
+    assert command is not None
+    assert command.name == "list"
+    assert "list" not in shell.main.lazy_commands  # type: ignore[attr-defined]
+
+
+def test_shell_complete_does_not_load_subcommands() -> None:
+    """Completing subcommand names does not import pending subcommands."""
+    group = click_group_ex(lazy_commands={"converge": "molecule.command.converge:converge"})(
+        lambda: None,
+    )
+    items = group.shell_complete(click.Context(group), "con")
+
+    assert [item.value for item in items] == ["converge"]
+    assert "converge" in group.lazy_commands  # type: ignore[attr-defined]
@@ -0,0 +1,113 @@
+"""Unit tests for the SSH connection pool."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+from molecule import ssh_pool, util
+from molecule.exceptions import MoleculeError
+
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+    from molecule import config
+
+
+@pytest.fixture
+def _enabled(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.setenv("MOLECULE_SSH_POOL", "1")
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+
+
+@pytest.fixture
+def _instances(config_instance: config.Config) -> None:
+    instances = [
+        {"instance": "vm", "address": "192.0.2.1", "user": "ci", "port": 22},
+        {"instance": "box", "address": "box", "connection": "community.docker.docker"},
+    ]
+    util.write_file(config_instance.driver.instance_config, util.safe_dump(instances))
+
+
+@pytest.mark.usefixtures("_enabled")
+def test_connection_options(config_instance: config.Config, tmp_path: Path) -> None:
+    """Ansible and the driver share the socket directory."""
+    control_path = str(tmp_path / "molecule-ssh" / "%C")
+    assert f"-o ControlPath={control_path}" in config_instance.driver.ssh_connection_options
+    assert config_instance.provisioner
+    ssh_connection = config_instance.provisioner.default_config_options["ssh_connection"]
+    assert ssh_connection["control_path_dir"] == str(tmp_path / "molecule-ssh")
+    assert "ControlPersist=30m" in ssh_connection["ssh_args"]
+
+
+@pytest.mark.usefixtures("_enabled", "_instances")
+def test_open_masters(mocker: MockerFixture, config_instance: config.Config) -> None:
+    """Masters are opened for SSH instances without one."""
+    mocker.patch("shutil.which", return_value="/usr/bin/ssh")
+    popen = mocker.patch("subprocess.Popen")
+    popen.return_value.wait.side_effect = [255, 0]
+
+    ssh_pool.open_masters(config_instance)
+
+    check, master = (call.args[0] for call in popen.call_args_list)
+    assert check[:3] == ["ssh", "-O", "check"]
+    assert master[:3] == ["ssh", "-f", "-N"]
+    assert "ControlMaster=yes" in master
+    assert master[-5:] == ["-p", "22", "-l", "ci", "192.0.2.1"]
+
+
+@pytest.mark.usefixtures("_instances")
+def test_disabled(
+    mocker: MockerFixture,
+    monkeypatch: pytest.MonkeyPatch,
+    config_instance: config.Config,
+) -> None:
+    """Nothing is opened or closed unless MOLECULE_SSH_POOL is set."""
+    monkeypatch.delenv("MOLECULE_SSH_POOL", raising=False)
+    popen = mocker.patch("subprocess.Popen")
+
+    ssh_pool.open_masters(config_instance)
+    ssh_pool.close_masters(config_instance)
+
+    assert not popen.called
+    assert "-o ControlPersist=60s" in config_instance.driver.ssh_connection_options
+
+
+@pytest.mark.usefixtures("_enabled", "_instances")
+def test_close_masters(mocker: MockerFixture, config_instance: config.Config) -> None:
+    """Only the masters opened by the scenario are stopped."""
+    mocker.patch("shutil.which", return_value="/usr/bin/ssh")
+    popen = mocker.patch("subprocess.Popen")
+
+    # A master opened by another scenario is left alone.
+    popen.return_value.wait.side_effect = [0]
+    ssh_pool.open_masters(config_instance)
+    ssh_pool.close_masters(config_instance)
+    assert popen.call_count == 1
+
+    popen.reset_mock()
+    popen.return_value.wait.side_effect = [255, 0, 0]
+    ssh_pool.open_masters(config_instance)
+    ssh_pool.close_masters(config_instance)
+
+    stop = popen.call_args_list[-1].args[0]
+    assert stop[:3] == ["ssh", "-O", "stop"]
+    assert stop[-1] == "192.0.2.1"
+    assert not (Path(config_instance.scenario.ephemeral_directory) / ssh_pool.MASTERS_FILE).exists()
+
+
+def test_socket_directory_must_be_private(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """A socket directory other users can access is refused."""
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+    directory = tmp_path / "molecule-ssh"
+    directory.mkdir()
+    directory.chmod(0o755)
+
+    with pytest.raises(MoleculeError):
+        ssh_pool.socket_directory()
+
+    directory.chmod(0o700)
+    assert ssh_pool.socket_directory() == directory
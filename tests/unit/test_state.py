@@ -21,6 +21,7 @@ from __future__ import annotations
 
 import os
 
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 import pytest
@@ -31,6 +32,8 @@ from molecule import config, state, util
 if TYPE_CHECKING:
     from typing import Any
 
+    from pytest_mock import MockerFixture
+
 
 @pytest.fixture
 def _instance(config_instance: config.Config) -> state.State:
@@ -125,3 +128,160 @@ def test_get_data_loads_existing_state_file(  # noqa: D103
     assert s.created
     assert not s.driver
     assert not s.prepared
+
+
+def test_transaction_coalesces_writes(  # noqa: D103
+    _instance: state.State,  # noqa: PT019
+    mocker: MockerFixture,
+) -> None:
+    write = mocker.spy(_instance, "_write_state_file")
+
+    with _instance.transaction():
+        _instance.change_state("driver", "foo")
+        _instance.change_state("created", True)  # noqa: FBT003
+        with _instance.transaction():
+            _instance.change_state("converged", True)  # noqa: FBT003
+        assert write.call_count == 0
+
+    assert write.call_count == 1
+    d = util.safe_load_file(_instance.state_file)
+    assert d["driver"] == "foo"
+    assert d["created"]
+    assert d["converged"]
+
+
+def test_transaction_flushes_on_error(_instance: state.State) -> None:  # noqa: PT019, D103
+    def _fail() -> None:
+        with _instance.transaction():
+            _instance.change_state("created", True)  # noqa: FBT003
+            raise RuntimeError
+
+    with pytest.raises(RuntimeError):
+        _fail()
+
+    d = util.safe_load_file(_instance.state_file)
+    assert d["created"]
+
+
+def test_transaction_without_changes_does_not_write(  # noqa: D103
+    _instance: state.State,  # noqa: PT019
+    mocker: MockerFixture,
+) -> None:
+    write = mocker.spy(_instance, "_write_state_file")
+
+    with _instance.transaction():
+        pass
+
+    write.assert_not_called()
+
+
+def test_init_skips_write_for_unchanged_state_file(  # noqa: D103
+    _instance: state.State,  # noqa: PT019
+    config_instance: config.Config,
+    mocker: MockerFixture,
+) -> None:
+    write = mocker.patch.object(state.State, "_write_state_file")
+
+    state.State(config_instance)
+
+    write.assert_not_called()
+
+
+@pytest.fixture
+def _sqlite_instance(
+    config_instance: config.Config,
+    monkeypatch: pytest.MonkeyPatch,
+) -> state.State:
+    monkeypatch.setenv("MOLECULE_STATE_BACKEND", "sqlite")
+    return state.State(config_instance)
+
+
+def test_sqlite_backend_state_file(_sqlite_instance: state.State) -> None:  # noqa: PT019, D103
+    assert _sqlite_instance.backend == "sqlite"
+    assert _sqlite_instance.state_file.endswith("state.db")
+    assert os.path.isfile(_sqlite_instance.state_file)  # noqa: PTH113
+
+
+def test_sqlite_backend_reads_fresh_state(  # noqa: D103
+    _sqlite_instance: state.State,  # noqa: PT019
+    config_instance: config.Config,
+) -> None:
+    other = state.State(config_instance)
+    other.change_state("converged", True)  # noqa: FBT003
+    other.change_state("driver", "foo")
+
+    assert _sqlite_instance.converged
+    assert _sqlite_instance.driver == "foo"
+
+    _sqlite_instance.reset()
+    assert not other.converged
+    assert other.driver is None
+
+
+def test_sqlite_backend_shared_keys(  # noqa: D103
+    _sqlite_instance: state.State,  # noqa: PT019
+    config_instance: config.Config,
+    mocker: MockerFixture,
+) -> None:
+    mocker.patch.object(
+        config.Config, "shared_state", new_callable=mocker.PropertyMock, return_value=True
+    )
+    _sqlite_instance.change_state("created", True)  # noqa: FBT003
+    _sqlite_instance.change_state("prepared", True)  # noqa: FBT003
+
+    store = state.SQLiteStore(Path(_sqlite_instance.state_file))
+    rows = store.load(["", config_instance.scenario.name])
+    assert rows["", "created"] is True
+    assert rows[config_instance.scenario.name, "prepared"] is True
+    assert (config_instance.scenario.name, "created") not in rows
+
+
+def test_sqlite_backend_transaction(  # noqa: D103
+    _sqlite_instance: state.State,  # noqa: PT019
+    mocker: MockerFixture,
+) -> None:
+    update = mocker.spy(state.SQLiteStore, "update")
+
+    with _sqlite_instance.transaction():
+        _sqlite_instance.change_state("driver", "foo")
+        _sqlite_instance.change_state("created", True)  # noqa: FBT003
+        assert _sqlite_instance.created
+
+    assert update.call_count == 1
+
+
+def test_sqlite_backend_transaction_reads_fresh_state(  # noqa: D103
+    _sqlite_instance: state.State,  # noqa: PT019
+    config_instance: config.Config,
+) -> None:
+    assert _sqlite_instance.driver is None
+    state.State(config_instance).change_state("driver", "foo")
+
+    with _sqlite_instance.transaction():
+        assert _sqlite_instance.driver == "foo"
+
+
+def test_sqlite_store_reuses_connection(  # noqa: D103
+    tmp_path: Path,
+    mocker: MockerFixture,
+) -> None:
+    connect = mocker.spy(state.sqlite3, "connect")
+    store = state.SQLiteStore(tmp_path / "state.db")
+    store.update({("", "driver"): "foo"})
+    assert store.load([""]) == {("", "driver"): "foo"}
+    assert connect.call_count == 1
+
+    # A forked process opens its own connection.
+    mocker.patch.object(state.os, "getpid", return_value=-1)
+    assert store.load([""]) == {("", "driver"): "foo"}
+    assert connect.call_count == 2  # noqa: PLR2004
+    store.close()
+
+
+def test_invalid_backend_raises(  # noqa: D103
+    config_instance: config.Config,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("MOLECULE_STATE_BACKEND", "bogus")
+    with pytest.raises(state.InvalidState):
+        state.State(config_instance)
@@ -0,0 +1,109 @@
+"""Unit tests for watch mode."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+from molecule import watch
+from molecule.exceptions import ScenarioFailureError
+
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+    from molecule import config
+
+
+def test_scan_skips_ignored_files(tmp_path: Path) -> None:
+    """Caches, VCS metadata and editor swap files are not watched."""
+    (tmp_path / "tasks").mkdir()
+    (tmp_path / "tasks" / "main.yml").write_text("---\n")
+    (tmp_path / "tasks" / ".main.yml.swp").write_text("")
+    (tmp_path / ".git").mkdir()
+    (tmp_path / ".git" / "index").write_text("")
+
+    files, directories = watch.scan([tmp_path])
+
+    assert list(files) == [str(tmp_path / "tasks" / "main.yml")]
+    assert sorted(directories) == [str(tmp_path), str(tmp_path / "tasks")]
+
+
+class _NoInotify:
+    def __init__(self) -> None:
+        raise OSError
+
+
+@pytest.mark.parametrize("inotify", (True, False), ids=("inotify", "polling"))
+def test_watcher_reports_changes(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    inotify: bool,  # noqa: FBT001
+) -> None:
+    """A burst of changes is reported once, after it settled."""
+    if not inotify:
+        monkeypatch.setattr(watch, "_Inotify", _NoInotify)
+    (tmp_path / "roles").mkdir()
+    existing = tmp_path / "converge.yml"
+    existing.write_text("---\n")
+    watcher = watch.Watcher([tmp_path], debounce=0.2, poll_interval=0.05)
+
+    def edit() -> None:
+        time.sleep(0.1)
+        existing.write_text("---\n- hosts: all\n")
+        time.sleep(0.05)
+        (tmp_path / "roles" / "new.yml").write_text("---\n")
+
+    thread = threading.Thread(target=edit)
+    thread.start()
+    try:
+        changed = watcher.wait()
+    finally:
+        thread.join()
+        watcher.close()
+
+    assert changed == {str(existing), str(tmp_path / "roles" / "new.yml")}
+
+
+def test_converge_skips_setup_after_success(
+    mocker: MockerFixture,
+    config_instance: config.Config,
+) -> None:
+    """Setup runs once, then later actions reuse its output."""
+    seen = []
+    mocker.patch(
+        "molecule.watch.base.execute_subcommand",
+        side_effect=lambda c, action: seen.append((action, c.skip_setup)),
+    )
+
+    assert watch.converge(config_instance, ["converge", "verify"])
+    assert seen == [("converge", False), ("verify", True)]
+
+
+def test_converge_stops_at_failure(
+    mocker: MockerFixture,
+    config_instance: config.Config,
+) -> None:
+    """A failed action is reported and the remaining ones are skipped."""
+    execute = mocker.patch(
+        "molecule.watch.base.execute_subcommand",
+        side_effect=ScenarioFailureError("converge failed"),
+    )
+
+    assert not watch.converge(config_instance, ["converge", "verify"])
+    execute.assert_called_once_with(config_instance, "converge")
+    assert not config_instance.skip_setup
+
+
+def test_watched_paths(config_instance: config.Config) -> None:
+    """The scenario, the project and the configuration inputs are watched."""
+    paths = watch.watched_paths(config_instance)
+
+    assert Path(config_instance.scenario.directory) in paths
+    assert Path(config_instance.project_directory) in paths
+    assert Path(config_instance.molecule_file).resolve() in {p.resolve() for p in paths}
@@ -119,6 +119,10 @@ def _patch_run_one(
 
     mock_config = MagicMock()
     mock_config.scenario = mock_scenario
+    mock_config.command_args = {}
+    mock_config.shared_state = False
+    mock_config.state.restored = None
+    mock_config.state.leased = None
     if action:
         mock_config.action = action
 
@@ -164,9 +168,10 @@ def test_run_one_returns_results_on_success(
     mock_config_cls.assert_called_once_with(
         molecule_file="/path/to/molecule.yml",
         args=args,
-        command_args={**command_args, "force": True},
+        command_args=command_args,
         ansible_args=(),
     )
+    assert mock_config_cls.return_value.command_args["force"] is True
     mock_execute.assert_called_once()
     assert result.name == "test_scenario"
     assert error is None
@@ -174,6 +179,43 @@ def test_run_one_returns_results_on_success(
     assert failed_step == ""
 
 
+def test_run_one_keeps_restored_instances_prepared(
+    monkeypatch: pytest.MonkeyPatch,
+    mocker: MockerFixture,
+) -> None:
+    """Prepare is not forced for instances restored from a snapshot.
+
+    Args:
+        monkeypatch: Pytest monkeypatch fixture.
+        mocker: Pytest mocker fixture.
+    """
+    _, mock_config_cls, _ = _patch_run_one(monkeypatch, mocker)
+    mock_config_cls.return_value.state.restored = "delegated-0123"
+
+    run_one_scenario("/path/to/molecule.yml", {}, {"subcommand": "test"}, (), "/path/to")
+
+    assert "force" not in mock_config_cls.return_value.command_args
+
+
+def test_run_one_forces_prepare_with_shared_restored_flag(
+    monkeypatch: pytest.MonkeyPatch,
+    mocker: MockerFixture,
+) -> None:
+    """With shared state, a snapshot restored by another scenario does not skip prepare.
+
+    Args:
+        monkeypatch: Pytest monkeypatch fixture.
+        mocker: Pytest mocker fixture.
+    """
+    _, mock_config_cls, _ = _patch_run_one(monkeypatch, mocker)
+    mock_config_cls.return_value.shared_state = True
+    mock_config_cls.return_value.state.restored = "delegated-0123"
+
+    run_one_scenario("/path/to/molecule.yml", {}, {"subcommand": "test"}, (), "/path/to")
+
+    assert mock_config_cls.return_value.command_args["force"] is True
+
+
 def test_run_one_returns_error_on_failure(
     monkeypatch: pytest.MonkeyPatch,
     mocker: MockerFixture,
@@ -0,0 +1,68 @@
+"""Unit tests for the cached discovery of test files."""
+
+from __future__ import annotations
+
+import os
+
+from typing import TYPE_CHECKING
+
+from molecule.verifier import discovery
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    import pytest
+
+    from pytest_mock import MockerFixture
+
+
+def _age(*directories: Path) -> None:
+    """Move the mtimes of directories out of the racy window.
+
+    Args:
+        directories: The directories.
+    """
+    for directory in directories:
+        os.utime(directory, ns=(0, 10**9))
+
+
+def test_find_tests_reuses_cached_tests(
+    mocker: MockerFixture,
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """Tests are found once, as long as no directory of the tree changed."""
+    monkeypatch.setattr(discovery, "_discoveries", {})
+    tests = tmp_path / "tests"
+    (tests / "sub").mkdir(parents=True)
+    (tests / "test_one.py").touch()
+    (tests / "sub" / "test_two.py").touch()
+    (tests / "helper.py").touch()
+    _age(tests, tests / "sub")
+    scan = mocker.spy(discovery, "_scan")
+
+    expected = [str(tests / "sub" / "test_two.py"), str(tests / "test_one.py")]
+    assert sorted(discovery.find_tests(tests, tmp_path / "cache")) == expected
+    assert sorted(discovery.find_tests(tests, tmp_path / "cache")) == expected
+    assert scan.call_count == 1
+
+    # Other processes share the tests cached on disk.
+    monkeypatch.setattr(discovery, "_discoveries", {})
+    assert sorted(discovery.find_tests(tests, tmp_path / "cache")) == expected
+    assert scan.call_count == 1
+
+
+def test_find_tests_notices_changed_directories(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """A test added to any directory of the tree invalidates the cache."""
+    monkeypatch.setattr(discovery, "_discoveries", {})
+    tests = tmp_path / "tests"
+    (tests / "sub").mkdir(parents=True)
+    _age(tests, tests / "sub")
+    assert discovery.find_tests(tests) == []
+
+    (tests / "sub" / "test_new.py").touch()
+    assert discovery.find_tests(tests) == [str(tests / "sub" / "test_new.py")]
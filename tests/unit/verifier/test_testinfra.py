@@ -26,7 +26,7 @@ from subprocess import CompletedProcess
 import pytest
 
 from molecule.config import Config
-from molecule.exceptions import ScenarioFailureError
+from molecule.exceptions import MoleculeError, ScenarioFailureError
 from molecule.util import write_file
 from molecule.verifier import testinfra
 
@@ -338,3 +338,89 @@ def test_testinfra_execute_failed_tests_raise_scenario_failure(  # type: ignore[
     # The failure is recorded so the scenario recap reports verify as failed,
     # not the empty-state default of "successful".
     assert _instance._config.scenario.results.last_action_summary.state == "failed"
+
+
+def test_get_parallel_mode(monkeypatch):  # type: ignore[no-untyped-def]  # noqa: ANN201, D103
+    monkeypatch.delenv("MOLECULE_TESTINFRA_PARALLEL", raising=False)
+    assert testinfra.get_parallel_mode() is None
+
+    monkeypatch.setenv("MOLECULE_TESTINFRA_PARALLEL", "Hosts")
+    assert testinfra.get_parallel_mode() == "hosts"
+
+    monkeypatch.setenv("MOLECULE_TESTINFRA_PARALLEL", "threads")
+    with pytest.raises(MoleculeError):
+        testinfra.get_parallel_mode()
+
+
+def test_testinfra_execute_with_xdist_sizes_workers_from_platforms(  # type: ignore[no-untyped-def]  # noqa: ANN201, D103
+    monkeypatch,
+    mocker,
+    patched_run_command,
+    _patched_testinfra_get_tests,  # noqa: PT019
+    _instance,  # noqa: PT019
+):
+    monkeypatch.setenv("MOLECULE_TESTINFRA_PARALLEL", "xdist")
+    mocker.patch("molecule.verifier.testinfra.os.cpu_count", return_value=8)
+    mocker.patch("importlib.util.find_spec", return_value=mocker.Mock())
+    _instance.execute()
+
+    cmd = patched_run_command.call_args.args[0]
+    assert cmd[:3] == ["pytest", "-n", str(len(_instance.hosts()))]
+
+
+def test_testinfra_execute_without_xdist_runs_serially(  # type: ignore[no-untyped-def]  # noqa: ANN201, D103
+    monkeypatch,
+    mocker,
+    caplog,
+    patched_run_command,
+    _patched_testinfra_get_tests,  # noqa: PT019
+    _instance,  # noqa: PT019
+):
+    monkeypatch.setenv("MOLECULE_TESTINFRA_PARALLEL", "xdist")
+    mocker.patch("importlib.util.find_spec", return_value=None)
+    _instance.execute()
+
+    cmd = patched_run_command.call_args.args[0]
+    assert "-n" not in cmd
+    assert "pytest-xdist is not installed" in caplog.text
+
+
+def test_testinfra_execute_sharded_by_host_reports_every_failure(  # type: ignore[no-untyped-def]  # noqa: ANN201, D103
+    monkeypatch,
+    mocker,
+    patched_run_command,
+    _patched_testinfra_get_tests,  # noqa: PT019
+    _instance,  # noqa: PT019
+):
+    monkeypatch.setenv("MOLECULE_TESTINFRA_PARALLEL", "hosts")
+    hosts = _instance.hosts()
+    assert len(hosts) > 1
+    run = mocker.patch.object(
+        _instance._config.runtime,
+        "run",
+        side_effect=lambda args, **_: CompletedProcess(args, 1 if "--hosts" in args else 0, "", ""),
+    )
+
+    with pytest.raises(ScenarioFailureError) as e:
+        _instance.execute()
+
+    assert not patched_run_command.called
+    assert sorted(call.kwargs["args"][2] for call in run.call_args_list) == sorted(hosts)
+    assert e.value.message == f"Verifier tests failed on {', '.join(hosts)}"
+    assert _instance._config.scenario.results.actions[-1].states[-1].state == "failed"
+
+
+def test_testinfra_execute_in_worker(  # type: ignore[no-untyped-def]  # noqa: ANN201, D103
+    mocker,
+    monkeypatch,
+    patched_run_command,
+    _patched_testinfra_get_tests,  # noqa: PT019
+    _instance,  # noqa: PT019
+):
+    monkeypatch.setenv("MOLECULE_TESTINFRA_WORKER", "1")
+    run = mocker.patch("molecule.verifier.testinfra_worker.run", return_value=0)
+
+    _instance.execute()
+
+    assert run.call_args.args[1] == _instance._testinfra_command[1:]
+    patched_run_command.assert_not_called()
@@ -0,0 +1,108 @@
+"""Unit tests for the persistent testinfra worker."""
+
+from __future__ import annotations
+
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+from molecule.command.base import setup
+from molecule.verifier import testinfra_worker
+
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+    from molecule import config
+
+
+def test_worker_key_follows_inventory(tmp_path: Path) -> None:
+    """Workers are replaced once the inventory changes."""
+    inventory = tmp_path / "inventory"
+    inventory.mkdir()
+    hosts = inventory / "ansible_inventory.yml"
+    hosts.write_text("all: {}\n")
+    key = testinfra_worker.worker_key({"FOO": "bar"}, "/scenario", inventory, "run")
+
+    assert key == testinfra_worker.worker_key({"FOO": "bar"}, "/scenario", inventory, "run")
+    assert key != testinfra_worker.worker_key({"FOO": "baz"}, "/scenario", inventory, "run")
+    # Rewriting the same inventory keeps the worker.
+    os.utime(hosts, ns=(0, 0))
+    assert key == testinfra_worker.worker_key({"FOO": "bar"}, "/scenario", inventory, "run")
+    # Instances recreated with the same inventory get a new worker.
+    assert key != testinfra_worker.worker_key({"FOO": "bar"}, "/scenario", inventory, "new")
+    hosts.write_text("all: {hosts: {instance: {}}}\n")
+    assert key != testinfra_worker.worker_key({"FOO": "bar"}, "/scenario", inventory, "run")
+
+
+@pytest.mark.skipif(not hasattr(testinfra_worker.socket, "send_fds"), reason="requires send_fds")
+def test_run_reuses_worker(
+    mocker: MockerFixture,
+    monkeypatch: pytest.MonkeyPatch,
+    config_instance: config.Config,
+) -> None:
+    """Two verifies of a scenario, each writing the inventory, share a worker."""
+    runtime_dir = tempfile.mkdtemp(prefix="molecule-test-")
+    monkeypatch.setenv("XDG_RUNTIME_DIR", runtime_dir)
+    test_file = Path(config_instance.scenario.directory) / "test_default.py"
+    test_file.write_text("def test_default():\n    assert True\n")
+    start = mocker.spy(testinfra_worker, "_start")
+    args = [str(test_file), "-q", "-p", "no:cacheprovider"]
+    path = testinfra_worker.socket_path(config_instance)
+
+    try:
+        for _verify in range(2):
+            setup(config_instance)
+            assert testinfra_worker.run(config_instance, args, {}) == 0
+    finally:
+        testinfra_worker.request(path, {"key": "stop", "args": []})
+        shutil.rmtree(runtime_dir, ignore_errors=True)
+
+    assert start.call_count == 1
+
+
+@pytest.mark.skipif(not hasattr(testinfra_worker.socket, "send_fds"), reason="requires send_fds")
+def test_worker_serves_sessions(mocker: MockerFixture, tmp_path: Path) -> None:
+    """Sessions run in the worker until a caller with another key comes."""
+    main = mocker.patch("pytest.main", return_value=1)
+    path = tmp_path / "worker.sock"
+    worker = testinfra_worker.Worker(path, "key")
+    thread = threading.Thread(target=worker.serve_forever, daemon=True)
+    thread.start()
+    deadline = time.monotonic() + 10
+    while not path.exists() and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    reply = testinfra_worker.request(path, {"key": "key", "args": ["--hosts", "instance"]})
+    assert reply == {"returncode": 1}
+    main.assert_called_once_with(["--hosts", "instance"])
+
+    assert testinfra_worker.request(path, {"key": "other", "args": []}) == {"restart": True}
+    thread.join(10)
+    assert not path.exists()
+
+
+def test_evict_changed_modules(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """User modules are imported again once any of them changed."""
+    (tmp_path / "helper_module.py").write_text("VALUE = 1\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, "helper_module", raising=False)
+    worker = testinfra_worker.Worker(tmp_path / "worker.sock", "key")
+
+    import helper_module  # noqa: PLC0415
+
+    worker.track(["helper_module"])
+    worker.evict_changed_modules()
+    assert sys.modules["helper_module"] is helper_module
+
+    os.utime(tmp_path / "helper_module.py", ns=(0, 0))
+    worker.evict_changed_modules()
+    assert "helper_module" not in sys.modules